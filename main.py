@@ -90,8 +90,7 @@ def main():
     # Check UI responsiveness after a short delay
     QTimer.singleShot(100, window._check_ui_responsiveness)
     
-    # Fire ui_ready signal after window is shown
-    QTimer.singleShot(300, window._emit_ui_ready)
+    # The window emits ui_ready itself once its deferred startup phase has run
     
     # Auto-load template at startup if provided, but only after UI becomes ready
     if args.load_template:
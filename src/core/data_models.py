@@ -66,6 +66,9 @@ class PromptState:
     # Tag data for each field (preserves tag structure and metadata)
     field_tags: Dict[str, List[Any]] = field(default_factory=dict)
     
+    # Already serialized tags for some fields, reused by to_dict (not persisted)
+    field_tag_dicts: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict, repr=False, compare=False)
+    
     # Metadata
     seed: int = 0
     filters: List[str] = field(default_factory=list)
@@ -136,6 +139,9 @@ class PromptState:
         """Serialize tag objects to dictionaries."""
         serialized = {}
         for field_name, tags in self.field_tags.items():
+            if field_name in self.field_tag_dicts:
+                serialized[field_name] = list(self.field_tag_dicts[field_name])
+                continue
             serialized[field_name] = []
             for tag in tags:
                 if hasattr(tag, 'to_dict'):
@@ -160,6 +166,10 @@ class PromptState:
             
             deserialized = {}
             for field_name, tag_data_list in data.items():
+                # Common case: every entry is a serialized Tag, so build them in one pass
+                if all(isinstance(tag_data, dict) and 'type' in tag_data for tag_data in tag_data_list):
+                    deserialized[field_name] = Tag.from_dicts(tag_data_list)
+                    continue
                 deserialized[field_name] = []
                 for i, tag_data in enumerate(tag_data_list):
                     try:
@@ -201,6 +211,8 @@ class PromptState:
     def set_field_tags(self, field_name: str, tags: List[Any]):
         """Set the tags for a field."""
         self.field_tags[field_name] = tags
+        # Any pre-serialized copy now describes the old tags
+        self.field_tag_dicts.pop(field_name, None)
         self.update_timestamp()
     
     def is_empty(self) -> bool:
@@ -67,7 +67,7 @@ class OllamaProvider(LLMProvider):
     def is_available(self) -> bool:
         """Check if Ollama is available and the specified model is loaded."""
         import time
-        check_start = time.time()
+        check_start = time.perf_counter()
         
         try:
             debug(f"Checking availability from {self.base_url}/api/tags", LogArea.OLLAMA)
@@ -83,31 +83,31 @@ class OllamaProvider(LLMProvider):
                 # If no specific model is required, just check if Ollama is running
                 if self.model_name is None:
                     debug("No model specified, checking if Ollama is running", LogArea.OLLAMA)
-                    check_time = time.time() - check_start
+                    check_time = time.perf_counter() - check_start
                     info(f"STARTUP: Ollama availability check took {check_time:.3f}s", LogArea.GENERAL)
                     return True
                 
                 # Check if the specific model is available
                 model_found = any(model.get('name') == self.model_name for model in models)
                 debug(f"Model '{self.model_name}' found: {model_found}", LogArea.OLLAMA)
-                check_time = time.time() - check_start
+                check_time = time.perf_counter() - check_start
                 info(f"STARTUP: Ollama availability check took {check_time:.3f}s", LogArea.GENERAL)
                 return model_found
             else:
                 debug(f"Availability check failed - status {response.status_code}: {response.text}", LogArea.OLLAMA)
-                check_time = time.time() - check_start
+                check_time = time.perf_counter() - check_start
                 info(f"STARTUP: Ollama availability check (failed) took {check_time:.3f}s", LogArea.GENERAL)
                 return False
         except Exception as e:
             debug(f"Exception in availability check: {str(e)}", LogArea.OLLAMA)
-            check_time = time.time() - check_start
+            check_time = time.perf_counter() - check_start
             info(f"STARTUP: Ollama availability check (exception) took {check_time:.3f}s", LogArea.GENERAL)
             return False
     
     def get_available_models(self) -> List[str]:
         """Get list of available models from Ollama."""
         import time
-        models_start = time.time()
+        models_start = time.perf_counter()
         
         try:
             debug(f"Getting available models from {self.base_url}/api/tags", LogArea.OLLAMA)
@@ -126,17 +126,17 @@ class OllamaProvider(LLMProvider):
                 debug(f"Number of models extracted: {len(model_names)}", LogArea.OLLAMA)
                 debug(f"About to return model names: {model_names}", LogArea.OLLAMA)
                 
-                models_time = time.time() - models_start
+                models_time = time.perf_counter() - models_start
                 info(f"STARTUP: Ollama get_available_models took {models_time:.3f}s", LogArea.GENERAL)
                 return model_names
             else:
                 debug(f"Failed to get models - status {response.status_code}: {response.text}", LogArea.OLLAMA)
-                models_time = time.time() - models_start
+                models_time = time.perf_counter() - models_start
                 info(f"STARTUP: Ollama get_available_models (failed) took {models_time:.3f}s", LogArea.GENERAL)
                 return []
         except Exception as e:
             debug(f"Exception getting available models: {str(e)}", LogArea.OLLAMA)
-            models_time = time.time() - models_start
+            models_time = time.perf_counter() - models_start
             info(f"STARTUP: Ollama get_available_models (exception) took {models_time:.3f}s", LogArea.GENERAL)
             return []
 
@@ -301,11 +301,11 @@ class OllamaProvider(LLMProvider):
         
         try:
             debug("PROMPT: Making POST request to Ollama API...", LogArea.PROMPT)
-            api_start_time = time.time()
+            api_start_time = time.perf_counter()
             
             response = self.session.post(f"{self.base_url}/api/chat", json=payload, timeout=30)
             
-            api_time = time.time() - api_start_time
+            api_time = time.perf_counter() - api_start_time
             debug(f"PROMPT: Ollama API call completed in {api_time:.2f} seconds", LogArea.PROMPT)
             
             debug(f"PROMPT: Received response - status: {response.status_code}", LogArea.PROMPT)
@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal, QEvent, QTimer
 from PySide6.QtGui import QFont, QPainter, QPen, QBrush, QColor, QFontMetrics
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Dict, Any
 from .tag_widgets_qt import Tag, TagType
 import sys
 from ..utils.logger import get_logger, debug, LogArea
@@ -192,6 +192,7 @@ class InlineTagInputWidget(QWidget):
         super().__init__(parent)
         self.placeholder = placeholder
         self.tags: List[Tag] = []
+        self._tag_dicts = None  # Serialized tags, rebuilt after the tags change
         self.current_text = ""
         self.editing_tag = None  # Tag being edited
         
@@ -373,6 +374,9 @@ class InlineTagInputWidget(QWidget):
     
     def _refresh_layout(self):
         """Refresh the layout with current tags and text input."""
+        # Every tag list change comes through here
+        self._tag_dicts = None
+        
         # Store text input to prevent deletion
         text_input_was_in_layout = self.text_input.parent() is not None
         if text_input_was_in_layout:
@@ -411,6 +415,12 @@ class InlineTagInputWidget(QWidget):
         """Get all current tags."""
         return self.tags.copy()
     
+    def get_tag_dicts(self) -> List[Dict[str, Any]]:
+        """Get the tags serialized with Tag.to_dict, cached until the tags change."""
+        if self._tag_dicts is None:
+            self._tag_dicts = [tag.to_dict() for tag in self.tags]
+        return self._tag_dicts
+    
     def set_tags(self, tags: List[Tag]):
         """Set tags (for loading from templates)."""
         self.tags = tags.copy()
@@ -535,6 +545,7 @@ class InlineTagInputWidget(QWidget):
                 
                 # If the missing state changed, update the tag widget
                 if old_missing_state != tag.is_missing:
+                    self._tag_dicts = None
                     # Find and update the corresponding tag widget
                     for i in range(self.content_layout.count()):
                         item = self.content_layout.itemAt(i)
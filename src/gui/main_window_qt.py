@@ -7,31 +7,605 @@ from pathlib import Path
 from datetime import datetime
 import json
 import os
+import re
 from enum import Enum
+from collections import OrderedDict, deque
 from typing import List, Dict, Optional
-import subprocess
-import threading
 import time
+import random
+import concurrent.futures
+from contextlib import ExitStack
+from dataclasses import replace
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QFrame, QMenuBar, QMenu, QMessageBox, QFileDialog,
+    QLabel, QFrame, QMenuBar, QMessageBox, QFileDialog,
     QScrollArea, QSizePolicy, QPushButton, QProgressBar, QStatusBar,
     QLineEdit, QComboBox, QCheckBox, QSpinBox
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QEvent
-from PySide6.QtGui import QAction, QFont
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QEvent, QSignalBlocker, QStringListModel, QProcess,
+    QObject, QRunnable, QThreadPool, QMutex, QMutexLocker, QThread, Slot, QUrl
+)
+from PySide6.QtGui import QAction, QActionGroup, QFont, QDesktopServices
+from PySide6.QtNetwork import QTcpSocket
 
 from .tag_field_widgets_qt import TagTextFieldWidget, TagTextAreaWidget, SeedFieldWidget
-from .tag_widgets_qt import TagType
+from .tag_widgets_qt import Tag, TagType
 from .snippet_widgets_qt import ContentRatingWidget, LLMSelectionWidget
 from .preview_panel_qt import PreviewPanel
 from ..core.data_models import PromptData, PromptState
 from ..utils.theme_manager import theme_manager
 from ..utils.logger import get_logger
 from ..utils.history_manager import HistoryManager
+from ..utils.snippet_manager import snippet_manager
 from ..utils.logger import debug, info, warning, error, LogArea
 
+# Try to import orjson for faster template and cache parsing, fallback to the stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import psutil for in-process Ollama process lookup, fallback to tasklist/taskkill
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def _read_json_file(path):
+    """Read and parse a JSON file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dump_json_bytes(data):
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _dump_json_str(data):
+    """Serialize data to a compact single-line JSON string, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _write_file_atomic(path, payload):
+    """Write bytes to a temporary file next to path and swap it in with os.replace."""
+    tmp_path = str(path) + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _file_stamp(path):
+    """Return (mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _JsonSaveSignals(QObject):
+    """Signals for _JsonSaveTask (a QRunnable cannot emit signals itself)."""
+    failed = Signal(str, str)  # path, error message
+    saved = Signal(str, object)  # path, file stamp after the write
+
+
+class _JsonSaveTask(QRunnable):
+    """Write pre-serialized JSON bytes to disk on a pool thread.
+
+    The file is written to a temporary path and swapped in with os.replace. Writes are
+    serialized, and a task is skipped when a newer snapshot for the same path has been
+    submitted since, so an old snapshot can never overwrite a newer one.
+    """
+    _write_mutex = QMutex()
+    _seq_mutex = QMutex()
+    _latest_seq = {}
+    _next_seq = 0
+
+    def __init__(self, path, payload):
+        super().__init__()
+        self.path = str(path)
+        self.payload = payload
+        self.signals = _JsonSaveSignals()
+        with QMutexLocker(_JsonSaveTask._seq_mutex):
+            _JsonSaveTask._next_seq += 1
+            self.seq = _JsonSaveTask._next_seq
+            _JsonSaveTask._latest_seq[self.path] = self.seq
+
+    def _is_stale(self):
+        with QMutexLocker(_JsonSaveTask._seq_mutex):
+            return _JsonSaveTask._latest_seq.get(self.path) != self.seq
+
+    @classmethod
+    def discard(cls, path):
+        """Delete path, cancelling every write to it that is queued or in progress.
+
+        Waits for a write already running to finish, then marks all submitted tasks for
+        path stale so none of them can bring the file back afterwards.
+        """
+        path = str(path)
+        with QMutexLocker(cls._write_mutex):
+            with QMutexLocker(cls._seq_mutex):
+                cls._next_seq += 1
+                cls._latest_seq[path] = cls._next_seq
+            if os.path.exists(path):
+                os.remove(path)
+
+    def run(self):
+        with QMutexLocker(_JsonSaveTask._write_mutex):
+            if self._is_stale():
+                return
+            try:
+                _write_file_atomic(self.path, self.payload)
+            except Exception as e:
+                self.signals.failed.emit(self.path, str(e))
+                return
+            self.signals.saved.emit(self.path, _file_stamp(self.path))
+
+
+class _OllamaProbeSignals(QObject):
+    """Signals for _OllamaProbeTask."""
+    running_checked = Signal(bool)  # whether an Ollama process was found
+
+
+class _OllamaProbeTask(QRunnable):
+    """Inspect Ollama processes on a pool thread so tasklist/wmic never block the GUI.
+
+    Logs the process listing and, when check_running is set, reports whether Ollama
+    is running through signals.running_checked. Listings are serialized so concurrent
+    probes don't interleave their log lines.
+    """
+    _listing_mutex = QMutex()
+
+    def __init__(self, log_listing: bool = True, check_running: bool = False):
+        super().__init__()
+        self.log_listing = log_listing
+        self.check_running = check_running
+        self.signals = _OllamaProbeSignals()
+
+    def run(self):
+        if self.log_listing:
+            with QMutexLocker(_OllamaProbeTask._listing_mutex):
+                _log_ollama_process_listing()
+        if self.check_running:
+            try:
+                running = _probe_ollama_running()
+            except Exception as e:
+                error(f"DEBUG OLLAMA: Error checking if Ollama is running: {e}", LogArea.GENERAL)
+                running = False
+            self.signals.running_checked.emit(running)
+
+
+class _OllamaKillSignals(QObject):
+    """Signals for _OllamaKillTask."""
+    finished = Signal(int, object)  # exit code, QProcess.ExitStatus (as QProcess.finished)
+
+
+class _OllamaKillTask(QRunnable):
+    """Kill Ollama with psutil on a pool thread, since waiting for the processes can take seconds."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _OllamaKillSignals()
+
+    def run(self):
+        try:
+            exit_code = _kill_ollama_processes()
+        except Exception as e:
+            error(f"Failed to kill Ollama: {e}", LogArea.OLLAMA)
+            exit_code = 1
+        self.signals.finished.emit(exit_code, QProcess.ExitStatus.NormalExit)
+
+
+class _BatchWorker(QObject):
+    """Run a prepared batch of prompt generations off the GUI thread.
+
+    Prompts are still sent concurrently through a thread pool. Each result is reported
+    with result_ready so the GUI thread can store it; batch_finished fires once every
+    prompt has been handled.
+    """
+    result_ready = Signal(int, object, int, object)  # index, final prompt, seed, error
+    batch_finished = Signal()
+
+    def __init__(self, engine, model, content_rating, llm_model, iterations, max_workers, debug_enabled):
+        super().__init__()
+        self.engine = engine
+        self.model = model
+        self.content_rating = content_rating
+        self.llm_model = llm_model
+        self.iterations = iterations
+        self.max_workers = max_workers
+        self.debug_enabled = debug_enabled
+        self._cancelled = False
+
+    def cancel(self):
+        """Skip the prompts that have not been sent yet."""
+        self._cancelled = True
+
+    def _generate_one(self, iteration):
+        """Generate a single prompt; runs on a pool thread."""
+        i, current_seed, prompt_data = iteration
+        if self._cancelled:
+            return i, None, current_seed, "Cancelled"
+        
+        if self.debug_enabled:
+            debug(f"Concurrent iteration {i+1} - calling prompt engine.generate_prompt() with model: {self.llm_model}", LogArea.BATCH)
+        try:
+            # Generate prompt using the engine - pass the LLM model explicitly
+            final_prompt = self.engine.generate_prompt(self.model, prompt_data, self.content_rating,
+                                                       self.debug_enabled, self.llm_model)
+            if self.debug_enabled:
+                debug(f"Concurrent iteration {i+1} - received final prompt (length: {len(final_prompt)})", LogArea.BATCH)
+            return i, final_prompt, current_seed, None
+        except Exception as e:
+            if self.debug_enabled:
+                debug(f"Concurrent iteration {i+1} - error: {str(e)}", LogArea.BATCH)
+            return i, None, current_seed, str(e)
+
+    @Slot()
+    def run(self):
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                future_to_iteration = {executor.submit(self._generate_one, iteration): iteration
+                                       for iteration in self.iterations}
+                for future in concurrent.futures.as_completed(future_to_iteration):
+                    try:
+                        self.result_ready.emit(*future.result())
+                    except Exception as e:
+                        i, current_seed, _ = future_to_iteration[future]
+                        self.result_ready.emit(i, None, current_seed, str(e))
+        finally:
+            self.batch_finished.emit()
+
+
+# Main window stylesheet; placeholders are filled from the current theme colors
+_QSS_TEMPLATE = """
+    QMainWindow {{
+        background-color: {bg};
+        color: {text_fg};
+    }}
+    QWidget {{
+        background-color: {bg};
+        color: {text_fg};
+    }}
+    QGroupBox {{
+        font-weight: bold;
+        border: 2px solid {tag_border};
+        border-radius: 5px;
+        margin-top: 1ex;
+        padding-top: 10px;
+        background-color: {text_bg};
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        background-color: {text_bg};
+    }}
+    QScrollArea {{
+        border: 1px solid {tag_border};
+        background-color: {text_bg};
+    }}
+    
+    /* Modern Scrollbars */
+    QScrollBar:vertical {{
+        background-color: {scrollbar_bg};
+        width: 12px;
+        border-radius: 6px;
+        border: none;
+        margin: 0px;
+    }}
+    QScrollBar::handle:vertical {{
+        background-color: {scrollbar_handle};
+        border-radius: 6px;
+        min-height: 20px;
+        margin: 2px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background-color: {button_bg};
+    }}
+    QScrollBar::handle:vertical:pressed {{
+        background-color: {button_bg};
+    }}
+    QScrollBar::add-line:vertical,
+    QScrollBar::sub-line:vertical {{
+        height: 0px;
+        width: 0px;
+    }}
+    QScrollBar::add-page:vertical,
+    QScrollBar::sub-page:vertical {{
+        background: none;
+    }}
+    
+    QScrollBar:horizontal {{
+        background-color: {scrollbar_bg};
+        height: 12px;
+        border-radius: 6px;
+        border: none;
+        margin: 0px;
+    }}
+    QScrollBar::handle:horizontal {{
+        background-color: {scrollbar_handle};
+        border-radius: 6px;
+        min-width: 20px;
+        margin: 2px;
+    }}
+    QScrollBar::handle:horizontal:hover {{
+        background-color: {button_bg};
+    }}
+    QScrollBar::handle:horizontal:pressed {{
+        background-color: {button_bg};
+    }}
+    QScrollBar::add-line:horizontal,
+    QScrollBar::sub-line:horizontal {{
+        height: 0px;
+        width: 0px;
+    }}
+    QScrollBar::add-page:horizontal,
+    QScrollBar::sub-page:horizontal {{
+        background: none;
+    }}
+    
+    /* Menu styling */
+    QMenuBar {{
+        background-color: {menu_bg};
+        color: {menu_fg};
+    }}
+    QMenuBar::item {{
+        background-color: transparent;
+        padding: 4px 8px;
+    }}
+    QMenuBar::item:selected {{
+        background-color: {menu_selection_bg};
+        color: {menu_selection_fg};
+    }}
+    QMenu {{
+        background-color: {menu_bg};
+        color: {menu_fg};
+        border: 1px solid {tag_border};
+    }}
+    QMenu::item {{
+        padding: 4px 8px;
+    }}
+    QMenu::item:selected {{
+        background-color: {menu_selection_bg};
+        color: {menu_selection_fg};
+    }}
+    
+    /* Status bar styling */
+    QStatusBar {{
+        background-color: {status_bg};
+        color: {status_fg};
+    }}
+"""
+
+# Stylesheet for regular push buttons; buttons opt in with the themedButton property
+_BUTTON_QSS_TEMPLATE = """
+    QPushButton[themedButton="true"] {{
+        background-color: {button_bg};
+        color: {button_fg};
+        border: 2px solid {button_bg};
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+        min-height: 20px;
+    }}
+    QPushButton[themedButton="true"]:hover {{
+        background-color: {button_bg};
+        border-color: {button_bg};
+        opacity: 0.8;
+    }}
+    QPushButton[themedButton="true"]:pressed {{
+        background-color: {button_bg};
+        border-color: {button_bg};
+        opacity: 0.6;
+    }}
+    QPushButton[themedButton="true"]:disabled {{
+        background-color: {placeholder_fg};
+        border-color: {placeholder_fg};
+        color: {text_bg};
+    }}
+"""
+
+# UI field names whose snippet data is stored under a different JSON field name
+_FIELD_MAPPINGS = {
+    "pose": "subjects_pose_and_action",
+    "grading": "color_grading_&_mood",
+    "datetime": "date_time",
+    "framing": "camera_framing_and_action",
+    "details": "additional_details"
+}
+
+# Number of recent generation durations kept per model for time estimates
+_GENERATION_HISTORY_SIZE = 10
+
+# Most model combinations kept in the generation time cache (least recently used are evicted)
+_GENERATION_CACHE_MAX_ENTRIES = 128
+
+# Event types watched by MainWindow.eventFilter, bound once instead of looked up per event
+_EVT_PAINT = QEvent.Paint
+_EVT_UPDATE_REQUEST = QEvent.UpdateRequest
+
+# Windows CreateProcess flags used to launch Ollama without a console window
+_CREATE_NEW_CONSOLE = 0x00000010
+_CREATE_NO_WINDOW = 0x08000000
+
+# Concurrent Ollama requests during batch generation. Ollama only serves
+# OLLAMA_NUM_PARALLEL requests per model at once, so follow that setting when present.
+_DEFAULT_BATCH_WORKERS = 3
+
+# How long (seconds) an "is Ollama running" process-list check is reused
+_OLLAMA_RUNNING_TTL = 1.5
+
+# How long (ms) closing the window waits for a running batch's in-flight requests
+_BATCH_CLOSE_WAIT_MS = 2000
+
+# Batch threads still finishing in-flight requests after their window closed; kept
+# referenced so they are not destroyed while running
+_detached_batch_threads = []
+
+# One "Field: value" line of preview text. Whitespace around the name and value is
+# trimmed without crossing line breaks, so an empty value never swallows the next line.
+_FIELD_RE = re.compile(r'^[^\S\n]*([^:\n]*?)[^\S\n]*:[^\S\n]*(.*?)[^\S\n]*$', re.M)
+
+# Preview display name -> (widget name, snippet field name), used when loading preview text into fields
+_FIELD_MAPPING = {
+    'Style': ('style', 'style'),
+    'Setting': ('setting', 'setting'),
+    'Weather': ('weather', 'weather'),
+    'Date/Time': ('datetime', 'datetime'),
+    'Subjects': ('subjects', 'subjects'),
+    'Pose/Action': ('pose', 'subjects_pose_and_action'),  # Widget: pose, Snippet field: subjects_pose_and_action
+    'Camera': ('camera', 'camera'),
+    'Camera Framing and Action': ('framing', 'camera_framing_and_action'),  # Widget: framing, Snippet field: camera_framing_and_action
+    'Color Grading & Mood': ('grading', 'color_grading_&_mood'),  # Widget: grading, Snippet field: color_grading_&_mood
+    'Details': ('details', 'details')
+}
+# The same mapping flattened to (display name, widget name, snippet field name) for iteration
+_FIELD_MAPPING_ITEMS = tuple((display_name, widget_name, snippet_field_name)
+                             for display_name, (widget_name, snippet_field_name) in _FIELD_MAPPING.items())
+
+# Where a freshly started Ollama server is polled for readiness
+_OLLAMA_HOST = "127.0.0.1"
+_OLLAMA_PORT = 11434
+_OLLAMA_READY_POLL_MS = 200
+_OLLAMA_READY_TIMEOUT = 30.0  # seconds
+
+# Process names of the Ollama server (Windows, other platforms)
+_OLLAMA_PROCESS_NAMES = frozenset(("ollama.exe", "ollama"))
+
+
+def _ollama_processes():
+    """Return the running Ollama processes (requires psutil)."""
+    processes = []
+    for process in psutil.process_iter(['name']):
+        name = process.info['name']
+        if name and name.lower() in _OLLAMA_PROCESS_NAMES:
+            processes.append(process)
+    return processes
+
+
+def _kill_ollama_processes():
+    """Force-kill Ollama with psutil (same effect as taskkill /F) and return an exit code.
+
+    Waits up to 3 seconds for the processes to go away; 1 means some are still running.
+    """
+    processes = _ollama_processes()
+    for process in processes:
+        try:
+            process.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            warning(f"Could not kill Ollama process {process.pid}: {e}", LogArea.OLLAMA)
+    _, alive = psutil.wait_procs(processes, timeout=3)
+    if alive:
+        warning(f"{len(alive)} Ollama process(es) still running after kill", LogArea.OLLAMA)
+    return 1 if alive else 0
+
+
+def _run_command(program: str, args: List[str], timeout_ms: int = 5000):
+    """Run a short-lived command to completion and return (exit_code, stdout, stderr)."""
+    process = QProcess()
+    process.start(program, args)
+    if not process.waitForFinished(timeout_ms):
+        error_string = process.errorString()
+        process.kill()
+        process.waitForFinished(1000)
+        return -1, "", error_string
+    stdout = bytes(process.readAllStandardOutput().data()).decode(errors="replace")
+    stderr = bytes(process.readAllStandardError().data()).decode(errors="replace")
+    return process.exitCode(), stdout, stderr
+
+
+def _probe_ollama_running():
+    """Check the process list for a running Ollama server (blocking)."""
+    if PSUTIL_AVAILABLE:
+        return bool(_ollama_processes())
+    _, stdout, _ = _run_command("tasklist", ["/FI", "IMAGENAME eq ollama.exe"])
+    return "ollama.exe" in stdout
+
+
+def _log_ollama_process_listing():
+    """Log every ollama.exe process and its parent (blocking; runs tasklist and wmic)."""
+    # Check all ollama.exe processes
+    try:
+        returncode, stdout, stderr = _run_command(
+            "tasklist", ["/FI", "IMAGENAME eq ollama.exe", "/FO", "CSV"]
+        )
+        if returncode == 0:
+            lines = stdout.strip().split('\n')
+            if len(lines) > 1:  # Skip header
+                info(f"Found {len(lines)-1} ollama.exe processes:", LogArea.OLLAMA)
+                for line in lines[1:]:  # Skip header
+                    if line.strip():
+                        info(f"  {line.strip()}", LogArea.OLLAMA)
+            else:
+                info("No ollama.exe processes found via tasklist", LogArea.OLLAMA)
+        else:
+            info(f"tasklist failed: {stderr}", LogArea.OLLAMA)
+    except Exception as e:
+        info(f"Error checking tasklist: {e}", LogArea.OLLAMA)
+    
+    # Check parent-child relationships using wmic
+    try:
+        returncode, stdout, stderr = _run_command(
+            "wmic", ["process", "where", 'name="ollama.exe"', "get",
+                     "ProcessId,ParentProcessId,CommandLine", "/format:csv"]
+        )
+        if returncode == 0:
+            lines = stdout.strip().split('\n')
+            if len(lines) > 1:  # Skip header
+                info("Ollama process hierarchy:", LogArea.OLLAMA)
+                for line in lines[1:]:  # Skip header
+                    if line.strip() and 'ollama.exe' in line:
+                        parts = line.split(',')
+                        if len(parts) >= 3:
+                            pid = parts[1].strip()
+                            parent_pid = parts[2].strip()
+                            cmdline = parts[3].strip() if len(parts) > 3 else "N/A"
+                            info(f"  PID: {pid}, Parent: {parent_pid}, Cmd: {cmdline}", LogArea.OLLAMA)
+            else:
+                info("No ollama.exe processes found via wmic", LogArea.OLLAMA)
+        else:
+            info(f"wmic failed: {stderr}", LogArea.OLLAMA)
+    except Exception as e:
+        info(f"Error checking wmic: {e}", LogArea.OLLAMA)
+    
+    info("=== End Ollama Process Information ===", LogArea.OLLAMA)
+
+
+def _batch_seeds(seed_mode, base_seed, batch_size):
+    """Return the seed for every prompt in a batch according to the seed mode."""
+    if seed_mode == "fixed":
+        return [base_seed] * batch_size
+    if seed_mode == "decrement":
+        return [max(0, base_seed - i) for i in range(batch_size)]  # Clamp to 0 minimum
+    if seed_mode == "randomize":
+        # base_seed + i seeds each draw so batches stay reproducible
+        return [random.Random(base_seed + i).randint(0, 999999) for i in range(batch_size)]
+    # "increment" and any unknown mode
+    return [base_seed + i for i in range(batch_size)]
+
+
+def _batch_worker_limit():
+    """Return how many batch prompts may be in flight at once."""
+    try:
+        workers = int(os.environ.get("OLLAMA_NUM_PARALLEL", _DEFAULT_BATCH_WORKERS))
+    except ValueError:
+        return _DEFAULT_BATCH_WORKERS
+    # 0 (or unset) lets Ollama pick its own limit; keep the default then
+    return workers if workers > 0 else _DEFAULT_BATCH_WORKERS
+
 
 class NavigationState(Enum):
     CURRENT = "current"
@@ -47,17 +621,40 @@ class MainWindow(QMainWindow):
     # Emitted when UI is ready after initial show
     ui_ready = Signal()
     
+    # Tag fields in display order; each is backed by a '<name>_widget' attribute
+    _TAG_FIELDS = (
+        "style", "setting", "weather", "datetime", "subjects", "pose",
+        "camera", "framing", "grading", "details", "llm_instructions"
+    )
+    
     def __init__(self, debug_enabled: bool = False):
         super().__init__()
         
         # Track total startup time until UI responsiveness
-        self._startup_start_time = time.time()
+        self._startup_start_time = time.perf_counter()
         
-        # Track Ollama process to prevent multiple instances
-        self._ollama_process = None
-        self._ollama_process_lock = threading.Lock()
+        # Per-(field, filters) lookup of snippet/category names used by _find_matching_snippet,
+        # built lazily and tied to the snippet collection it was built from
+        self._snippet_index_cache: Dict[tuple, dict] = {}
+        self._snippet_index_source = None
         
-        init_start = time.time()
+        # Track Ollama process to prevent multiple instances
+        self._ollama_spawned = False
+        self._ollama_kill_process: Optional[QProcess] = None
+        self._ollama_running_cache = (0.0, False)  # (monotonic check time, result)
+        # Batch workers read the cache from their own threads
+        self._ollama_running_mutex = QMutex()
+        # Readiness polling after a manual start
+        self._ollama_ready_timer: Optional[QTimer] = None
+        self._ollama_ready_socket: Optional[QTcpSocket] = None
+        self._ollama_ready_deadline = 0.0
+        
+        # Batch generation running on a worker thread (None when idle)
+        self._batch_thread: Optional[QThread] = None
+        self._batch_worker = None
+        self._batch_run = None
+        
+        init_start = time.perf_counter()
         
         # Initialize components with lazy loading
         self.prompt_engine = None  # Lazy load when needed
@@ -65,6 +662,7 @@ class MainWindow(QMainWindow):
         
         # Debug settings
         self.debug_enabled = debug_enabled
+        self._bind_debug_logging()
         self.logger = get_logger()
         
         # Cache for 0/X state (current state)
@@ -76,22 +674,25 @@ class MainWindow(QMainWindow):
         self._intentionally_navigating = False  # Flag to prevent jump-to-current during intentional navigation
         self._generating_prompt = False  # Flag to prevent navigation updates during generation
         self._just_finished_generation = False  # Flag to handle post-generation navigation updates
-        
-        # Track blocked widgets during state restoration
-        self._blocked_widgets = []
+        self._widgets_ready = False  # Set once every widget exists; hot paths check this instead of hasattr
+        self._loading_template = False  # Set while a template is being applied to the fields
+        self._last_prefs_payload: Optional[bytes] = None  # Last preferences.json contents written
+        self._updating_preview = False
+        self._suppress_preview_updates = False  # Short suppression windows after loads / update floods
+        self._preview_update_timer: Optional[QTimer] = None  # Created in _setup_callbacks
         
         # Track open snippet popups for dynamic updates
         self.open_snippet_popups = []
         
         # Initialize history manager (session-only, no persistence)
-        history_start = time.time()
+        history_start = time.perf_counter()
         self.history_manager = HistoryManager()
-        history_time = time.time() - history_start
+        history_time = time.perf_counter() - history_start
         if self.debug_enabled:
             info(f"STARTUP: HistoryManager initialization took {history_time:.3f}s", LogArea.GENERAL)
         
         # User data directories
-        dir_start = time.time()
+        dir_start = time.perf_counter()
         self.user_data_dir = theme_manager.user_data_dir
         self.templates_dir = self.user_data_dir / "templates"
         self.templates_dir.mkdir(parents=True, exist_ok=True)
@@ -100,130 +701,137 @@ class MainWindow(QMainWindow):
         self.cache_dir = self.user_data_dir / ".cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.generation_cache_file = self.cache_dir / "generation_times.json"
-        dir_time = time.time() - dir_start
+        dir_time = time.perf_counter() - dir_start
         if self.debug_enabled:
             info(f"STARTUP: Directory setup took {dir_time:.3f}s", LogArea.GENERAL)
         
         # Initialize UI
-        ui_start = time.time()
+        ui_start = time.perf_counter()
         self._setup_window()
-        setup_window_time = time.time() - ui_start
+        setup_window_time = time.perf_counter() - ui_start
         if self.debug_enabled:
             info(f"STARTUP: _setup_window took {setup_window_time:.3f}s", LogArea.GENERAL)
         
-        menu_start = time.time()
+        menu_start = time.perf_counter()
         self._create_menu_bar()
-        menu_time = time.time() - menu_start
+        menu_time = time.perf_counter() - menu_start
         if self.debug_enabled:
             info(f"STARTUP: _create_menu_bar took {menu_time:.3f}s", LogArea.GENERAL)
         
-        central_start = time.time()
+        central_start = time.perf_counter()
         self._create_central_widget()
-        central_time = time.time() - central_start
+        central_time = time.perf_counter() - central_start
         if self.debug_enabled:
             info(f"STARTUP: _create_central_widget took {central_time:.3f}s", LogArea.GENERAL)
         
-        fields_start = time.time()
+        fields_start = time.perf_counter()
         self._create_input_fields()
-        fields_time = time.time() - fields_start
+        fields_time = time.perf_counter() - fields_start
         if self.debug_enabled:
             info(f"STARTUP: _create_input_fields took {fields_time:.3f}s", LogArea.GENERAL)
         
-        model_start = time.time()
+        model_start = time.perf_counter()
         self._create_model_selection_row()
-        model_time = time.time() - model_start
+        
+        # Every field input widget, built once so bulk operations iterate a fixed tuple
+        self._all_input_widgets = (
+            self.style_widget, self.setting_widget, self.weather_widget,
+            self.datetime_widget, self.subjects_widget, self.pose_widget,
+            self.camera_widget, self.framing_widget, self.grading_widget,
+            self.details_widget, self.llm_instructions_widget, self.seed_widget
+        )
+        # Field name -> widget, in the same order as _all_input_widgets
+        self.field_widgets = dict(zip(self._TAG_FIELDS + ("seed",), self._all_input_widgets))
+        # The ten prompt field widgets, and the same plus the LLM instructions field
+        self._tag_widgets = self._all_input_widgets[:10]
+        self._tag_widgets_with_llm = self._all_input_widgets[:11]
+        # Everything "Clear All" resets; the seed is kept
+        self._clearable_widgets = self._tag_widgets_with_llm
+        # (PromptData field, preview label, widget) for every randomizable prompt field
+        self._prompt_field_widgets = (
+            ("style", "Style", self.style_widget),
+            ("setting", "Setting", self.setting_widget),
+            ("weather", "Weather", self.weather_widget),
+            ("date_time", "Date/Time", self.datetime_widget),
+            ("subjects", "Subjects", self.subjects_widget),
+            ("pose_action", "Pose/Action", self.pose_widget),
+            ("camera", "Camera", self.camera_widget),
+            ("framing_action", "Framing/Action", self.framing_widget),
+            ("grading", "Color/Mood", self.grading_widget),
+            ("details", "Details", self.details_widget),
+        )
+        # Per-seed randomized values, only kept while a batch is being prepared
+        self._randomized_values_memo = None
+        # Field values the summary preview was last rendered from
+        self._last_preview_key = None
+        model_time = time.perf_counter() - model_start
         if self.debug_enabled:
             info(f"STARTUP: _create_model_selection_row took {model_time:.3f}s", LogArea.GENERAL)
         
-        button_start = time.time()
+        button_start = time.perf_counter()
         self._create_button_frame()
-        button_time = time.time() - button_start
+        button_time = time.perf_counter() - button_start
         if self.debug_enabled:
             info(f"STARTUP: _create_button_frame took {button_time:.3f}s", LogArea.GENERAL)
         
-        preview_start = time.time()
+        preview_start = time.perf_counter()
         self._create_preview_panel()
-        preview_time = time.time() - preview_start
+        
+        # All rows are built; attach the content widget to the scroll area
+        self.scroll_area.setWidget(self.main_widget)
+        preview_time = time.perf_counter() - preview_start
         if self.debug_enabled:
             info(f"STARTUP: _create_preview_panel took {preview_time:.3f}s", LogArea.GENERAL)
         
-        status_start = time.time()
+        status_start = time.perf_counter()
         self._create_status_bar()
-        status_time = time.time() - status_start
+        self._widgets_ready = True
+        status_time = time.perf_counter() - status_start
         if self.debug_enabled:
             info(f"STARTUP: _create_status_bar took {status_time:.3f}s", LogArea.GENERAL)
         
-        ui_total_time = time.time() - ui_start
+        ui_total_time = time.perf_counter() - ui_start
         if self.debug_enabled:
             info(f"STARTUP: Total UI creation took {ui_total_time:.3f}s", LogArea.GENERAL)
         
         # Initialize components (lazy load LLM components)
-        components_start = time.time()
+        components_start = time.perf_counter()
         self._update_llm_status_lazy()
-        llm_time = time.time() - components_start
+        llm_time = time.perf_counter() - components_start
         if self.debug_enabled:
             info(f"STARTUP: _update_llm_status_lazy took {llm_time:.3f}s", LogArea.GENERAL)
         
-        snippet_start = time.time()
+        snippet_start = time.perf_counter()
         self._initialize_snippet_dropdowns()
-        snippet_time = time.time() - snippet_start
+        snippet_time = time.perf_counter() - snippet_start
         if self.debug_enabled:
             info(f"STARTUP: _initialize_snippet_dropdowns took {snippet_time:.3f}s", LogArea.GENERAL)
         
-        callbacks_start = time.time()
+        callbacks_start = time.perf_counter()
         self._setup_callbacks()  # Set up callbacks after all widgets exist
-        callbacks_time = time.time() - callbacks_start
+        callbacks_time = time.perf_counter() - callbacks_start
         if self.debug_enabled:
             info(f"STARTUP: _setup_callbacks took {callbacks_time:.3f}s", LogArea.GENERAL)
         
-        components_total_time = time.time() - components_start
+        components_total_time = time.perf_counter() - components_start
         if self.debug_enabled:
             info(f"STARTUP: Total components initialization took {components_total_time:.3f}s", LogArea.GENERAL)
         
         # Load user preferences
-        prefs_start = time.time()
+        prefs_start = time.perf_counter()
         self._load_preferences()
-        prefs_time = time.time() - prefs_start
+        prefs_time = time.perf_counter() - prefs_start
         if self.debug_enabled:
             info(f"STARTUP: _load_preferences took {prefs_time:.3f}s", LogArea.GENERAL)
         
-        # Auto-start Ollama if preference is set
-        ollama_start = time.time()
-        if hasattr(self, 'auto_start_ollama_action') and self.auto_start_ollama_action.isChecked():
-            info(f"STARTUP: Auto-start Ollama preference is enabled, checking current processes...", LogArea.GENERAL)
-            self._get_ollama_process_info()  # Log current state before auto-start
-            self._auto_start_ollama()
-        ollama_time = time.time() - ollama_start
-        if self.debug_enabled:
-            info(f"STARTUP: Ollama auto-start check took {ollama_time:.3f}s", LogArea.GENERAL)
-        
-        # Set initial theme checkmark
-        theme_start = time.time()
-        current_theme = theme_manager.get_current_theme()
-        self._update_theme_checkmarks(current_theme)
-        theme_time = time.time() - theme_start
-        if self.debug_enabled:
-            info(f"STARTUP: Theme setup took {theme_time:.3f}s", LogArea.GENERAL)
-        
-        # Apply modern styling
-        styling_start = time.time()
-        self._apply_styling()
-        styling_time = time.time() - styling_start
-        if self.debug_enabled:
-            info(f"STARTUP: _apply_styling took {styling_time:.3f}s", LogArea.GENERAL)
-        
-        # Ensure navigation controls are properly styled
-        nav_start = time.time()
-        if hasattr(self, 'preview_panel'):
-            self.preview_panel.refresh_navigation_styling()
-        nav_time = time.time() - nav_start
-        if self.debug_enabled:
-            info(f"STARTUP: Navigation styling took {nav_time:.3f}s", LogArea.GENERAL)
+        # Theme checkmarks and styling are applied on the first event loop tick
+        # so the window can paint before the styling pass runs
+        QTimer.singleShot(0, self._apply_deferred_styling)
         
         # Initialize progress tracking
-        progress_start = time.time()
+        progress_start = time.perf_counter()
         self._init_progress_tracking()
-        progress_time = time.time() - progress_start
+        progress_time = time.perf_counter() - progress_start
         if self.debug_enabled:
             info(f"STARTUP: Progress tracking init took {progress_time:.3f}s", LogArea.GENERAL)
         
@@ -235,71 +843,101 @@ class MainWindow(QMainWindow):
         self._dbg_prev_update_count = 0
         self._dbg_last_reset_time = time.monotonic()
         self._dbg_cycle_threshold = 100  # calls per 2 seconds
+        self._dbg_paint_count = 0
+        self._dbg_paint_last_reset = 0.0
+        self._dbg_popup_count = 0
+        self._dbg_popup_last_reset = 0.0
 
         # Popup/UI suppression during restores/jumps
         self._suppress_popups = False
 
-        # Install global event filter to log QMessageBox storms
-        event_start = time.time()
-        try:
-            app = QApplication.instance()
-            if app:
-                app.installEventFilter(self)
-                self._dbg_popup_count = 0
-                self._dbg_popup_last_reset = time.monotonic()
-        except Exception:
-            pass
-        event_time = time.time() - event_start
+        # Filter this window's own events to log paint storms; popup storms are
+        # handled by _maybe_show_message rather than an application-wide filter
+        event_start = time.perf_counter()
+        self.installEventFilter(self)
+        event_time = time.perf_counter() - event_start
         if self.debug_enabled:
             info(f"STARTUP: Event filter setup took {event_time:.3f}s", LogArea.GENERAL)
 
-        total_init_time = time.time() - init_start
+        total_init_time = time.perf_counter() - init_start
         if self.debug_enabled:
             info(f"STARTUP: Total MainWindow initialization took {total_init_time:.3f}s", LogArea.GENERAL)
-            info(f"STARTUP: MainWindow breakdown - History: {history_time:.3f}s, Dirs: {dir_time:.3f}s, UI: {ui_total_time:.3f}s, Components: {components_total_time:.3f}s, Prefs: {prefs_time:.3f}s, Ollama: {ollama_time:.3f}s, Theme: {theme_time:.3f}s, Styling: {styling_time:.3f}s", LogArea.GENERAL)
+            info(f"STARTUP: MainWindow breakdown - History: {history_time:.3f}s, Dirs: {dir_time:.3f}s, UI: {ui_total_time:.3f}s, Components: {components_total_time:.3f}s, Prefs: {prefs_time:.3f}s", LogArea.GENERAL)
+        
+        # Startup services that spawn processes run once the event loop is up,
+        # so the window paints first; ui_ready is emitted when they are done
+        self._ui_ready_emitted = False
+        QTimer.singleShot(0, self._finish_startup)
+    
+    def _finish_startup(self):
+        """Second startup phase: start background services, then announce ui_ready."""
+        # Auto-start Ollama if preference is set
+        ollama_start = time.perf_counter()
+        if self.auto_start_ollama_action.isChecked():
+            info(f"STARTUP: Auto-start Ollama preference is enabled, checking current processes...", LogArea.GENERAL)
+            # Log current state and check for a running server off the GUI thread;
+            # _on_ollama_probe_finished continues the auto-start
+            self._get_ollama_process_info(check_running=True)
+        ollama_time = time.perf_counter() - ollama_start
+        if self.debug_enabled:
+            info(f"STARTUP: Ollama auto-start check took {ollama_time:.3f}s", LogArea.GENERAL)
         
-        # Fire ui_ready after a short delay to allow widgets/services to settle
-        QTimer.singleShot(300, self._emit_ui_ready)
+        self._emit_ui_ready()
+    
+    def _on_ollama_probe_finished(self, running: bool):
+        """Finish the startup auto-start once the background process check is done."""
+        # Seed the running cache so _auto_start_ollama doesn't repeat the check
+        self._store_ollama_running(time.monotonic(), running)
+        self._auto_start_ollama()
     
     def eventFilter(self, obj, event):
-        # Log and optionally rate-limit QMessageBox show/hide to detect cycles
+        # Paint storm logging is debug-only; skip it on the hot path
+        if not self.debug_enabled:
+            return super().eventFilter(obj, event)
         try:
-            if isinstance(obj, QMessageBox):
-                if event.type() in (QEvent.Show, QEvent.Hide):
-                    now = time.monotonic()
-                    if now - self._dbg_popup_last_reset > 2.0:
-                        self._dbg_popup_count = 0
-                        self._dbg_popup_last_reset = now
-                    self._dbg_popup_count += 1
-                    if self.debug_enabled:
-                        debug(r"QMessageBox event: {event.type().name if hasattr(event.type(), 'name') else int(event.type())} count={self._dbg_popup_count}", LogArea.LOAD)
-                    # If popups are storming, block further shows briefly
-                    if event.type() == QEvent.Show and self._dbg_popup_count > 10:
-                        if self.debug_enabled:
-                            error(r"Popup storm detected; suppressing this QMessageBox show", LogArea.LOAD)
-                        return True  # Filter out this event
-                    # Suppress popups during restore/jump windows
-                    if event.type() == QEvent.Show and getattr(self, '_suppress_popups', False):
-                        if self.debug_enabled:
-                            debug(r"Suppressing popup during restore/jump window", LogArea.LOAD)
-                        return True
-            # Log paint/update storms
-            if event.type() in (QEvent.UpdateRequest, QEvent.Paint):
-                now = time.monotonic()
-                if not hasattr(self, '_dbg_paint_last_reset') or now - getattr(self, '_dbg_paint_last_reset', 0) > 2.0:
-                    self._dbg_paint_count = 0
-                    self._dbg_paint_last_reset = now
+            event_type = event.type()
+            # Log paint/update storms; the clock is only read every 256 events
+            if event_type == _EVT_PAINT or event_type == _EVT_UPDATE_REQUEST:
                 self._dbg_paint_count += 1
-                if self._dbg_paint_count % 200 == 0 and self.debug_enabled:
-                    debug(r"High frequency UI updates: {self._dbg_paint_count} in last window", LogArea.NAVIGATION)
+                if self._dbg_paint_count & 0xFF == 0:
+                    now = time.monotonic()
+                    if now - self._dbg_paint_last_reset > 2.0:
+                        self._dbg_paint_count = 0
+                        self._dbg_paint_last_reset = now
+                    else:
+                        debug(f"High frequency UI updates: {self._dbg_paint_count} in last window", LogArea.NAVIGATION)
         except Exception:
             pass
         return super().eventFilter(obj, event)
-        
-        # Fire ui_ready after a short delay to allow widgets/services to settle
-        QTimer.singleShot(300, self._emit_ui_ready)
+
+    def _maybe_show_message(self, show, title, text):
+        """Show a message box via show (e.g. QMessageBox.warning) unless popups are suppressed.
+
+        Popups are dropped during restore/jump windows and when more than 10 arrive within
+        2 seconds, which indicates a feedback cycle.
+        """
+        if self._suppress_popups:
+            if self.debug_enabled:
+                debug("Suppressing popup during restore/jump window", LogArea.LOAD)
+            return
+        now = time.monotonic()
+        if now - self._dbg_popup_last_reset > 2.0:
+            self._dbg_popup_count = 0
+            self._dbg_popup_last_reset = now
+        self._dbg_popup_count += 1
+        if self._dbg_popup_count > 10:
+            if self.debug_enabled:
+                error("Popup storm detected; suppressing this QMessageBox show", LogArea.LOAD)
+            return
+        if self.debug_enabled:
+            debug(f"QMessageBox show: {title} count={self._dbg_popup_count}", LogArea.LOAD)
+        show(self, title, text)
 
     def _emit_ui_ready(self):
+        # Only the first call counts; later calls are no-ops
+        if self._ui_ready_emitted:
+            return
+        self._ui_ready_emitted = True
         if self.debug_enabled:
             info(r"DEBUG NAV: Emitting ui_ready", LogArea.GENERAL)
         
@@ -319,9 +957,31 @@ class MainWindow(QMainWindow):
             self._prompt_engine_initialized = True
         return self.prompt_engine
     
+    def _apply_deferred_styling(self):
+        """Apply theme checkmarks and styling deferred from __init__."""
+        # Set initial theme checkmark
+        theme_start = time.perf_counter()
+        self._update_theme_checkmarks(theme_manager.get_current_theme())
+        theme_time = time.perf_counter() - theme_start
+        if self.debug_enabled:
+            info(f"STARTUP: Theme setup took {theme_time:.3f}s", LogArea.GENERAL)
+        
+        # Apply modern styling
+        styling_start = time.perf_counter()
+        self._apply_styling()
+        styling_time = time.perf_counter() - styling_start
+        if self.debug_enabled:
+            info(f"STARTUP: _apply_styling took {styling_time:.3f}s", LogArea.GENERAL)
+        
+        # Ensure navigation controls are properly styled
+        nav_start = time.perf_counter()
+        self.preview_panel.refresh_navigation_styling()
+        nav_time = time.perf_counter() - nav_start
+        if self.debug_enabled:
+            info(f"STARTUP: Navigation styling took {nav_time:.3f}s", LogArea.GENERAL)
+    
     def _get_snippet_manager(self):
-        """Lazy load the snippet manager when first needed."""
-        from ..utils.snippet_manager import snippet_manager
+        """Return the shared snippet manager."""
         return snippet_manager
     
     def _setup_window(self):
@@ -361,28 +1021,26 @@ class MainWindow(QMainWindow):
         file_menu.addAction(exit_action)
         
         # Filters menu (replacing content rating)
-        filters_menu = menubar.addMenu("Filters")
+        self.filters_menu = menubar.addMenu("Filters")
         
         # Initialize filters (checkboxes)
         self.filter_actions = {}
-        # Get available filters dynamically from snippet files
-        snippet_manager = None
+        self._selected_filters_cache = None
+        self._default_filter = None
+        self._create_filter_action_group()
+        # Get available filters dynamically from snippet files; kept so a snippet
+        # reload can tell whether the Filters menu needs rebuilding at all
         try:
-            from ..utils.snippet_manager import SnippetManager
-            snippet_manager = SnippetManager()
-            available_filters = snippet_manager.get_available_filters()
+            available_filters = self._get_snippet_manager().get_available_filters()
             filters = available_filters if available_filters else ["PG"]  # Fallback for empty case
         except Exception:
             filters = ["PG", "NSFW", "Hentai"]  # Ultimate fallback
+        self._available_filters = filters
         
         for filter_name in filters:
-            action = QAction(filter_name, self)
-            action.setCheckable(True)
-            if filter_name == filters[0]:  # Default to first available filter
-                action.setChecked(True)
-            action.triggered.connect(lambda checked, f=filter_name: self._on_filter_changed(f, checked))
-            filters_menu.addAction(action)
-            self.filter_actions[filter_name] = action
+            # Default to first available filter
+            self.filters_menu.addAction(self._new_filter_action(filter_name, filter_name == filters[0]))
+        self._reset_filter_cache()
         
         # Themes menu (top-level)
         themes_menu = menubar.addMenu("Themes")
@@ -470,10 +1128,10 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central_widget)
         
         # Create scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         
         # Create main content widget
         self.main_widget = QWidget()
@@ -481,90 +1139,103 @@ class MainWindow(QMainWindow):
         self.main_layout.setContentsMargins(10, 10, 10, 10)
         self.main_layout.setSpacing(2)  # Reduced from 5 to 2 for more compact layout
         
-        # Set scroll area widget
-        scroll_area.setWidget(self.main_widget)
+        # The main widget is handed to the scroll area in __init__ once all rows
+        # are in place, so the scroll range is computed once instead of per row
         
         # Layout for central widget
         layout = QVBoxLayout(central_widget)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(scroll_area)
+        layout.addWidget(self.scroll_area)
     
     def _create_input_fields(self):
         """Create input field widgets."""
+        # Widgets are created with main_widget as parent so addWidget does not reparent them
+        
         # Style
         self.style_widget = TagTextFieldWidget(
             "Style:", placeholder="Select art style...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.style_widget)
         
         # Setting (renamed from environment)
         self.setting_widget = TagTextFieldWidget(
             "Setting:", placeholder="Describe the setting...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.setting_widget)
         
         # Weather
         self.weather_widget = TagTextFieldWidget(
             "Weather:", placeholder="Describe the weather...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.weather_widget)
         
         # Date and Time
         self.datetime_widget = TagTextFieldWidget(
             "Date and Time:", placeholder="Select season and time of day...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.datetime_widget)
         
         # Subjects
         self.subjects_widget = TagTextFieldWidget(
             "Subjects:", placeholder="Describe the subjects...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.subjects_widget)
         
         # Subjects Pose and Action
         self.pose_widget = TagTextFieldWidget(
             "Subjects Pose and Action:", placeholder="Describe poses and actions...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.pose_widget)
         
         # Camera (expanded choices)
         self.camera_widget = TagTextFieldWidget(
             "Camera:", placeholder="Select camera type...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.camera_widget)
         
         # Camera Framing and Action
         self.framing_widget = TagTextFieldWidget(
             "Camera Framing and Action:", placeholder="Describe framing and movement...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.framing_widget)
         
         # Color Grading & Mood
         self.grading_widget = TagTextFieldWidget(
             "Color Grading & Mood:", placeholder="Describe color grading and mood...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.grading_widget)
         
         # Additional Details
         self.details_widget = TagTextAreaWidget(
             "Additional Details:", placeholder="Any additional details...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.details_widget)
         
         # LLM Instructions
         self.llm_instructions_widget = TagTextAreaWidget(
             "LLM Instructions:", placeholder="Select or enter custom LLM processing instructions...", 
-            change_callback=None  # Will be set later
+            change_callback=None,  # Will be set later
+            parent=self.main_widget
         )
         self.main_layout.addWidget(self.llm_instructions_widget)
     
@@ -581,6 +1252,7 @@ class MainWindow(QMainWindow):
         
         # Clear All Fields button (right-aligned, size-to-content)
         self.clear_button = QPushButton("Clear All Fields")
+        self.clear_button.setProperty("themedButton", True)
         self.clear_button.clicked.connect(self._clear_all_fields)
         self.clear_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         seed_layout.addWidget(self.clear_button, 0, Qt.AlignmentFlag.AlignRight)
@@ -605,6 +1277,7 @@ class MainWindow(QMainWindow):
 
         # Left: Generate button (expands to half width within layout)
         self.generate_button = QPushButton("Generate Final Prompt")
+        self.generate_button.setProperty("themedButton", True)
         self.generate_button.clicked.connect(self._generate_prompt)
         self.generate_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         batch_layout.addWidget(self.generate_button, 1)
@@ -655,7 +1328,7 @@ class MainWindow(QMainWindow):
         seed_label = QLabel("Seed:")
         seed_layout.addWidget(seed_label)
         self.seed_mode_combo = QComboBox()
-        self.seed_mode_combo.addItems(["fixed", "increment", "decrement", "randomize"])
+        self.seed_mode_combo.setModel(QStringListModel(["fixed", "increment", "decrement", "randomize"], self.seed_mode_combo))
         self.seed_mode_combo.setCurrentText("increment")
         self.seed_mode_combo.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         seed_layout.addWidget(self.seed_mode_combo)
@@ -831,16 +1504,52 @@ class MainWindow(QMainWindow):
         
         # Add widget to status bar
         self.status_bar.addWidget(self.status_label, 1)
+        
+        # Status writes are buffered and applied at most once per flush interval
+        self._pending_status = (None, None)
+        self._last_status_text = "Ready"
+        self._last_status_style = ""
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(150)
+        self._status_flush_timer.timeout.connect(self._flush_status)
+    
+    def _set_status(self, text, style=None):
+        """Queue status label text, and optionally its style sheet, for the next flush."""
+        pending_style = style if style is not None else self._pending_status[1]
+        self._pending_status = (text, pending_style)
+        if not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
+    
+    def _flush_status(self):
+        """Apply the pending status text and style to the label if they changed."""
+        text, style = self._pending_status
+        self._pending_status = (None, None)
+        if style is not None and style != self._last_status_style:
+            self._last_status_style = style
+            self.status_label.setStyleSheet(style)
+        if text is not None and text != self._last_status_text:
+            self._last_status_text = text
+            self.status_label.setText(text)
     
     def _init_progress_tracking(self):
         """Initialize progress tracking and caching."""
-        # Create cache directory
-        self.cache_dir = self.user_data_dir / ".cache"
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Cache file for generation times
-        self.generation_cache_file = self.cache_dir / "generation_times.json"
-        self.generation_times = self._load_generation_cache()
+        # String form of the cache path, reused by every save after a generation
+        self._generation_cache_path_str = str(self.generation_cache_file)
+        # Generation times are read on first use (see _get_generation_times); the stamp
+        # is the file's (mtime, size) when last read or written by this window
+        self._generation_times = None
+        self._generation_times_stamp = None
+        # Serialized JSON line per cache key; entries are dropped when their stats change,
+        # so a save only re-serializes the keys touched since the previous save
+        self._generation_json_fragments = {}
+        
+        # Cache writes are coalesced: updates mark the cache dirty and a single
+        # save runs once no further update has arrived for a few seconds
+        self._cache_dirty = False
+        self._cache_save_timer = QTimer(self)
+        self._cache_save_timer.setSingleShot(True)
+        self._cache_save_timer.timeout.connect(self._save_generation_cache)
         
         # Progress tracking
         self.generation_start_time = None
@@ -848,85 +1557,203 @@ class MainWindow(QMainWindow):
         self.progress_timer = QTimer()
         self.progress_timer.timeout.connect(self._update_progress)
     
+    def _get_generation_times(self):
+        """Return the generation time cache, loading it on first use.
+
+        The file is re-read when its mtime or size no longer match what this window last
+        read or wrote, unless there are unsaved local changes that would be lost.
+        """
+        stamp = _file_stamp(self._generation_cache_path_str)
+        if self._generation_times is None or (stamp != self._generation_times_stamp
+                                              and not self._cache_dirty):
+            self._generation_times = self._load_generation_cache()
+            self._generation_times_stamp = stamp
+            self._generation_json_fragments = {}
+        return self._generation_times
+    
     def _load_generation_cache(self):
         """Load cached generation times."""
         try:
-            if self.generation_cache_file.exists():
-                with open(self.generation_cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            if os.path.exists(self._generation_cache_path_str):
+                cached = _read_json_file(self._generation_cache_path_str)
+                # Entries are stored least recently used first; keep only the newest ones
+                recent = list(cached.items())[-_GENERATION_CACHE_MAX_ENTRIES:]
+                return OrderedDict((key, self._generation_stats_from_json(value)) for key, value in recent)
         except Exception as e:
             warning(f"Could not load generation cache: {e}", LogArea.GENERAL)
         
-        return {}
+        return OrderedDict()
+    
+    @staticmethod
+    def _generation_stats_from_json(value):
+        """Build a running-stats entry from a cached value, migrating legacy list/number formats."""
+        if isinstance(value, dict):
+            ring = deque(value.get("ring", []), maxlen=_GENERATION_HISTORY_SIZE)
+            return {
+                "ring": ring,
+                "sum": float(sum(ring)),
+                "min": value.get("min", min(ring, default=0.0)),
+                "max": value.get("max", max(ring, default=0.0)),
+                "count": value.get("count", len(ring)),
+            }
+        
+        # Legacy formats: a list of recent durations or a single number
+        durations = value if isinstance(value, list) else [value]
+        durations = [d for d in durations if isinstance(d, (int, float))]
+        ring = deque(durations, maxlen=_GENERATION_HISTORY_SIZE)
+        return {
+            "ring": ring,
+            "sum": float(sum(ring)),
+            "min": min(durations, default=0.0),
+            "max": max(durations, default=0.0),
+            "count": len(durations),
+        }
+    
+    @staticmethod
+    def _generation_stats_to_json(stats):
+        """Convert a running-stats entry into JSON-serializable form."""
+        return {"ring": list(stats["ring"]), "min": stats["min"], "max": stats["max"], "count": stats["count"]}
     
     def _save_generation_cache(self):
-        """Save generation times to cache."""
+        """Save generation times to cache.
+
+        The snapshot is serialized here and written on a pool thread so disk stalls never block the UI.
+        """
+        self._cache_dirty = False
+        if self._generation_times is None:
+            return
+        fragments = self._generation_json_fragments
         try:
-            with open(self.generation_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.generation_times, f, indent=2, ensure_ascii=False)
+            parts = []
+            for key, stats in self._generation_times.items():
+                fragment = fragments.get(key)
+                if fragment is None:
+                    fragment = fragments[key] = (f"  {_dump_json_str(key)}: "
+                                                 f"{_dump_json_str(self._generation_stats_to_json(stats))}")
+                parts.append(fragment)
+            payload = ("{\n" + ",\n".join(parts) + "\n}").encode('utf-8')
         except Exception as e:
             warning(f"Could not save generation cache: {e}", LogArea.GENERAL)
+            return
+        self._start_json_save(self._generation_cache_path_str, payload)
+    
+    def _start_json_save(self, path, payload):
+        """Hand pre-serialized JSON to a pool thread for writing."""
+        task = _JsonSaveTask(path, payload)
+        task.signals.failed.connect(self._on_json_save_failed)
+        task.signals.saved.connect(self._on_json_saved)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_json_saved(self, path, stamp):
+        """Report a background JSON write that completed.
+
+        For the generation cache the stamp is remembered so our own write is not mistaken
+        for an external change; any other path is a user template.
+        """
+        if path == self._generation_cache_path_str:
+            # Ignore a write that has since been replaced or removed (e.g. by a cache clear)
+            if stamp == _file_stamp(path):
+                self._generation_times_stamp = stamp
+        else:
+            self._maybe_show_message(QMessageBox.information, "Success", f"Template saved to {path}")
+            self._show_status_message(f"Template saved to {Path(path).name}")
+    
+    def _on_json_save_failed(self, path, message):
+        """Report a background JSON write that failed."""
+        if path == self._generation_cache_path_str:
+            warning(f"Could not save generation cache: {message}", LogArea.GENERAL)
+        else:
+            self._maybe_show_message(QMessageBox.critical, "Error", f"Failed to save template: {message}")
+    
+    def _schedule_generation_cache_save(self):
+        """Mark the generation cache dirty and (re)start the debounced save."""
+        self._cache_dirty = True
+        self._cache_save_timer.start(5000)
+    
+    def _flush_generation_cache(self):
+        """Write the generation cache now if it has unsaved changes."""
+        self._cache_save_timer.stop()
+        if self._cache_dirty:
+            self._save_generation_cache()
     
     def _get_cached_generation_time(self, llm_model, target_model):
         """Get cached generation time for model combination."""
         key = f"{llm_model}_{target_model}"
-        times = self.generation_times.get(key, [])
-        
-        if isinstance(times, list) and times:
+        generation_times = self._get_generation_times()
+        stats = generation_times.get(key)
+        if stats and stats["ring"]:
+            generation_times.move_to_end(key)
             # Return average of recent times
-            return sum(times) / len(times)
-        elif isinstance(times, (int, float)):
-            # Convert old single value format
-            return times
+            return stats["sum"] / len(stats["ring"])
+        # Default 5 seconds
+        return 5.0
+    
+    def _record_duration(self, key, duration):
+        """Fold a generation duration into the running stats for key and return them."""
+        generation_times = self._get_generation_times()
+        stats = generation_times.get(key)
+        if stats is None:
+            stats = {"ring": deque(maxlen=_GENERATION_HISTORY_SIZE), "sum": 0.0,
+                     "min": duration, "max": duration, "count": 0}
+            generation_times[key] = stats
+            while len(generation_times) > _GENERATION_CACHE_MAX_ENTRIES:
+                evicted_key, _ = generation_times.popitem(last=False)
+                self._generation_json_fragments.pop(evicted_key, None)
         else:
-            # Default 5 seconds
-            return 5.0
+            generation_times.move_to_end(key)
+            self._generation_json_fragments.pop(key, None)
+        
+        ring = stats["ring"]
+        if len(ring) == ring.maxlen:
+            # The oldest duration is about to drop out of the recent window
+            stats["sum"] -= ring[0]
+        ring.append(duration)
+        stats["sum"] += duration
+        stats["count"] += 1
+        if duration < stats["min"]:
+            stats["min"] = duration
+        if duration > stats["max"]:
+            stats["max"] = duration
+        return stats
     
     def _update_cached_generation_time(self, llm_model, target_model, duration):
         """Update cached generation time."""
-        key = f"{llm_model}_{target_model}"
-        times = self.generation_times.get(key, [])
-        
-        if isinstance(times, list):
-            # Add new time to list
-            times.append(duration)
-            # Keep only last 10 times for statistics
-            if len(times) > 10:
-                times = times[-10:]
-        else:
-            # Convert old single value to list
-            times = [times, duration] if isinstance(times, (int, float)) else [duration]
-        
-        self.generation_times[key] = times
-        self._save_generation_cache()
+        self._record_duration(f"{llm_model}_{target_model}", duration)
+        self._schedule_generation_cache_save()
     
     def _start_progress_tracking(self, llm_model, target_model):
         """Start progress tracking for generation."""
-        self.generation_start_time = datetime.now()
+        self.generation_start_time = time.perf_counter()
         self.estimated_duration = self._get_cached_generation_time(llm_model, target_model)
         
         # Show expected time before starting
         if self.estimated_duration > 0:
-            self.status_label.setText(f"Starting generation with {llm_model} (expected: {self.estimated_duration:.1f}s)...")
+            self._set_status(f"Starting generation with {llm_model} (expected: {self.estimated_duration:.1f}s)...")
         else:
-            self.status_label.setText(f"Starting generation with {llm_model}...")
+            self._set_status(f"Starting generation with {llm_model}...")
         
         # Start progress updates after a short delay
-        QTimer.singleShot(500, lambda: self._start_progress_updates())
+        QTimer.singleShot(500, self._start_progress_updates)
+    
+    def _progress_interval_ms(self):
+        """Return the progress timer interval, keeping a run to about 40 updates."""
+        if not self.estimated_duration or self.estimated_duration <= 10:
+            return 250
+        return int(self.estimated_duration * 1000 // 40)
     
     def _start_progress_updates(self):
         """Start the progress update timer."""
-        self.progress_timer.start(100)  # Update every 100ms
+        self.progress_timer.start(self._progress_interval_ms())
     
     def _update_progress(self):
         """Update progress bar based on elapsed time."""
         if self.generation_start_time and self.estimated_duration:
-            elapsed = (datetime.now() - self.generation_start_time).total_seconds()
+            elapsed = time.perf_counter() - self.generation_start_time
             progress = min(int((elapsed / self.estimated_duration) * 100), 99)  # Cap at 99%
             
             # Update status with terminal-style progress
             llm_model = self.llm_widget.get_value() if hasattr(self, 'llm_widget') else "unknown"
-            self.status_label.setText(f"Generating with {llm_model}... {elapsed:.1f}s/{self.estimated_duration:.1f}s [{progress}%]")
+            self._set_status(f"Generating with {llm_model}... {elapsed:.1f}s/{self.estimated_duration:.1f}s [{progress}%]")
     
     def _stop_progress_tracking(self, duration=None):
         """Stop progress tracking."""
@@ -943,245 +1770,80 @@ class MainWindow(QMainWindow):
             # Show completion message with statistics
             self._show_generation_stats(llm_model, target_model, duration)
         else:
-            self.status_label.setText("Ready")
+            self._set_status("Ready")
     
     def _show_generation_stats(self, llm_model, target_model, duration):
         """Show generation statistics in status bar."""
-        key = f"{llm_model}_{target_model}"
-        times = self.generation_times.get(key, [])
-        
-        if isinstance(times, list):
-            # Add new time to list
-            times.append(duration)
-            # Keep only last 10 times for statistics
-            if len(times) > 10:
-                times = times[-10:]
-            self.generation_times[key] = times
-        else:
-            # Convert old single value to list
-            times = [times, duration]
-            self.generation_times[key] = times
+        # The duration has already been recorded by _update_cached_generation_time
+        stats = self._get_generation_times()[f"{llm_model}_{target_model}"]
         
-        # Calculate statistics
-        avg_time = sum(times) / len(times)
-        min_time = min(times)
-        max_time = max(times)
+        # Average over the recent window; min/max over every recorded run
+        avg_time = stats["sum"] / len(stats["ring"])
         
         # Show statistics
-        self.status_label.setText(f"Generated in {duration:.2f}s (avg: {avg_time:.2f}s, min: {min_time:.2f}s, max: {max_time:.2f}s)")
-        
-        # Save updated cache
-        self._save_generation_cache()
+        self._set_status(f"Generated in {duration:.2f}s (avg: {avg_time:.2f}s, min: {stats['min']:.2f}s, max: {stats['max']:.2f}s)")
     
     def _show_status_message(self, message, timeout=3000):
         """Show a status message."""
-        self.status_label.setText(message)
+        self._set_status(message)
         if timeout > 0:
-            QTimer.singleShot(timeout, lambda: self.status_label.setText("Ready"))
+            QTimer.singleShot(timeout, self._reset_status_ready)
     
     def _show_error_message(self, message):
         """Show an error message in status bar."""
-        self.status_label.setText(f"Error: {message}")
-        self.status_label.setStyleSheet("color: red;")
-        QTimer.singleShot(5000, lambda: self._clear_error_style())
+        self._set_status(f"Error: {message}", "color: red;")
+        QTimer.singleShot(5000, self._clear_error_style)
     
     def _clear_error_style(self):
         """Clear error styling from status label."""
-        self.status_label.setStyleSheet("")
-        self.status_label.setText("Ready")
+        self._set_status("Ready", "")
+    
+    def _reset_status_ready(self):
+        """Return the status label to "Ready" after a timed message."""
+        self._set_status("Ready")
+    
+    def _end_preview_suppression(self):
+        """Re-allow preview updates once a suppression window has passed."""
+        self._suppress_preview_updates = False
+    
+    def _end_intentional_navigation(self):
+        """Clear the navigation flag once delayed restore work has run."""
+        self._intentionally_navigating = False
+    
+    def _end_popup_suppression(self):
+        """Re-allow popups once a jump to the current state has settled."""
+        self._suppress_popups = False
+    
+    def _refresh_preview_after_restore(self):
+        """Force a preview update after a history restore, unless a template is loading."""
+        if self._loading_template:
+            return
+        self._update_preview(preserve_tab=True, force_update=True)
     
     def _apply_styling(self):
         """Apply theme-based styling to the application."""
         # Get current theme colors
         colors = theme_manager.get_theme_colors()
         
-        # Build stylesheet with theme colors
-        stylesheet = f"""
-            QMainWindow {{
-                background-color: {colors['bg']};
-                color: {colors['text_fg']};
-            }}
-            QWidget {{
-                background-color: {colors['bg']};
-                color: {colors['text_fg']};
-            }}
-            QGroupBox {{
-                font-weight: bold;
-                border: 2px solid {colors['tag_border']};
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-                background-color: {colors['text_bg']};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                background-color: {colors['text_bg']};
-            }}
-            QScrollArea {{
-                border: 1px solid {colors['tag_border']};
-                background-color: {colors['text_bg']};
-            }}
-            
-            /* Modern Scrollbars */
-            QScrollBar:vertical {{
-                background-color: {colors['scrollbar_bg']};
-                width: 12px;
-                border-radius: 6px;
-                border: none;
-                margin: 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {colors['scrollbar_handle']};
-                border-radius: 6px;
-                min-height: 20px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {colors['button_bg']};
-            }}
-            QScrollBar::handle:vertical:pressed {{
-                background-color: {colors['button_bg']};
-            }}
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {{
-                height: 0px;
-                width: 0px;
-            }}
-            QScrollBar::add-page:vertical,
-            QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-            
-            QScrollBar:horizontal {{
-                background-color: {colors['scrollbar_bg']};
-                height: 12px;
-                border-radius: 6px;
-                border: none;
-                margin: 0px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background-color: {colors['scrollbar_handle']};
-                border-radius: 6px;
-                min-width: 20px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {colors['button_bg']};
-            }}
-            QScrollBar::handle:horizontal:pressed {{
-                background-color: {colors['button_bg']};
-            }}
-            QScrollBar::add-line:horizontal,
-            QScrollBar::sub-line:horizontal {{
-                height: 0px;
-                width: 0px;
-            }}
-            QScrollBar::add-page:horizontal,
-            QScrollBar::sub-page:horizontal {{
-                background: none;
-            }}
-            
-            /* Menu styling */
-            QMenuBar {{
-                background-color: {colors['menu_bg']};
-                color: {colors['menu_fg']};
-            }}
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 4px 8px;
-            }}
-            QMenuBar::item:selected {{
-                background-color: {colors['menu_selection_bg']};
-                color: {colors['menu_selection_fg']};
-            }}
-            QMenu {{
-                background-color: {colors['menu_bg']};
-                color: {colors['menu_fg']};
-                border: 1px solid {colors['tag_border']};
-            }}
-            QMenu::item {{
-                padding: 4px 8px;
-            }}
-            QMenu::item:selected {{
-                background-color: {colors['menu_selection_bg']};
-                color: {colors['menu_selection_fg']};
-            }}
-            
-            /* Status bar styling */
-            QStatusBar {{
-                background-color: {colors['status_bg']};
-                color: {colors['status_fg']};
-            }}
-        """
+        # Build stylesheet with theme colors; push buttons are matched by selector
+        # so Qt's style engine applies them without touching each button
+        stylesheet = _QSS_TEMPLATE.format_map(colors) + _BUTTON_QSS_TEMPLATE.format_map(colors)
         
         # Apply the main stylesheet
         self.setStyleSheet(stylesheet)
-        
-        # Apply button styling
-        for button in self.findChildren(QPushButton):
-            # Skip dice button, realize button, and buttons inside tag widgets
-            parent = button.parent()
-            if (button.objectName() not in ["diceButton", "realizeButton"] and 
-                not (parent and parent.objectName() in ["tagWidget", "InlineTagWidget"])):
-                button.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {colors['button_bg']};
-                        color: {colors['button_fg']};
-                        border: 2px solid {colors['button_bg']};
-                        border-radius: 4px;
-                        padding: 8px 16px;
-                        font-weight: bold;
-                        min-height: 20px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {colors['button_bg']};
-                        border-color: {colors['button_bg']};
-                        opacity: 0.8;
-                    }}
-                    QPushButton:pressed {{
-                        background-color: {colors['button_bg']};
-                        border-color: {colors['button_bg']};
-                        opacity: 0.6;
-                    }}
-                    QPushButton:disabled {{
-                        background-color: {colors['placeholder_fg']};
-                        border-color: {colors['placeholder_fg']};
-                        color: {colors['text_bg']};
-                    }}
-                """)
     
     # Event handlers
     def _clear_all_fields(self):
         """Clear all input fields."""
-        # Clear all input fields
-        if hasattr(self, 'style_widget'):
-            self.style_widget.clear()
-        if hasattr(self, 'setting_widget'):
-            self.setting_widget.clear()
-        if hasattr(self, 'weather_widget'):
-            self.weather_widget.clear()
-        if hasattr(self, 'datetime_widget'):
-            self.datetime_widget.clear()
-        if hasattr(self, 'subjects_widget'):
-            self.subjects_widget.clear()
-        if hasattr(self, 'pose_widget'):
-            self.pose_widget.clear()
-        if hasattr(self, 'camera_widget'):
-            self.camera_widget.clear()
-        if hasattr(self, 'framing_widget'):
-            self.framing_widget.clear()
-        if hasattr(self, 'grading_widget'):
-            self.grading_widget.clear()
-        if hasattr(self, 'details_widget'):
-            self.details_widget.clear()
-        if hasattr(self, 'llm_instructions_widget'):
-            self.llm_instructions_widget.clear()
+        # Clear all input fields (the seed is kept) with their change signals blocked;
+        # a single preview update is scheduled below instead of one per field
+        with self._block_field_signals():
+            for widget in self._clearable_widgets:
+                widget.clear()
         
         # Reset filters to default
         # Reset to first available filter (or none if no filters available)
-        first_filter = list(self.filter_actions.keys())[0] if self.filter_actions else None
+        first_filter = self._default_filter
         for filter_name, action in self.filter_actions.items():
             action.setChecked(filter_name == first_filter)
         
@@ -1190,8 +1852,7 @@ class MainWindow(QMainWindow):
             self.model_widget.set_value("seedream")
         
         # Reset LLM to default
-        if hasattr(self, 'llm_widget'):
-            self.llm_widget.set_value("deepseek-r1:8b")
+        self.llm_widget.set_value("deepseek-r1:8b")
         
         # Clear preview
         self._schedule_preview_update()
@@ -1205,7 +1866,7 @@ class MainWindow(QMainWindow):
         prompt_text = self.preview_panel.get_current_text()
         
         if not prompt_text:
-            QMessageBox.warning(self, "No Prompt", "No prompt to save. Please generate a prompt first.")
+            self._maybe_show_message(QMessageBox.warning, "No Prompt", "No prompt to save. Please generate a prompt first.")
             return
         
         # Get save location
@@ -1219,47 +1880,47 @@ class MainWindow(QMainWindow):
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(prompt_text)
-                QMessageBox.information(self, "Success", f"Prompt saved to {file_path}")
+                self._maybe_show_message(QMessageBox.information, "Success", f"Prompt saved to {file_path}")
                 self._show_status_message(f"Prompt saved to {Path(file_path).name}")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save prompt: {str(e)}")
+                self._maybe_show_message(QMessageBox.critical, "Error", f"Failed to save prompt: {str(e)}")
     
     def _save_template(self):
         """Save current settings as a template using PromptState."""
         try:
             # Capture current state as PromptState
             prompt_state = self.capture_current_state()
+            # One timestamp for both the saved_at field and the default file name
+            saved_at = datetime.now()
             
             # Create template data with PromptState
             template_data = {
                 "format_version": "3.0",  # New PromptState-based format
                 "prompt_state": prompt_state.to_dict(),
                 "debug_enabled": self.debug_enabled,
-                "saved_at": datetime.now().isoformat(),
+                "saved_at": saved_at.isoformat(),
                 "description": "Template saved using PromptState format"
             }
             
             # Get save location
             file_path, _ = QFileDialog.getSaveFileName(
                 self, "Save Template", 
-                str(self.templates_dir / f"template_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"),
+                str(self.templates_dir / f"template_{saved_at:%Y%m%d_%H%M%S}.json"),
                 "JSON Files (*.json);;All Files (*)"
             )
             
             if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(template_data, f, indent=2)
-                QMessageBox.information(self, "Success", f"Template saved to {file_path}")
-                self._show_status_message(f"Template saved to {Path(file_path).name}")
+                # Success is reported by _on_json_saved once the write has actually happened
+                self._start_json_save(file_path, _dump_json_bytes(template_data))
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save template: {str(e)}")
+            self._maybe_show_message(QMessageBox.critical, "Error", f"Failed to save template: {str(e)}")
     
     def _load_template(self, file_path: str = None, show_messages: bool = True):
         """Load a template file with backward compatibility and PromptState support.
         If file_path is provided, loads that file directly; otherwise opens a file dialog.
         """
         # Re-entry guard
-        if hasattr(self, '_loading_template') and self._loading_template:
+        if self._loading_template:
             if self.debug_enabled:
                 info(r"[LOAD] Template load requested while already loading - skipping", LogArea.LOAD)
             return
@@ -1278,7 +1939,7 @@ class MainWindow(QMainWindow):
             
             # Stop any pending preview timer and disable UI updates to avoid flicker/cycling
             try:
-                if hasattr(self, '_preview_update_timer'):
+                if self._preview_update_timer is not None:
                     self._preview_update_timer.stop()
             except Exception:
                 pass
@@ -1292,11 +1953,9 @@ class MainWindow(QMainWindow):
                 if self.debug_enabled:
                     info(f"Loading template from: {file_path}", LogArea.LOAD)
                 
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    template_data = json.load(f)
+                template_data = _read_json_file(file_path)
                 
-                if self.debug_enabled:
-                    debug(f"Template data keys: {list(template_data.keys())}", LogArea.LOAD)
+                debug(lambda: f"Template data keys: {list(template_data.keys())}", LogArea.LOAD)
                 
                 # Track issues for single popup
                 issues = []
@@ -1313,8 +1972,7 @@ class MainWindow(QMainWindow):
                         info("Processing v3.0 PromptState-based template", LogArea.LOAD)
                     
                     if "prompt_state" in template_data:
-                        if self.debug_enabled:
-                            debug(f"PromptState data keys: {list(template_data['prompt_state'].keys())}", LogArea.LOAD)
+                        debug(lambda: f"PromptState data keys: {list(template_data['prompt_state'].keys())}", LogArea.LOAD)
                         
                         prompt_state = PromptState.from_dict(template_data["prompt_state"])
                         
@@ -1354,6 +2012,7 @@ class MainWindow(QMainWindow):
                 # Load debug mode setting
                 if "debug_enabled" in template_data:
                     self.debug_enabled = template_data["debug_enabled"]
+                    self._bind_debug_logging()
                     if hasattr(self, 'debug_action'):
                         self.debug_action.setChecked(self.debug_enabled)
                 
@@ -1391,8 +2050,7 @@ class MainWindow(QMainWindow):
                 # Clear the template loading flag
                 self._loading_template = False
                 # Clear suppression shortly after to avoid cascades
-                from PySide6.QtCore import QTimer
-                QTimer.singleShot(250, lambda: setattr(self, '_suppress_preview_updates', False))
+                QTimer.singleShot(250, self._end_preview_suppression)
                 # No modal popups; rely on status bar and logs only
                 # Re-enable UI updates
                 try:
@@ -1403,8 +2061,6 @@ class MainWindow(QMainWindow):
     
     def _convert_legacy_template_to_prompt_state(self, template_data):
         """Convert legacy template format to PromptState."""
-        from .tag_widgets_qt import Tag, TagType
-        
         if self.debug_enabled:
             info("Converting legacy template to PromptState", LogArea.LOAD)
         
@@ -1412,63 +2068,38 @@ class MainWindow(QMainWindow):
         field_values = {}
         field_tags = {}
         
-        # Map template field names to widget field names
-        field_mappings = {
-            "style": "style",
-            "setting": "setting", 
-            "weather": "weather",
-            "datetime": "datetime",
-            "subjects": "subjects",
-            "pose": "pose",
-            "camera": "camera",
-            "framing": "framing",
-            "grading": "grading",
-            "details": "details",
-            "llm_instructions": "llm_instructions"
-        }
-        
         # Handle tag-based format (v2.0)
         if "format_version" in template_data and template_data["format_version"] == "2.0":
             if self.debug_enabled:
                 info("Processing v2.0 tag-based format", LogArea.LOAD)
             
-            for template_field, widget_field in field_mappings.items():
-                tag_key = f"{template_field}_tags"
+            for field_name in self._TAG_FIELDS:
+                tag_key = f"{field_name}_tags"
                 if tag_key in template_data:
-                    if self.debug_enabled:
-                        debug(f"Processing {template_field} tags: {len(template_data[tag_key])} tags", LogArea.LOAD)
+                    debug(lambda: f"Processing {field_name} tags: {len(template_data[tag_key])} tags", LogArea.LOAD)
                     
-                    # Convert tag data to Tag objects
-                    tags = []
-                    for tag_data in template_data[tag_key]:
-                        try:
-                            tag = Tag.from_dict(tag_data)
-                            tags.append(tag)
-                        except Exception as e:
-                            if self.debug_enabled:
-                                error(f"Failed to convert tag data {tag_data}: {str(e)}", LogArea.ERROR)
-                            # Skip this tag and continue
-                            continue
+                    # Convert tag data to Tag objects (invalid entries are logged and skipped)
+                    tags = Tag.from_dicts(template_data[tag_key])
                     
-                    field_tags[widget_field] = tags
+                    field_tags[field_name] = tags
                     
                     # Also set field values from tags
-                    field_values[widget_field] = ", ".join([tag.text for tag in tags])
+                    field_values[field_name] = ", ".join(tag.text for tag in tags)
         
         # Handle legacy format (v1.0)
         else:
             if self.debug_enabled:
                 info("Processing v1.0 legacy format", LogArea.LOAD)
             
-            for template_field, widget_field in field_mappings.items():
-                if template_field in template_data:
-                    value = template_data[template_field]
-                    field_values[widget_field] = value
+            for field_name in self._TAG_FIELDS:
+                if field_name in template_data:
+                    value = template_data[field_name]
+                    field_values[field_name] = value
                     
                     # Convert simple text to user text tags
                     if value.strip():
                         tags = [Tag(value.strip(), TagType.USER_TEXT)]
-                        field_tags[widget_field] = tags
+                        field_tags[field_name] = tags
         
         # Get metadata
         seed = template_data.get("seed", 0)
@@ -1498,37 +2129,33 @@ class MainWindow(QMainWindow):
     
     def _load_and_check_tags(self, tag_data_list, field_name: str):
         """Load tags from template data and check for missing categories/subcategories."""
-        from .tag_widgets_qt import Tag, TagType
-        
         if self.debug_enabled:
             debug(f"Loading and checking tags for field '{field_name}' with {len(tag_data_list)} tags", LogArea.LOAD)
         
-        # Map UI field names to actual JSON field names for validation
-        field_mappings = {
-            "pose": "subjects_pose_and_action",
-            "grading": "color_grading_&_mood", 
-            "datetime": "date_time",
-            "framing": "camera_framing_and_action",
-            "details": "additional_details"
-        }
-        
         # Use mapped field name for validation, fallback to original if no mapping
-        validation_field_name = field_mappings.get(field_name, field_name)
+        validation_field_name = _FIELD_MAPPINGS.get(field_name, field_name)
         
         if self.debug_enabled:
             debug(f"Using validation field name: '{validation_field_name}'", LogArea.LOAD)
         
+        # Filters and snippets cannot change while a template loads, so repeated
+        # category/subcategory references only need to be validated once
+        missing_by_path = {}
+        
         tags = []
         for i, tag_data in enumerate(tag_data_list):
             try:
                 tag = Tag.from_dict(tag_data)
                 
                 # Check if this tag is missing (for category/subcategory tags)
-                if tag.tag_type in [TagType.CATEGORY, TagType.SUBCATEGORY]:
-                    if tag.check_if_missing(validation_field_name):
+                if tag.tag_type in (TagType.CATEGORY, TagType.SUBCATEGORY):
+                    path_key = (tag.tag_type, tuple(tag.category_path))
+                    is_missing = missing_by_path.get(path_key)
+                    if is_missing is None:
+                        is_missing = missing_by_path[path_key] = tag.check_if_missing(validation_field_name)
+                    if is_missing:
                         tag.is_missing = True
-                        if self.debug_enabled:
-                            debug(f"Tag {i+1} '{tag.text}' is missing for field '{validation_field_name}'", LogArea.LOAD)
+                        debug(lambda: f"Tag {i+1} '{tag.text}' is missing for field '{validation_field_name}'", LogArea.LOAD)
                 
                 tags.append(tag)
                 
@@ -1547,14 +2174,14 @@ class MainWindow(QMainWindow):
         """Generate the final prompt using the LLM."""
         # Add verbose debug logging for batch processing
         if self.debug_enabled:
-            debug(r"_generate_prompt() called", LogArea.BATCH)
-            debug(r"batch_checkbox exists: {hasattr(self, 'batch_checkbox')}", LogArea.BATCH)
+            self._dbg("_generate_prompt() called")
+            self._dbg(f"batch_checkbox exists: {hasattr(self, 'batch_checkbox')}")
             if hasattr(self, 'batch_checkbox'):
-                debug(r"batch_checkbox checked: {self.batch_checkbox.isChecked()}", LogArea.BATCH)
-                debug(r"batch_checkbox object: {self.batch_checkbox}", LogArea.BATCH)
-                debug(r"batch_checkbox state: {self.batch_checkbox.checkState()}", LogArea.BATCH)
-                debug(r"batch_size_input value: {self.batch_size_input.value() if hasattr(self, 'batch_size_input') else 'N/A'}", LogArea.BATCH)
-                debug(r"seed_mode_combo value: {self.seed_mode_combo.currentText() if hasattr(self, 'seed_mode_combo') else 'N/A'}", LogArea.BATCH)
+                self._dbg(f"batch_checkbox checked: {self.batch_checkbox.isChecked()}")
+                self._dbg(f"batch_checkbox object: {self.batch_checkbox}")
+                self._dbg(f"batch_checkbox state: {self.batch_checkbox.checkState()}")
+                self._dbg(f"batch_size_input value: {self.batch_size_input.value() if hasattr(self, 'batch_size_input') else 'N/A'}")
+                self._dbg(f"seed_mode_combo value: {self.seed_mode_combo.currentText() if hasattr(self, 'seed_mode_combo') else 'N/A'}")
         
         # Log process state before generation
         info("=== Before Prompt Generation ===", LogArea.OLLAMA)
@@ -1562,31 +2189,33 @@ class MainWindow(QMainWindow):
         
         # Unified approach: always call _generate_batch_prompts()
         # Single submission is treated as batch of 1 with "fixed" seed mode
-        if self.debug_enabled:
-            debug(r"Calling _generate_batch_prompts() (unified approach)", LogArea.BATCH)
+        self._dbg("Calling _generate_batch_prompts() (unified approach)")
         self._generate_batch_prompts()
-        
-        # Log process state after generation
-        info("=== After Prompt Generation ===", LogArea.OLLAMA)
-        self._get_ollama_process_info()
 
     def _generate_batch_prompts(self):
-        """Generate multiple prompts in batch using different seeds - unified approach for single and batch."""
-        if self.debug_enabled:
-            debug(r"_generate_batch_prompts() called", LogArea.BATCH)
+        """Generate multiple prompts in batch using different seeds - unified approach for single and batch.
+        
+        The fields are read and randomized here; the LLM calls run on a worker thread and
+        their results come back through _on_batch_result / _on_batch_finished.
+        """
+        self._dbg("_generate_batch_prompts() called")
+        if self._batch_thread is not None:
+            self._show_status_message("A generation is already running")
+            return
+        # Read once; per-iteration debug messages are only formatted when it is set
+        dbg = self.debug_enabled
         
         # Initialize variables outside try block to avoid UnboundLocalError
         llm_model = None  # No default fallback - let the widget handle it
         model = "seedream"  # Default model
         # Get first available filter as fallback 
-        first_filter = list(self.filter_actions.keys())[0] if self.filter_actions else None
+        first_filter = self._default_filter
         content_rating = first_filter if first_filter else "PG"  # Ultimate fallback
         
         # INFINITE LOOP PROTECTION: Set processing flag (NO navigation)
         self._generating_prompt = True
         
-        if self.debug_enabled:
-            debug(r"Staying on current position during generation", LogArea.BATCH)
+        self._dbg("Staying on current position during generation")
         
         try:
             # Log the generation attempt
@@ -1600,43 +2229,40 @@ class MainWindow(QMainWindow):
                 # Actual batch processing
                 batch_size = self.batch_size_input.value() if hasattr(self, 'batch_size_input') else 5
                 seed_mode = self.seed_mode_combo.currentText() if hasattr(self, 'seed_mode_combo') else "increment"
-                if self.debug_enabled:
-                    debug(r"Batch mode - size: {batch_size}, mode: {seed_mode}", LogArea.BATCH)
+                self._dbg(f"Batch mode - size: {batch_size}, mode: {seed_mode}")
             else:
                 # Single submission treated as batch of 1 with "fixed" seed mode
                 batch_size = 1
                 seed_mode = "fixed"  # Always use current seed unchanged for single submission
-                if self.debug_enabled:
-                    debug(r"Single mode (batch of 1) - size: {batch_size}, mode: {seed_mode}", LogArea.BATCH)
+                self._dbg(f"Single mode (batch of 1) - size: {batch_size}, mode: {seed_mode}")
             
-            base_seed = self.seed_widget.get_value() if hasattr(self, 'seed_widget') else 0
+            base_seed = self.seed_widget.get_value()
             
-            if self.debug_enabled:
-                debug(r"Batch parameters - size: {batch_size}, mode: {seed_mode}, base_seed: {base_seed}", LogArea.BATCH)
+            self._dbg(f"Batch parameters - size: {batch_size}, mode: {seed_mode}, base_seed: {base_seed}")
             
             # Validate that LLM instructions are selected
-            llm_instructions = self.llm_instructions_widget.get_llm_instruction_content() if hasattr(self, 'llm_instructions_widget') else ""
+            llm_instructions = self.llm_instructions_widget.get_llm_instruction_content()
             if not llm_instructions.strip():
-                QMessageBox.warning(self, "LLM Instructions Required", 
+                self._maybe_show_message(QMessageBox.warning, "LLM Instructions Required", 
                     "Please select an LLM instruction from the 'LLM Instructions' field before generating batch prompts.\n\n"
                     "This ensures the LLM knows how to process your prompt data correctly.")
                 self._show_error_message("LLM instructions required")
                 return
             
             # Get LLM model and filters
-            llm_model = self.llm_widget.get_value() if hasattr(self, 'llm_widget') else None
+            llm_model = self.llm_widget.get_value()
             selected_filters = self._get_selected_filters()
             content_rating = selected_filters[0] if selected_filters else first_filter
             
-            if self.debug_enabled:
-                debug(r"Using LLM model: {llm_model}", LogArea.BATCH)
-                debug(r"Using content rating: {content_rating}", LogArea.BATCH)
-                debug(r"Starting batch generation loop for {batch_size} prompts", LogArea.BATCH)
-                debug(r"Batch mode enabled - using concurrent processing with up to 3 workers", LogArea.BATCH)
+            if dbg:
+                self._dbg(f"Using LLM model: {llm_model}")
+                self._dbg(f"Using content rating: {content_rating}")
+                self._dbg(f"Starting batch generation loop for {batch_size} prompts")
+                self._dbg(f"Batch mode enabled - using concurrent processing with up to {_batch_worker_limit()} workers")
             
             # Validate LLM model is available
             if not llm_model:
-                QMessageBox.warning(self, "LLM Model Required", 
+                self._maybe_show_message(QMessageBox.warning, "LLM Model Required", 
                     "Please select an LLM model from the 'LLM Model' field before generating prompts.\n\n"
                     "This is required for AI-powered prompt refinement.")
                 self._show_error_message("LLM model required")
@@ -1646,111 +2272,95 @@ class MainWindow(QMainWindow):
             self._start_progress_tracking(llm_model, "seedream")
             
             # Record start time
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
-            # Generate batch prompts with concurrent requests for better performance
-            import concurrent.futures
-            import threading
-            
-            # Create a thread pool for concurrent API calls
-            max_workers = min(batch_size, 3)  # Limit concurrent requests to prevent overwhelming Ollama
-            if self.debug_enabled:
-                debug(r"Using concurrent processing with {max_workers} workers", LogArea.BATCH)
+            # Limit concurrent requests to what Ollama serves in parallel
+            max_workers = min(batch_size, _batch_worker_limit())
+            self._dbg(f"Using concurrent processing with {max_workers} workers")
             
-            def generate_single_prompt(iteration_data):
-                """Generate a single prompt for concurrent processing."""
-                i, current_seed, prompt_data = iteration_data
-                
-                if self.debug_enabled:
-                    debug(r"Concurrent iteration {i+1} - calling prompt engine.generate_prompt() with model: {llm_model}", LogArea.BATCH)
-                
-                try:
-                    # Generate prompt using the engine - pass the LLM model explicitly
-                    final_prompt = self._get_prompt_engine().generate_prompt(model, prompt_data, content_rating, self.debug_enabled, llm_model)
+            # Prepare all prompt data for concurrent processing
+            iteration_data_list = []
+            # Memoize randomized field values per seed while building the batch
+            self._randomized_values_memo = {}
+            try:
+                for i, current_seed in enumerate(_batch_seeds(seed_mode, base_seed, batch_size)):
+                    if dbg:
+                        self._dbg(f"Starting iteration {i+1}/{batch_size}")
+                        self._dbg(f"Iteration {i+1} - calculated seed: {current_seed}")
                     
-                    if self.debug_enabled:
-                        debug(r"Concurrent iteration {i+1} - received final prompt (length: {len(final_prompt)})", LogArea.BATCH)
+                    # Create PromptData object with current seed
+                    prompt_data = PromptData(**self._randomized_field_values(current_seed),
+                                             llm_instructions=llm_instructions)
                     
-                    return i, final_prompt, current_seed, None
-                except Exception as e:
-                    if self.debug_enabled:
-                        debug(r"Concurrent iteration {i+1} - error: {str(e)}", LogArea.BATCH)
-                    return i, None, current_seed, str(e)
+                    # Add to iteration data list for concurrent processing
+                    iteration_data_list.append((i, current_seed, prompt_data))
+            finally:
+                self._randomized_values_memo = None
+            
+            # Workers only read the cached "Ollama running" state, so refresh it here
+            self._is_ollama_running()
+            
+            # Hand the LLM calls to a worker thread so the window stays responsive.
+            # History entries are built from the fields as they were when the batch started.
+            self._batch_run = {
+                "results": [],
+                "completed": 0,
+                "batch_size": batch_size,
+                "ui_every": max(1, batch_size // 20),  # Touch the status bar ~20 times per batch
+                "start_time": start_time,
+                "llm_model": llm_model,
+                "base_state": self.capture_current_state(),
+                "dbg": dbg,
+            }
+            worker = _BatchWorker(self._get_prompt_engine(), model, content_rating, llm_model,
+                                  iteration_data_list, max_workers, dbg)
+            thread = QThread(self)
+            worker.moveToThread(thread)
+            thread.started.connect(worker.run)
+            worker.result_ready.connect(self._on_batch_result)
+            worker.batch_finished.connect(self._on_batch_finished)
+            worker.batch_finished.connect(thread.quit)
+            thread.finished.connect(worker.deleteLater)
+            thread.finished.connect(thread.deleteLater)
+            self._batch_worker = worker
+            self._batch_thread = thread
+            self.generate_button.setEnabled(False)
+            thread.start()
             
-            # Prepare all prompt data for concurrent processing
-            iteration_data_list = []
-            for i in range(batch_size):
-                if self.debug_enabled:
-                    debug(r"Starting iteration {i+1}/{batch_size}", LogArea.BATCH)
-                
-                # Calculate seed for this iteration
-                if seed_mode == "fixed":
-                    current_seed = base_seed
-                elif seed_mode == "increment":
-                    current_seed = base_seed + i
-                elif seed_mode == "decrement":
-                    current_seed = max(0, base_seed - i)  # Clamp to 0 minimum
-                elif seed_mode == "randomize":
-                    import random
-                    random.seed(base_seed + i)  # Use base_seed + i as seed for reproducible randomness
-                    current_seed = random.randint(0, 999999)
-                else:
-                    current_seed = base_seed + i  # Default to increment
-                
-                if self.debug_enabled:
-                    debug(r"Iteration {i+1} - calculated seed: {current_seed}", LogArea.BATCH)
-                
-                # Create PromptData object with current seed
-                prompt_data = PromptData(
-                    style=self.style_widget.get_randomized_value(current_seed) if hasattr(self, 'style_widget') else "",
-                    setting=self.setting_widget.get_randomized_value(current_seed) if hasattr(self, 'setting_widget') else "",
-                    weather=self.weather_widget.get_randomized_value(current_seed) if hasattr(self, 'weather_widget') else "",
-                    date_time=self.datetime_widget.get_randomized_value(current_seed) if hasattr(self, 'datetime_widget') else "",
-                    subjects=self.subjects_widget.get_randomized_value(current_seed) if hasattr(self, 'subjects_widget') else "",
-                    pose_action=self.pose_widget.get_randomized_value(current_seed) if hasattr(self, 'pose_widget') else "",
-                    camera=self.camera_widget.get_randomized_value(current_seed) if hasattr(self, 'camera_widget') else "",
-                    framing_action=self.framing_widget.get_randomized_value(current_seed) if hasattr(self, 'framing_widget') else "",
-                    grading=self.grading_widget.get_randomized_value(current_seed) if hasattr(self, 'grading_widget') else "",
-                    details=self.details_widget.get_randomized_value(current_seed) if hasattr(self, 'details_widget') else "",
-                    llm_instructions=llm_instructions
-                )
-                
-                # Add to iteration data list for concurrent processing
-                iteration_data_list.append((i, current_seed, prompt_data))
-            
-            # Process all prompts concurrently
-            results = []
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all tasks
-                future_to_iteration = {executor.submit(generate_single_prompt, data): data[0] for data in iteration_data_list}
-                
-                # Collect results as they complete
-                completed_count = 0
-                for future in concurrent.futures.as_completed(future_to_iteration):
-                    iteration_num = future_to_iteration[future]
-                    try:
-                        i, final_prompt, current_seed, error = future.result()
-                        results.append((i, final_prompt, current_seed, error))
-                        
-                        completed_count += 1
-                        progress = completed_count / batch_size * 100
-                        self.status_label.setText(f"Batch progress: {progress:.0f}% ({completed_count}/{batch_size})")
-                        self._show_status_message(f"Generated {completed_count}/{batch_size} prompts...")
-                        
-                        if error:
-                            if self.debug_enabled:
-                                debug(r"Iteration {i+1} - failed with error: {error}", LogArea.BATCH)
-                        else:
-                            if self.debug_enabled:
-                                debug(r"Iteration {i+1} - final prompt: '{final_prompt[:200]}{'...' if len(final_prompt) > 200 else ''}'", LogArea.BATCH)
-                            
-                            # Save to history with final prompt (each gets individual history entry)
-                            self._save_to_history(final_prompt, "", current_seed)
-                            
-                    except Exception as e:
-                        if self.debug_enabled:
-                            debug(r"Iteration {iteration_num+1} - unexpected error: {str(e)}", LogArea.BATCH)
-                        results.append((iteration_num, None, None, str(e)))
+        except Exception as e:
+            self._on_generation_error(e)
+    
+    def _on_batch_result(self, i, final_prompt, current_seed, error):
+        """Store one finished prompt from the batch worker (GUI thread)."""
+        run = self._batch_run
+        if run is None:
+            return
+        run["results"].append((i, final_prompt, current_seed, error))
+        run["completed"] += 1
+        completed_count, batch_size = run["completed"], run["batch_size"]
+        if completed_count % run["ui_every"] == 0 or completed_count == batch_size:
+            self._set_status(f"Generated {completed_count}/{batch_size} prompts...")
+        
+        if error:
+            if run["dbg"]:
+                self._dbg(f"Iteration {i+1} - failed with error: {error}")
+        else:
+            if run["dbg"]:
+                self._dbg(f"Iteration {i+1} - final prompt: '{final_prompt[:200]}{'...' if len(final_prompt) > 200 else ''}'")
+    
+    def _on_batch_finished(self):
+        """Wrap up a batch once the worker has handled every prompt (GUI thread)."""
+        run = self._batch_run
+        self._batch_run = None
+        self._batch_worker = None
+        self._batch_thread = None
+        self.generate_button.setEnabled(True)
+        if run is None:
+            return
+        
+        try:
+            batch_size = run["batch_size"]
+            results = run["results"]
             
             # Sort results by iteration number to maintain order
             results.sort(key=lambda x: x[0])
@@ -1760,18 +2370,21 @@ class MainWindow(QMainWindow):
             if errors:
                 error_messages = [f"Iteration {r[0]+1}: {r[3]}" for r in errors]
                 error_summary = "; ".join(error_messages)
-                if self.debug_enabled:
-                    debug(r"Batch completed with errors: {error_summary}", LogArea.BATCH)
+                self._dbg(f"Batch completed with errors: {error_summary}")
+            
+            # Save all prompts to history at once (each gets an individual history entry, in completion order)
+            base_state = run["base_state"]
+            self.history_manager.save_batch([self._history_state(final_prompt, current_seed, base_state)
+                                             for _, final_prompt, current_seed, error in results if error is None])
             
             # Calculate total generation time
-            generation_time = (datetime.now() - start_time).total_seconds()
+            generation_time = time.perf_counter() - run["start_time"]
             
-            if self.debug_enabled:
-                debug(r"Generation completed - {batch_size} prompts in {generation_time:.2f}s", LogArea.BATCH)
+            self._dbg(f"Generation completed - {batch_size} prompts in {generation_time:.2f}s")
             
             # Log successful generation
             if self.logger:
-                self.logger.log_gui_action("Generate prompts", f"Success - {generation_time:.2f}s - {batch_size} prompts - Model: {llm_model}")
+                self.logger.log_gui_action("Generate prompts", f"Success - {generation_time:.2f}s - {batch_size} prompts - Model: {run['llm_model']}")
             
             # Stop progress tracking
             self._stop_progress_tracking(generation_time)
@@ -1794,26 +2407,36 @@ class MainWindow(QMainWindow):
                 self._show_status_message(f"Prompt generated successfully in {generation_time:.2f}s")
             else:
                 self._show_status_message(f"Batch generation completed: {batch_size} prompts in {generation_time:.2f}s (concurrent processing)")
-            
         except Exception as e:
-            # Stop progress tracking on error
-            self._stop_progress_tracking()
-            
-            # INFINITE LOOP PROTECTION: Clear processing flag on error
-            self._generating_prompt = False
-            self._just_finished_generation = False
-            
-            if self.debug_enabled:
-                debug(r"Error in generation: {str(e)}", LogArea.BATCH)
-            
-            # Log the error
-            if self.logger:
-                self.logger.log_error(f"Failed to generate prompts: {str(e)}", "Generate prompts")
-            
-            QMessageBox.critical(self, "Error", f"Failed to generate prompts: {str(e)}")
-            self._show_error_message(f"Failed to generate prompts: {str(e)}")
+            self._on_generation_error(e)
+        
+        # Log process state after generation
+        info("=== After Prompt Generation ===", LogArea.OLLAMA)
+        self._get_ollama_process_info()
+    
+    def _on_generation_error(self, e):
+        """Reset generation state and report a failed generation."""
+        err_str = str(e)
+        
+        # Stop progress tracking on error
+        self._stop_progress_tracking()
+        
+        # INFINITE LOOP PROTECTION: Clear processing flag on error
+        self._generating_prompt = False
+        self._just_finished_generation = False
+        
+        if self.debug_enabled:
+            debug(f"Error in generation: {err_str}", LogArea.BATCH)
             import traceback
             traceback.print_exc()  # For debugging
+        
+        # Log the error
+        if self.logger:
+            self.logger.log_error(f"Failed to generate prompts: {err_str}", "Generate prompts")
+        
+        message = f"Failed to generate prompts: {err_str}"
+        self._maybe_show_message(QMessageBox.critical, "Error", message)
+        self._show_error_message(message)
     
     def _set_theme(self, theme_name):
         """Set the application theme."""
@@ -1839,8 +2462,7 @@ class MainWindow(QMainWindow):
             self._refresh_tag_containers()
             
             # Refresh batch controls styling to new theme
-            if hasattr(self, '_apply_batch_styling'):
-                self._apply_batch_styling()
+            self._apply_batch_styling()
             
             # Log the theme change
             if self.logger:
@@ -1866,24 +2488,24 @@ class MainWindow(QMainWindow):
     
     def _refresh_tag_containers(self):
         """Refresh all tag containers when theme changes."""
-        tag_widgets = [
-            self.style_widget, self.setting_widget, self.weather_widget,
-            self.datetime_widget, self.subjects_widget, self.pose_widget,
-            self.camera_widget, self.framing_widget, self.grading_widget,
-            self.details_widget, self.llm_instructions_widget
-        ]
-        
-        for widget in tag_widgets:
+        for widget in self._tag_widgets_with_llm:
             if hasattr(widget, 'tag_input') and hasattr(widget.tag_input, 'refresh_theme'):
                 widget.tag_input.refresh_theme()
         
         # Refresh seed widget buttons
-        if hasattr(self, 'seed_widget') and hasattr(self.seed_widget, 'refresh_theme'):
-            self.seed_widget.refresh_theme()
+        self.seed_widget.refresh_theme()
+    
+    def _bind_debug_logging(self):
+        """Point self._dbg at the batch debug logger, or at a no-op when debug is off."""
+        if self.debug_enabled:
+            self._dbg = lambda msg: debug(msg, LogArea.BATCH)
+        else:
+            self._dbg = lambda msg: None
     
     def _toggle_debug_mode(self):
         """Toggle debug mode."""
         self.debug_enabled = self.debug_action.isChecked()
+        self._bind_debug_logging()
         status = "enabled" if self.debug_enabled else "disabled"
         self._show_status_message(f"Debug mode {status}")
     
@@ -1891,19 +2513,22 @@ class MainWindow(QMainWindow):
         """Open the debug folder."""
         debug_folder = self.user_data_dir / "debug"
         if debug_folder.exists():
-            os.startfile(str(debug_folder))  # Windows-specific
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(debug_folder)))
         else:
-            QMessageBox.information(self, "Debug Folder", "No debug folder found.")
+            self._maybe_show_message(QMessageBox.information, "Debug Folder", "No debug folder found.")
     
     def _clear_generation_cache(self):
         """Clear the generation cache."""
         try:
-            # Clear the cache dictionary
-            self.generation_times = {}
+            # Clear the cache dictionary and drop any pending save
+            self._generation_times = OrderedDict()
+            self._generation_times_stamp = None
+            self._generation_json_fragments = {}
+            self._cache_save_timer.stop()
+            self._cache_dirty = False
             
-            # Remove the cache file
-            if self.generation_cache_file.exists():
-                self.generation_cache_file.unlink()
+            # Remove the cache file; saves still queued on the pool must not restore it
+            _JsonSaveTask.discard(self._generation_cache_path_str)
             
             self._show_status_message("Generation cache cleared")
         except Exception as e:
@@ -1912,9 +2537,6 @@ class MainWindow(QMainWindow):
     def _reload_snippets(self):
         """Reload snippets from files."""
         try:
-            # Import snippet manager
-            from ..utils.snippet_manager import snippet_manager
-            
             # Reload snippets
             snippet_manager.reload_snippets()
             
@@ -1924,8 +2546,8 @@ class MainWindow(QMainWindow):
             # Refresh existing tags to check if they're still missing
             self._refresh_existing_tags()
             
-            # Recreate filter menus completely instead of trying to refresh them
-            self._recreate_filter_menus()
+            # Add/remove filter menu entries for filters that appeared or disappeared
+            self._sync_filter_menus()
             
             self._show_status_message("Snippets reloaded successfully.")
         except Exception as e:
@@ -1935,7 +2557,7 @@ class MainWindow(QMainWindow):
         """Refresh existing tags to check if they're still missing after snippet reload."""
         try:
             # Skip during template loading to avoid cascades
-            if hasattr(self, '_loading_template') and self._loading_template:
+            if self._loading_template:
                 if self.debug_enabled:
                     debug(r"Skipping _refresh_existing_tags during template loading", LogArea.REFRESH)
                 return
@@ -1943,30 +2565,13 @@ class MainWindow(QMainWindow):
             selected_filters = self._get_selected_filters()
             debug(r"Current filters: {selected_filters}", LogArea.REFRESH)
             
-            # Get all tag field widgets
-            tag_widgets = [
-                self.style_widget, self.setting_widget, self.weather_widget,
-                self.datetime_widget, self.subjects_widget, self.pose_widget,
-                self.camera_widget, self.framing_widget, self.grading_widget,
-                self.details_widget
-            ]
-            
-            debug(r"Found {len(tag_widgets)} tag widgets", LogArea.REFRESH)
-            
-            refresh_count = 0
-            for i, widget in enumerate(tag_widgets):
-                if widget is None:
-                    debug(r"Widget {i} is None", LogArea.REFRESH)
-                    continue
-                debug(r"Checking widget {i} - {type(widget).__name__} - has refresh_tags: {hasattr(widget, 'refresh_tags')}", LogArea.REFRESH)
-                if hasattr(widget, 'refresh_tags'):
-                    debug(r"Refreshing widget {i} - {type(widget).__name__}", LogArea.REFRESH)
+            # Refresh every tag field with field signals blocked, so a refresh can't fan out
+            # into one preview update per widget
+            with self._block_field_signals():
+                for widget in self._tag_widgets:
                     widget.refresh_tags()
-                    refresh_count += 1
-                else:
-                    debug(r"Widget {i} - {type(widget).__name__} does NOT have refresh_tags method", LogArea.REFRESH)
             
-            debug(r"Refreshed {refresh_count} tag widgets", LogArea.REFRESH)
+            debug(f"Refreshed {len(self._tag_widgets)} tag widgets", LogArea.REFRESH)
                     
         except Exception as e:
             import traceback
@@ -1976,161 +2581,110 @@ class MainWindow(QMainWindow):
     
     def _refresh_snippet_popups(self):
         """Refresh any open snippet popups."""
-        # Find and refresh any open snippet popups
-        for widget in self.findChildren(QWidget):
-            if hasattr(widget, 'refresh_snippets') and callable(widget.refresh_snippets):
-                try:
-                    # Get current selected filters for this popup
-                    if hasattr(widget, 'selected_filters'):
-                        widget.refresh_snippets(widget.selected_filters)
-                except Exception as e:
-                    error(r"refreshing snippet popup: {e}", LogArea.ERROR)
-            elif hasattr(widget, 'refresh_theme') and callable(widget.refresh_theme):
-                try:
-                    widget.refresh_theme()
-                except Exception as e:
-                    error(r"refreshing popup theme: {e}", LogArea.ERROR)
-    
-    def _recreate_filter_menus(self):
-        """Completely recreate the filter menus with updated available filters."""
+        # Popups register themselves in open_snippet_popups when shown; drop the closed ones
+        open_popups = []
+        for popup in self.open_snippet_popups:
+            if not popup.isVisible():
+                continue
+            open_popups.append(popup)
+            try:
+                # Refresh with the filters this popup was opened with
+                popup.refresh_snippets(popup.selected_filters)
+            except Exception as e:
+                error(f"refreshing snippet popup: {e}", LogArea.ERROR)
+        self.open_snippet_popups = open_popups
+    
+    def _create_filter_action_group(self):
+        """Create a fresh non-exclusive action group routing all filter toggles to one slot."""
+        old_group = getattr(self, 'filter_action_group', None)
+        if old_group is not None:
+            old_group.deleteLater()
+        self.filter_action_group = QActionGroup(self)
+        self.filter_action_group.setExclusive(False)
+        self.filter_action_group.triggered.connect(self._on_filter_action)
+    
+    def _new_filter_action(self, filter_name, checked=False):
+        """Create a checkable filter action, register it and return it (not yet in a menu)."""
+        action = QAction(filter_name, self)
+        # The filter name travels with the action, independent of its display text
+        action.setData(filter_name)
+        action.setCheckable(True)
+        action.setChecked(checked)
+        action.toggled.connect(self._invalidate_selected_filters)
+        self.filter_action_group.addAction(action)
+        self.filter_actions[filter_name] = action
+        return action
+    
+    def _sync_filter_menus(self):
+        """Bring the Filters menu in line with the available filters, touching only what changed."""
         try:
-            from ..utils.snippet_manager import snippet_manager
-            
             # Get updated available filters
             available_filters = snippet_manager.get_available_filters()
             filters = available_filters if available_filters else ["PG"]  # Fallback for empty case
-            
-            # Find the Filters menu
-            menubar = self.menuBar()
-            if not menubar:
-                warning(r"No menubar found", LogArea.GENERAL)
+            if filters == self._available_filters:
                 return
-                
-            # Find and remove the existing Filters menu
-            filters_action = None
-            filters_index = -1
-            for i, action in enumerate(menubar.actions()):
-                if action.text() == "Filters":
-                    filters_action = action
-                    filters_index = i
-                    break
-            
-            if filters_action:
-                menubar.removeAction(filters_action)
-            
-            # Create a new Filters menu
-            filters_menu = QMenu("Filters", self)
-            
-            # Clear the filter actions dictionary
-            self.filter_actions.clear()
-            
-            # Add filter actions
-            for filter_name in filters:
-                try:
-                    action = QAction(filter_name, self)
-                    action.setCheckable(True)
-                    if filter_name == filters[0]:  # Default to first available filter
-                        action.setChecked(True)
-                    action.triggered.connect(lambda checked, f=filter_name: self._on_filter_changed(f, checked))
-                    filters_menu.addAction(action)
-                    self.filter_actions[filter_name] = action
-                except Exception as e:
-                    error(r"adding filter action {filter_name}: {e}", LogArea.ERROR)
-            
-            # Add the new menu to the menubar at the original position
-            if filters_index >= 0:
-                # Insert at the original position
-                menubar.insertMenu(menubar.actions()[filters_index], filters_menu)
-            else:
-                # Fallback: add to the end
-                menubar.addMenu(filters_menu)
+            self._available_filters = filters
+            
+            # Remove filters that no longer exist
+            for filter_name in set(self.filter_actions) - set(filters):
+                action = self.filter_actions.pop(filter_name)
+                self.filters_menu.removeAction(action)
+                self.filter_action_group.removeAction(action)
+                action.deleteLater()
+            
+            # Add new filters in snippet order; existing actions keep their check state
+            new_actions = {}
+            next_action = None
+            for filter_name in reversed(filters):
+                action = self.filter_actions.get(filter_name)
+                if action is None:
+                    action = self._new_filter_action(filter_name)
+                    self.filters_menu.insertAction(next_action, action)
+                new_actions[filter_name] = action
+                next_action = action
+            self.filter_actions = dict(reversed(new_actions.items()))
+            
+            # Default to first available filter if the checked ones were removed
+            if not any(action.isChecked() for action in self.filter_actions.values()):
+                self.filter_actions[filters[0]].setChecked(True)
+            self._reset_filter_cache()
                     
         except Exception as e:
-            error(r"recreating filter menus: {e}", LogArea.ERROR)
+            error(f"updating filter menus: {e}", LogArea.ERROR)
     
-    def _refresh_filter_menus(self):
-        """Refresh the filter menus with updated available filters."""
-        try:
-            from ..utils.snippet_manager import snippet_manager
-            
-            # Get updated available filters
-            available_filters = snippet_manager.get_available_filters()
-            filters = available_filters if available_filters else ["PG"]  # Fallback for empty case
-            
-            # Find the Filters menu - be more defensive about menu access
-            menubar = self.menuBar()
-            if not menubar:
-                warning(r"No menubar found", LogArea.GENERAL)
-                return
-                
-            filters_menu = None
-            for action in menubar.actions():
-                if action.text() == "Filters":
-                    filters_menu = action.menu()
-                    break
-            
-            if not filters_menu:
-                warning(r"Filters menu not found", LogArea.GENERAL)
-                return
-                
-            # Check if menu is still valid
-            if not filters_menu.isWidgetType():
-                warning(r"Filters menu is not a valid widget", LogArea.GENERAL)
-                return
-            
-            # Clear existing filter actions
-            try:
-                filters_menu.clear()
-                self.filter_actions.clear()
-            except Exception as e:
-                error(r"clearing filter menu: {e}", LogArea.ERROR)
-                return
-                
-            # Add updated filter actions
-            for filter_name in filters:
-                try:
-                    action = QAction(filter_name, self)
-                    action.setCheckable(True)
-                    if filter_name == filters[0]:  # Default to first available filter
-                        action.setChecked(True)
-                    action.triggered.connect(lambda checked, f=filter_name: self._on_filter_changed(f, checked))
-                    filters_menu.addAction(action)
-                    self.filter_actions[filter_name] = action
-                except Exception as e:
-                    error(r"adding filter action {filter_name}: {e}", LogArea.ERROR)
-                    
-        except Exception as e:
-            error(r"refreshing filter menus: {e}", LogArea.ERROR)
+    def _randomized_field_values(self, seed: int) -> Dict[str, str]:
+        """Return each prompt field's randomized value for seed, keyed by PromptData field name.
+        
+        While a batch is being prepared the results are memoized per seed, so repeated seeds
+        (e.g. "fixed" mode) resolve their snippets only once.
+        """
+        memo = self._randomized_values_memo
+        if memo is not None and seed in memo:
+            return memo[seed]
+        values = {key: widget.get_randomized_value(seed) for key, _, widget in self._prompt_field_widgets}
+        if memo is not None:
+            memo[seed] = values
+        return values
+    
+    def _preview_from_prompt_data(self, prompt_data: PromptData) -> str:
+        """Format already-randomized prompt data as preview text (non-empty fields only)."""
+        preview_lines = []
+        append = preview_lines.append
+        for key, label, _ in self._prompt_field_widgets:
+            value = getattr(prompt_data, key)
+            value = value.strip() if value else ""
+            if value:  # Only include non-empty fields
+                append(label + ": " + value)
+        
+        # Empty preview will show placeholder
+        return "\n".join(preview_lines)
     
     def _generate_preview_text_with_seed(self, seed: int) -> str:
         """Generate preview text from current field values using a specific seed."""
         try:
             # Collect randomized field values using the provided seed
-            field_values = {
-                "Style": self.style_widget.get_randomized_value(seed) if hasattr(self, 'style_widget') else "",
-                "Setting": self.setting_widget.get_randomized_value(seed) if hasattr(self, 'setting_widget') else "",
-                "Weather": self.weather_widget.get_randomized_value(seed) if hasattr(self, 'weather_widget') else "",
-                "Date/Time": self.datetime_widget.get_randomized_value(seed) if hasattr(self, 'datetime_widget') else "",
-                "Subjects": self.subjects_widget.get_randomized_value(seed) if hasattr(self, 'subjects_widget') else "",
-                "Pose/Action": self.pose_widget.get_randomized_value(seed) if hasattr(self, 'pose_widget') else "",
-                "Camera": self.camera_widget.get_randomized_value(seed) if hasattr(self, 'camera_widget') else "",
-                "Framing/Action": self.framing_widget.get_randomized_value(seed) if hasattr(self, 'framing_widget') else "",
-                "Color/Mood": self.grading_widget.get_randomized_value(seed) if hasattr(self, 'grading_widget') else "",
-                "Details": self.details_widget.get_randomized_value(seed) if hasattr(self, 'details_widget') else "",
-            }
-            
-            # Build preview text - only include fields with values
-            preview_lines = []
-            for field, value in field_values.items():
-                if value.strip():  # Only include non-empty fields
-                    preview_lines.append(f"{field}: {value}")
-            
-            # Generate preview text
-            if preview_lines:
-                return "\n".join(preview_lines)
-            else:
-                return ""  # Empty preview will show placeholder
-                
+            prompt_data = PromptData(**self._randomized_field_values(seed))
+            return self._preview_from_prompt_data(prompt_data)
         except Exception as e:
             if self.logger:
                 self.logger.log_error(f"Error generating preview text with seed {seed}: {e}")
@@ -2140,7 +2694,7 @@ class MainWindow(QMainWindow):
         """Generate preview text from current field values."""
         try:
             # Get current seed for randomization
-            seed = self.seed_widget.get_value() if hasattr(self, 'seed_widget') else 0
+            seed = self._get_current_seed()
             
             # Use the seed-specific method
             return self._generate_preview_text_with_seed(seed)
@@ -2152,14 +2706,14 @@ class MainWindow(QMainWindow):
 
     def _update_preview(self, preserve_tab: bool = False, force_update: bool = False):
         """Live preview disabled; maintain cache and navigation only."""
-        if not hasattr(self, 'preview_panel'):
+        if not self._widgets_ready:
             return
         # Handle history edits: keep smart jump/cache behavior, skip text generation
         # Skip smart jump logic if this is a forced update or if we're in the middle of state restoration
         if self.debug_enabled:
-            debug(r"_update_preview called with force_update={force_update}, _restoring_state={getattr(self, '_restoring_state', False)}, _intentionally_navigating={getattr(self, '_intentionally_navigating', False)}", LogArea.NAVIGATION)
+            debug(r"_update_preview called with force_update={force_update}, _restoring_state={self._restoring_state}, _intentionally_navigating={self._intentionally_navigating}", LogArea.NAVIGATION)
         
-        if not force_update and not (hasattr(self, '_restoring_state') and self._restoring_state) and not (hasattr(self, '_intentionally_navigating') and self._intentionally_navigating):
+        if not force_update and not self._restoring_state and not self._intentionally_navigating:
             current_pos, total_count = self.history_manager.get_navigation_info()
             if self.debug_enabled:
                 info(r"DEBUG NAV: _update_preview at position {current_pos}/{total_count}", LogArea.GENERAL)
@@ -2192,8 +2746,13 @@ class MainWindow(QMainWindow):
         # Update summary text with raw prompt preview (non-realized)
         try:
             prompt_data = self._get_current_prompt_data()
+            # Skip the rebuild and restyle when the fields are unchanged since the last render
+            preview_key = tuple(getattr(prompt_data, key) for key, _, _ in self._prompt_field_widgets)
+            if preview_key == self._last_preview_key and not force_update:
+                return
             raw_preview = self._get_prompt_engine().get_prompt_preview(prompt_data)
             self.preview_panel.set_summary_text(raw_preview)
+            self._last_preview_key = preview_key
         except Exception as e:
             debug(f"Failed to update summary preview: {e}", LogArea.GENERAL)
         
@@ -2209,24 +2768,23 @@ class MainWindow(QMainWindow):
     
     def _update_llm_status(self):
         """Update LLM status (now called lazily after startup)."""
-        llm_start = time.time()
+        llm_start = time.perf_counter()
         # This will be called after the window is shown
         if hasattr(self, 'llm_widget'):
             # Trigger LLM connection check in background
             from PySide6.QtCore import QTimer
             QTimer.singleShot(0, self.llm_widget._check_ollama_connection)
         
-        llm_time = time.time() - llm_start
+        llm_time = time.perf_counter() - llm_start
         if self.debug_enabled:
             info(f"STARTUP: _update_llm_status took {llm_time:.3f}s", LogArea.GENERAL)
     
     def _check_ui_responsiveness(self):
         """Check when UI becomes responsive after all initialization."""
-        if hasattr(self, '_startup_start_time'):
-            total_time = time.time() - self._startup_start_time
-            if self.debug_enabled:
-                info(f"STARTUP: UI responsiveness check at {total_time:.3f}s", LogArea.GENERAL)
-                info(f"STARTUP: Window is now responsive and usable", LogArea.GENERAL)
+        total_time = time.perf_counter() - self._startup_start_time
+        if self.debug_enabled:
+            info(f"STARTUP: UI responsiveness check at {total_time:.3f}s", LogArea.GENERAL)
+            info(f"STARTUP: Window is now responsive and usable", LogArea.GENERAL)
     
     def _initialize_snippet_dropdowns(self):
         """Initialize snippet dropdowns with current content rating."""
@@ -2248,7 +2806,7 @@ class MainWindow(QMainWindow):
     
     def _on_llm_changed(self, llm_name):
         """Handle LLM selection changes."""
-        if (hasattr(self, '_restoring_state') and self._restoring_state) or (hasattr(self, '_loading_template') and self._loading_template):
+        if self._restoring_state or self._loading_template:
             return
         # Update preview panel LLM info (if preview panel exists)
         if hasattr(self, 'preview_panel'):
@@ -2258,35 +2816,47 @@ class MainWindow(QMainWindow):
         self._schedule_preview_update()
     
     def _get_selected_filters(self):
-        """Get list of currently selected filters."""
-        selected = []
-        for filter_name, action in self.filter_actions.items():
-            if action.isChecked():
-                selected.append(filter_name)
-        return selected  # Return empty list if none selected - no default fallback
+        """Get list of currently selected filters.
+        
+        The list is cached until a filter action toggles; callers must not modify it.
+        """
+        if self._selected_filters_cache is None:
+            self._selected_filters_cache = [filter_name for filter_name, action in self.filter_actions.items()
+                                            if action.isChecked()]
+        return self._selected_filters_cache  # Empty list if none selected - no default fallback
+    
+    def _invalidate_selected_filters(self, *_):
+        """Drop the cached selected filters so the next lookup re-reads the actions."""
+        self._selected_filters_cache = None
+    
+    def _reset_filter_cache(self):
+        """Refresh filter caches after the filter actions have been rebuilt."""
+        self._selected_filters_cache = None
+        self._default_filter = next(iter(self.filter_actions), None)
     
     def _set_selected_filters(self, filters):
         """Set the selected filters."""
-        # Block QAction signals while we change checks
-        for _, action in self.filter_actions.items():
-            if hasattr(action, 'blockSignals'):
-                action.blockSignals(True)
+        actions = self.filter_actions
         try:
-            # Reset all filters first
-            for filter_name, action in self.filter_actions.items():
-                action.setChecked(False)
-            # Set filters from list
-            for filter_name in filters:
-                if filter_name in self.filter_actions:
-                    self.filter_actions[filter_name].setChecked(True)
+            # Block QAction signals while we change checks
+            with ExitStack() as blockers:
+                for action in actions.values():
+                    blockers.enter_context(QSignalBlocker(action))
+                # Reset all filters first
+                for action in actions.values():
+                    action.setChecked(False)
+                # Set filters from list
+                for filter_name in filters:
+                    action = actions.get(filter_name)
+                    if action is not None:
+                        action.setChecked(True)
         finally:
-            for _, action in self.filter_actions.items():
-                if hasattr(action, 'blockSignals'):
-                    action.blockSignals(False)
+            # toggled was blocked above, so invalidate by hand
+            self._invalidate_selected_filters()
     
     def _on_seed_changed(self):
         """Handle seed value changes."""
-        if (hasattr(self, '_restoring_state') and self._restoring_state) or (hasattr(self, '_loading_template') and self._loading_template):
+        if self._restoring_state or self._loading_template:
             return
         # Update preview with new randomization
         self._schedule_preview_update()
@@ -2294,9 +2864,13 @@ class MainWindow(QMainWindow):
         # Save seed in preferences if needed
         self._save_preferences()
     
+    def _on_filter_action(self, action):
+        """Handle a filter action toggled through the filter action group."""
+        self._on_filter_changed(action.data(), action.isChecked())
+    
     def _on_filter_changed(self, filter_name, checked):
         """Handle filter selection changes."""
-        if (hasattr(self, '_restoring_state') and self._restoring_state) or (hasattr(self, '_loading_template') and self._loading_template):
+        if self._restoring_state or self._loading_template:
             return
         # Log the filter change
         if self.logger:
@@ -2327,7 +2901,7 @@ class MainWindow(QMainWindow):
         prompt_text = self.preview_panel.get_current_text()
         
         if not prompt_text:
-            QMessageBox.warning(self, "No Prompt", "No prompt to copy. Please generate a prompt first.")
+            self._maybe_show_message(QMessageBox.warning, "No Prompt", "No prompt to copy. Please generate a prompt first.")
             return
         
         # Copy to clipboard
@@ -2335,7 +2909,7 @@ class MainWindow(QMainWindow):
         clipboard = QApplication.clipboard()
         clipboard.setText(prompt_text)
         
-        QMessageBox.information(self, "Success", "Prompt copied to clipboard!")
+        self._maybe_show_message(QMessageBox.information, "Success", "Prompt copied to clipboard!")
         self._show_status_message("Prompt copied to clipboard")
     
     def _update_snippet_filters(self):
@@ -2351,70 +2925,69 @@ class MainWindow(QMainWindow):
         """Refresh all currently open snippet popups."""
         selected_filters = self._get_selected_filters()
         
-        # Remove closed popups from the list
-        self.open_snippet_popups = [popup for popup in self.open_snippet_popups if popup.isVisible()]
-        
-        # Refresh each open popup
+        # Refresh each open popup and drop closed ones in the same pass
+        open_popups = []
         for popup in self.open_snippet_popups:
-            popup.refresh_snippets(selected_filters)
+            if popup.isVisible():
+                popup.refresh_snippets(selected_filters)
+                open_popups.append(popup)
+        self.open_snippet_popups = open_popups
     
     def _setup_callbacks(self):
         """Set up all callbacks after widgets are created."""
-        callbacks_start = time.time()
-        
-        # Initialize field_widgets dictionary for caching
-        self.field_widgets = {}
-        field_names = ['style', 'setting', 'weather', 'datetime', 'subjects', 'pose', 'camera', 'framing', 'grading', 'details', 'llm_instructions', 'seed']
-        
-        for field_name in field_names:
-            widget_attr = f'{field_name}_widget'
-            if hasattr(self, widget_attr):
-                self.field_widgets[field_name] = getattr(self, widget_attr)
+        callbacks_start = time.perf_counter()
+        
+        # Per-field capture/restore callables, resolved once so state capture and
+        # restoration don't probe every widget with hasattr on each call
+        self._field_value_getters = {}
+        self._field_value_setters = {}
+        self._field_tag_getters = {}
+        self._field_tag_dict_getters = {}
+        self._field_tag_setters = {}
+        for field_key, widget in self.field_widgets.items():
+            if hasattr(widget, 'get_value'):
+                self._field_value_getters[field_key] = widget.get_value
+            elif hasattr(widget, 'toPlainText'):
+                self._field_value_getters[field_key] = widget.toPlainText
+            if hasattr(widget, 'set_value'):
+                self._field_value_setters[field_key] = widget.set_value
+            elif hasattr(widget, 'setPlainText'):
+                self._field_value_setters[field_key] = widget.setPlainText
+            if hasattr(widget, 'get_tags'):
+                self._field_tag_getters[field_key] = widget.get_tags
+            if hasattr(widget, 'get_tag_dicts'):
+                self._field_tag_dict_getters[field_key] = widget.get_tag_dicts
+            if hasattr(widget, 'set_tags'):
+                self._field_tag_setters[field_key] = widget.set_tags
         
         # Set up debounced preview update timer (Qt best practice)
         self._preview_update_timer = QTimer()
         self._preview_update_timer.setSingleShot(True)
         self._preview_update_timer.timeout.connect(self._update_preview)
+        # Forced refresh after a history restore; restarting it coalesces rapid navigation
+        self._restore_preview_timer = QTimer(self)
+        self._restore_preview_timer.setSingleShot(True)
+        self._restore_preview_timer.setInterval(100)
+        self._restore_preview_timer.timeout.connect(self._refresh_preview_after_restore)
         
         # Connect field changes to debounced update (prevents signal cascading)
-        if hasattr(self, 'style_widget'):
-            self.style_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'setting_widget'):
-            self.setting_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'weather_widget'):
-            self.weather_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'datetime_widget'):
-            self.datetime_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'subjects_widget'):
-            self.subjects_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'pose_widget'):
-            self.pose_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'camera_widget'):
-            self.camera_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'framing_widget'):
-            self.framing_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'grading_widget'):
-            self.grading_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'details_widget'):
-            self.details_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'llm_instructions_widget'):
-            self.llm_instructions_widget.value_changed.connect(self._schedule_preview_update)
-        if hasattr(self, 'seed_widget'):
-            self.seed_widget.value_changed.connect(self._schedule_preview_update)
+        schedule_preview_update = self._schedule_preview_update
+        for widget in self.field_widgets.values():
+            widget.value_changed.connect(schedule_preview_update)
         
         # Connect preview panel history signals
-        if hasattr(self, 'preview_panel'):
-            self.preview_panel.history_back_requested.connect(self._navigate_history_back)
-            self.preview_panel.history_forward_requested.connect(self._navigate_history_forward)
-            self.preview_panel.history_delete_requested.connect(self._delete_history_entry)
-            self.preview_panel.history_clear_requested.connect(self._clear_history)
-            self.preview_panel.load_preview_requested.connect(self._load_preview_into_fields)
-            self.preview_panel.history_jump_requested.connect(self._jump_to_history_position)
+        preview_panel = self.preview_panel
+        preview_panel.history_back_requested.connect(self._navigate_history_back)
+        preview_panel.history_forward_requested.connect(self._navigate_history_forward)
+        preview_panel.history_delete_requested.connect(self._delete_history_entry)
+        preview_panel.history_clear_requested.connect(self._clear_history)
+        preview_panel.load_preview_requested.connect(self._load_preview_into_fields)
+        preview_panel.history_jump_requested.connect(self._jump_to_history_position)
         
         # Initial preview update - delay to ensure window is ready
         QTimer.singleShot(100, self._update_preview)
         
-        callbacks_time = time.time() - callbacks_start
+        callbacks_time = time.perf_counter() - callbacks_start
         if self.debug_enabled:
             info(f"STARTUP: _setup_callbacks took {callbacks_time:.3f}s", LogArea.GENERAL)
     
@@ -2423,7 +2996,7 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'preview_panel') and hasattr(self, 'status_label'):
             word_count = self.preview_panel.get_word_count()
             char_count = self.preview_panel.get_char_count()
-            self.status_label.setText(f"{word_count} words / {char_count} characters")
+            self._set_status(f"{word_count} words / {char_count} characters")
     
     def _load_preferences(self):
         """Load saved preferences."""
@@ -2436,32 +3009,41 @@ class MainWindow(QMainWindow):
                 # Load filter preferences (handle both "filters" and "families" for backward compatibility)
                 selected_filters = prefs.get('filters', prefs.get('families', []))
                 if selected_filters:
+                    selected_filters = set(selected_filters)
                     for filter_name, action in self.filter_actions.items():
                         action.setChecked(filter_name in selected_filters)
                 
-                # Load model preferences
-                if 'model' in prefs and hasattr(self, 'model_widget'):
-                    self.model_widget.set_value(prefs['model'])
-                if 'llm_model' in prefs and hasattr(self, 'llm_widget'):
-                    self.llm_widget.set_value(prefs['llm_model'])
+                # Load model preferences (a saved null means "nothing selected", so skip it)
+                model_widget = getattr(self, 'model_widget', None)
+                model = prefs.get('model')
+                if model_widget is not None and model is not None:
+                    model_widget.set_value(model)
+                llm_widget = getattr(self, 'llm_widget', None)
+                llm_model = prefs.get('llm_model')
+                if llm_widget is not None and llm_model is not None:
+                    llm_widget.set_value(llm_model)
                 
                 # Load Ollama preferences with proper initialization
-                if hasattr(self, 'auto_start_ollama_action'):
+                auto_start_action = getattr(self, 'auto_start_ollama_action', None)
+                if auto_start_action is not None:
                     auto_start_value = prefs.get('auto_start_ollama', False)
-                    self.auto_start_ollama_action.setChecked(auto_start_value)
+                    auto_start_action.setChecked(auto_start_value)
                     debug(f"Loaded auto_start_ollama preference: {auto_start_value}", LogArea.GENERAL)
                 
-                if hasattr(self, 'kill_ollama_on_exit_action'):
+                kill_on_exit_action = getattr(self, 'kill_ollama_on_exit_action', None)
+                if kill_on_exit_action is not None:
                     kill_on_exit_value = prefs.get('kill_ollama_on_exit', True)
-                    self.kill_ollama_on_exit_action.setChecked(kill_on_exit_value)
+                    kill_on_exit_action.setChecked(kill_on_exit_value)
                     debug(f"Loaded kill_ollama_on_exit preference: {kill_on_exit_value}", LogArea.GENERAL)
             else:
                 # First time running - set default values and save them
                 debug("No preferences file found, setting default values", LogArea.GENERAL)
-                if hasattr(self, 'auto_start_ollama_action'):
-                    self.auto_start_ollama_action.setChecked(False)
-                if hasattr(self, 'kill_ollama_on_exit_action'):
-                    self.kill_ollama_on_exit_action.setChecked(True)
+                auto_start_action = getattr(self, 'auto_start_ollama_action', None)
+                if auto_start_action is not None:
+                    auto_start_action.setChecked(False)
+                kill_on_exit_action = getattr(self, 'kill_ollama_on_exit_action', None)
+                if kill_on_exit_action is not None:
+                    kill_on_exit_action.setChecked(True)
                 # Save default preferences
                 self._save_preferences()
                     
@@ -2472,10 +3054,7 @@ class MainWindow(QMainWindow):
         """Save current preferences."""
         try:
             # Get selected filters
-            selected_filters = []
-            for filter_name, action in self.filter_actions.items():
-                if action.isChecked():
-                    selected_filters.append(filter_name)
+            selected_filters = list(self._get_selected_filters())
             
             prefs = {
                 'filters': selected_filters,
@@ -2483,244 +3062,309 @@ class MainWindow(QMainWindow):
             }
             
             # Add model preferences if available
-            if hasattr(self, 'model_widget'):
-                prefs['model'] = self.model_widget.get_value()
-            if hasattr(self, 'llm_widget'):
-                prefs['llm_model'] = self.llm_widget.get_value()
+            model_widget = getattr(self, 'model_widget', None)
+            if model_widget is not None:
+                prefs['model'] = model_widget.get_value()
+            llm_widget = getattr(self, 'llm_widget', None)
+            if llm_widget is not None:
+                prefs['llm_model'] = llm_widget.get_value()
             
             # Add Ollama preferences if available
-            if hasattr(self, 'auto_start_ollama_action'):
-                prefs['auto_start_ollama'] = self.auto_start_ollama_action.isChecked()
-            if hasattr(self, 'kill_ollama_on_exit_action'):
-                prefs['kill_ollama_on_exit'] = self.kill_ollama_on_exit_action.isChecked()
+            auto_start_action = getattr(self, 'auto_start_ollama_action', None)
+            if auto_start_action is not None:
+                prefs['auto_start_ollama'] = auto_start_action.isChecked()
+            kill_on_exit_action = getattr(self, 'kill_ollama_on_exit_action', None)
+            if kill_on_exit_action is not None:
+                prefs['kill_ollama_on_exit'] = kill_on_exit_action.isChecked()
+            
+            # Skip the write when nothing changed since the last save
+            payload = _dump_json_bytes(prefs)
+            if payload == self._last_prefs_payload:
+                return
             
+            # Serialize in memory, then swap the file in so a crash can't leave it half-written
             prefs_file = self.user_data_dir / "preferences.json"
-            with open(prefs_file, 'w', encoding='utf-8') as f:
-                json.dump(prefs, f, indent=2, ensure_ascii=False)
+            _write_file_atomic(prefs_file, payload)
+            self._last_prefs_payload = payload
                 
         except Exception as e:
             warning(r"Could not save preferences: {e}", LogArea.GENERAL)
 
     def _toggle_auto_start_ollama(self):
         """Toggle auto-start Ollama on startup preference."""
-        if hasattr(self, 'auto_start_ollama_action'):
-            debug(f"Auto-start Ollama preference changed to: {self.auto_start_ollama_action.isChecked()}", LogArea.GENERAL)
+        auto_start_action = getattr(self, 'auto_start_ollama_action', None)
+        if auto_start_action is not None:
+            debug(f"Auto-start Ollama preference changed to: {auto_start_action.isChecked()}", LogArea.GENERAL)
             self._save_preferences()
     
     def _toggle_kill_ollama_on_exit(self):
         """Toggle kill Ollama on exit preference."""
-        if hasattr(self, 'kill_ollama_on_exit_action'):
-            debug(f"Kill Ollama on exit preference changed to: {self.kill_ollama_on_exit_action.isChecked()}", LogArea.GENERAL)
+        kill_on_exit_action = getattr(self, 'kill_ollama_on_exit_action', None)
+        if kill_on_exit_action is not None:
+            debug(f"Kill Ollama on exit preference changed to: {kill_on_exit_action.isChecked()}", LogArea.GENERAL)
             self._save_preferences()
     
     def _auto_start_ollama(self):
         """Auto-start Ollama on application startup if preference is set."""
-        ollama_start = time.time()
+        ollama_start = time.perf_counter()
         try:
             # Check if Ollama is already running
             if self._is_ollama_running():
                 info(r"DEBUG OLLAMA: Ollama is already running, skipping auto-start", LogArea.GENERAL)
-                ollama_time = time.time() - ollama_start
+                ollama_time = time.perf_counter() - ollama_start
                 if self.debug_enabled:
                     info(f"STARTUP: Ollama auto-start (already running) took {ollama_time:.3f}s", LogArea.GENERAL)
                 return
             
             info(r"DEBUG OLLAMA: Auto-starting Ollama...", LogArea.GENERAL)
             
-            # Start Ollama in background
-            def start_ollama():
-                try:
-                    with self._ollama_process_lock:
-                        # Double-check that we don't already have a process
-                        if self._ollama_process is not None and self._ollama_process.returncode is None:
-                            info(f"DEBUG OLLAMA: Another thread already started Ollama (PID: {self._ollama_process.pid})", LogArea.GENERAL)
-                            return
-                        
-                        # Use subprocess.Popen to start Ollama in background
-                        creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-                        info(f"DEBUG OLLAMA: Starting Ollama with creationflags={creation_flags}", LogArea.GENERAL)
-                        process = subprocess.Popen(
-                            ['ollama', 'serve'],
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                            creationflags=creation_flags
-                        )
-                        self._ollama_process = process
-                        info(f"DEBUG OLLAMA: Ollama started with PID: {process.pid}", LogArea.GENERAL)
-                except Exception as e:
-                    error(r"DEBUG OLLAMA: Failed to start Ollama: {e}", LogArea.GENERAL)
-            
-            # Start Ollama in a separate thread to avoid blocking
-            ollama_thread = threading.Thread(target=start_ollama, daemon=True)
-            ollama_thread.start()
-            
-            # Return immediately - don't wait for Ollama to start
-            ollama_time = time.time() - ollama_start
+            # QProcess.start returns immediately - don't wait for Ollama to start
+            self._spawn_ollama_process()
+            
+            ollama_time = time.perf_counter() - ollama_start
             if self.debug_enabled:
                 info(f"STARTUP: Ollama auto-start initiated in {ollama_time:.3f}s (non-blocking)", LogArea.GENERAL)
                 
         except Exception as e:
-            error(r"DEBUG OLLAMA: Error in auto-start: {e}", LogArea.GENERAL)
-            ollama_time = time.time() - ollama_start
+            error(f"DEBUG OLLAMA: Error in auto-start: {e}", LogArea.GENERAL)
+            ollama_time = time.perf_counter() - ollama_start
             if self.debug_enabled:
                 info(f"STARTUP: Ollama auto-start (with error) took {ollama_time:.3f}s", LogArea.GENERAL)
     
+    def _spawn_ollama_process(self) -> Optional[str]:
+        """Launch 'ollama serve' detached so it keeps running after the application exits.
+        
+        Returns an error message if the process could not be launched.
+        """
+        process = QProcess()
+        process.setProgram("ollama")
+        process.setArguments(["serve"])
+        process.setStandardOutputFile(QProcess.nullDevice())
+        process.setStandardErrorFile(QProcess.nullDevice())
+        if sys.platform == "win32" and hasattr(process, 'setCreateProcessArgumentsModifier'):
+            # Hide console window on Windows
+            def hide_console(args):
+                args.flags = (args.flags & ~_CREATE_NEW_CONSOLE) | _CREATE_NO_WINDOW
+            process.setCreateProcessArgumentsModifier(hide_console)
+        
+        info(f"DEBUG OLLAMA: Starting 'ollama serve'", LogArea.GENERAL)
+        started = process.startDetached()
+        if isinstance(started, tuple):  # Some PySide6 versions also return the PID
+            started = started[0]
+        if not started:
+            error(f"DEBUG OLLAMA: Failed to start Ollama: {process.errorString()}", LogArea.GENERAL)
+            return process.errorString()
+        
+        self._ollama_spawned = True
+        info(f"DEBUG OLLAMA: Ollama started", LogArea.GENERAL)
+        return None
+    
     def _start_ollama(self):
         """Start Ollama server in background."""
         try:
             # Check if Ollama is already running
             if self._is_ollama_running():
-                QMessageBox.information(self, "Ollama", "Ollama is already running.")
+                self._maybe_show_message(QMessageBox.information, "Ollama", "Ollama is already running.")
                 return
             
-            # Start Ollama in background
-            def start_ollama_thread():
-                try:
-                    with self._ollama_process_lock:
-                        # Double-check that we don't already have a process
-                        if self._ollama_process is not None and self._ollama_process.returncode is None:
-                            info(f"DEBUG OLLAMA: Another thread already started Ollama (PID: {self._ollama_process.pid})", LogArea.GENERAL)
-                            QTimer.singleShot(0, lambda: QMessageBox.information(self, "Ollama", "Ollama is already running."))
-                            return
-                        
-                        # Hide console window on Windows
-                        creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-                        info(f"STARTUP: Starting Ollama with creationflags={creation_flags}", LogArea.GENERAL)
-                        process = subprocess.Popen(["ollama", "serve"], 
-                                                 stdout=subprocess.DEVNULL, 
-                                                 stderr=subprocess.DEVNULL,
-                                                 creationflags=creation_flags)
-                        self._ollama_process = process
-                        info(f"STARTUP: Ollama process started with PID={process.pid}", LogArea.GENERAL)
-                        time.sleep(2)  # Wait for startup
-                        
-                        # Update UI on main thread
-                        QTimer.singleShot(0, self._on_ollama_started)
-                except Exception as e:
-                    QTimer.singleShot(0, lambda: self._on_ollama_error(f"Failed to start Ollama: {str(e)}"))
+            spawn_error = self._spawn_ollama_process()
+            if spawn_error:
+                self._on_ollama_error(f"Failed to start Ollama: {spawn_error}")
+                return
             
-            # Start in background thread
-            thread = threading.Thread(target=start_ollama_thread, daemon=True)
-            thread.start()
+            # Refresh models once the server accepts connections
+            self._wait_for_ollama_ready()
             
             # Show status
             self.statusBar().showMessage("Starting Ollama...")
             
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to start Ollama: {str(e)}")
+            self._maybe_show_message(QMessageBox.critical, "Error", f"Failed to start Ollama: {str(e)}")
 
+    def _wait_for_ollama_ready(self):
+        """Poll the Ollama port and call _on_ollama_started once it accepts connections."""
+        if self._ollama_ready_timer is None:
+            self._ollama_ready_timer = QTimer(self)
+            self._ollama_ready_timer.setInterval(_OLLAMA_READY_POLL_MS)
+            self._ollama_ready_timer.timeout.connect(self._poll_ollama_ready)
+        self._ollama_ready_deadline = time.monotonic() + _OLLAMA_READY_TIMEOUT
+        self._ollama_ready_timer.start()
+    
+    def _poll_ollama_ready(self):
+        """Try one connection to the Ollama port (no-op while an attempt is still pending)."""
+        if time.monotonic() > self._ollama_ready_deadline:
+            self._stop_ollama_ready_poll()
+            self._on_ollama_error(f"Ollama did not accept connections within {_OLLAMA_READY_TIMEOUT:.0f}s.")
+            return
+        if self._ollama_ready_socket is not None:
+            return
+        socket = QTcpSocket(self)
+        socket.connected.connect(self._on_ollama_port_ready)
+        socket.errorOccurred.connect(self._on_ollama_port_refused)
+        self._ollama_ready_socket = socket
+        socket.connectToHost(_OLLAMA_HOST, _OLLAMA_PORT)
+    
+    def _on_ollama_port_refused(self, *_):
+        """Drop a failed connection attempt; the next poll tick tries again."""
+        self._release_ollama_ready_socket()
+    
+    def _on_ollama_port_ready(self):
+        """Ollama accepts connections - stop polling and refresh models."""
+        self._stop_ollama_ready_poll()
+        self._on_ollama_started()
+    
+    def _stop_ollama_ready_poll(self):
+        """Stop readiness polling and drop any pending connection attempt."""
+        if self._ollama_ready_timer is not None:
+            self._ollama_ready_timer.stop()
+        self._release_ollama_ready_socket()
+    
+    def _release_ollama_ready_socket(self):
+        """Abort and release the current readiness probe socket, if any."""
+        socket = self._ollama_ready_socket
+        if socket is not None:
+            self._ollama_ready_socket = None
+            socket.abort()
+            socket.deleteLater()
+    
     def _kill_ollama(self):
         """Kill Ollama server."""
         try:
-            # Kill Ollama processes
-            subprocess.run(["taskkill", "/F", "/IM", "ollama.exe"], 
-                          capture_output=True, text=True)
-            
-            # Clear our tracked process reference
-            with self._ollama_process_lock:
-                if self._ollama_process is not None:
-                    info(f"DEBUG OLLAMA: Cleared tracked Ollama process reference (PID: {self._ollama_process.pid})", LogArea.GENERAL)
-                    self._ollama_process = None
+            if PSUTIL_AVAILABLE:
+                task = _OllamaKillTask()
+                task.signals.finished.connect(self._on_ollama_kill_finished)
+                QThreadPool.globalInstance().start(task)
+                return
             
-            # Update UI
-            self._on_ollama_killed()
-            self.statusBar().showMessage("Ollama killed.")
+            # Kill Ollama processes
+            self._ollama_kill_process = QProcess(self)
+            self._ollama_kill_process.finished.connect(self._on_ollama_kill_finished)
+            self._ollama_kill_process.errorOccurred.connect(self._on_ollama_kill_error)
+            self._ollama_kill_process.start("taskkill", ["/F", "/IM", "ollama.exe"])
             
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to kill Ollama: {str(e)}")
+            self._maybe_show_message(QMessageBox.critical, "Error", f"Failed to kill Ollama: {str(e)}")
+    
+    def _on_ollama_kill_error(self, process_error):
+        """Report a kill command that could not be launched."""
+        if process_error != QProcess.ProcessError.FailedToStart:
+            return
+        error_string = self._ollama_kill_process.errorString()
+        self._ollama_kill_process.deleteLater()
+        self._ollama_kill_process = None
+        self._maybe_show_message(QMessageBox.critical, "Error", f"Failed to kill Ollama: {error_string}")
+    
+    def _on_ollama_kill_finished(self, exit_code, exit_status):
+        """Update state once the kill command has completed."""
+        if self._ollama_kill_process is not None:
+            self._ollama_kill_process.deleteLater()
+            self._ollama_kill_process = None
+        
+        # Clear our tracked process flag
+        if self._ollama_spawned:
+            info(f"DEBUG OLLAMA: Cleared tracked Ollama process flag", LogArea.GENERAL)
+            self._ollama_spawned = False
+        
+        # Update UI
+        self._on_ollama_killed()
+        self.statusBar().showMessage("Ollama killed.")
 
     def _refresh_llm_models(self):
         """Refresh the LLM model list."""
-        if hasattr(self, 'llm_widget'):
+        llm_widget = getattr(self, 'llm_widget', None)
+        if llm_widget is not None:
             debug(r"User requested model refresh", LogArea.OLLAMA)
-            self.llm_widget.refresh_connection()
+            llm_widget.refresh_connection()
             self.statusBar().showMessage("Models refreshed.")
 
+    def _run_command(self, program: str, args: List[str], timeout_ms: int = 5000):
+        """Run a short-lived command to completion and return (exit_code, stdout, stderr)."""
+        return _run_command(program, args, timeout_ms)
+
     def _is_ollama_running(self):
-        """Check if Ollama is running."""
+        """Check if Ollama is running (process-list results are reused for a short TTL).
+        
+        Also used as the prompt engine's process tracker, so it is called from batch
+        worker threads. Those only read the cached result; probing starts processes and
+        is left to the GUI thread, which refreshes the cache before a batch starts.
+        """
         try:
-            # First check if we have a tracked process that's still alive
-            with self._ollama_process_lock:
-                if self._ollama_process is not None:
-                    # Check if our tracked process is still running
-                    # Use returncode instead of poll() to avoid consuming the exit status
-                    if self._ollama_process.returncode is None:
-                        info(f"DEBUG OLLAMA: Found tracked Ollama process (PID: {self._ollama_process.pid})", LogArea.GENERAL)
-                        return True
-                    else:
-                        # Process has terminated, clear our reference
-                        info(f"DEBUG OLLAMA: Tracked Ollama process has terminated (PID: {self._ollama_process.pid})", LogArea.GENERAL)
-                        self._ollama_process = None
-            
-            # Fallback: check for any ollama.exe processes
-            result = subprocess.run("tasklist //FI \"IMAGENAME eq ollama.exe\"", 
-                                  capture_output=True, text=True, shell=True)
-            if "ollama.exe" in result.stdout:
-                info(f"DEBUG OLLAMA: Found untracked Ollama process via tasklist", LogArea.GENERAL)
+            # First check if we started Ollama ourselves
+            if self._ollama_spawned:
+                info(f"DEBUG OLLAMA: Found tracked Ollama process", LogArea.GENERAL)
                 return True
             
-            return False
+            now = time.monotonic()
+            with QMutexLocker(self._ollama_running_mutex):
+                checked_at, running = self._ollama_running_cache
+            if now - checked_at < _OLLAMA_RUNNING_TTL or QThread.currentThread() is not self.thread():
+                return running
+            
+            # Fallback: check for any ollama processes
+            running = _probe_ollama_running()
+            self._store_ollama_running(now, running)
+            if running:
+                info(f"DEBUG OLLAMA: Found untracked Ollama process", LogArea.GENERAL)
+            return running
         except Exception as e:
             error(f"DEBUG OLLAMA: Error checking if Ollama is running: {e}", LogArea.GENERAL)
             return False
 
+    def _store_ollama_running(self, checked_at, running):
+        """Record the result of an "is Ollama running" check."""
+        with QMutexLocker(self._ollama_running_mutex):
+            self._ollama_running_cache = (checked_at, running)
+
     def _on_ollama_started(self):
         """Called when Ollama starts successfully."""
+        self._store_ollama_running(0.0, False)
         self.statusBar().showMessage("Ollama started successfully.")
         
         # Refresh LLM models with a slight delay to ensure Ollama is fully ready
-        if hasattr(self, 'llm_widget'):
+        if getattr(self, 'llm_widget', None) is not None:
             debug(r"Ollama started, refreshing models...", LogArea.OLLAMA)
             # Use QTimer to ensure this runs on the main thread and with a slight delay
-            QTimer.singleShot(1000, lambda: self._refresh_models_after_ollama_start())
+            QTimer.singleShot(1000, self._refresh_models_after_ollama_start)
         
-        QMessageBox.information(self, "Ollama", "Ollama started successfully!")
+        self._maybe_show_message(QMessageBox.information, "Ollama", "Ollama started successfully!")
     
     def _refresh_models_after_ollama_start(self):
         """Refresh models after Ollama has started."""
-        if hasattr(self, 'llm_widget'):
+        llm_widget = getattr(self, 'llm_widget', None)
+        if llm_widget is not None:
             debug(r"Refreshing models after Ollama start...", LogArea.OLLAMA)
-            self.llm_widget.refresh_connection()
+            llm_widget.refresh_connection()
             self.statusBar().showMessage("Models refreshed after Ollama start.")
 
     def _on_ollama_killed(self):
         """Called when Ollama is killed."""
+        self._store_ollama_running(0.0, False)
         # Update LLM widget to show disconnected state
-        if hasattr(self, 'llm_widget'):
-            self.llm_widget._show_error("Ollama not running")
+        llm_widget = getattr(self, 'llm_widget', None)
+        if llm_widget is not None:
+            llm_widget._show_error("Ollama not running")
 
     def _on_ollama_error(self, error_msg):
         """Called when Ollama operation fails."""
         self.statusBar().showMessage("Ollama error.")
-        QMessageBox.critical(self, "Ollama Error", error_msg)
+        self._maybe_show_message(QMessageBox.critical, "Ollama Error", error_msg)
 
     def closeEvent(self, event):
         """Handle window close event."""
+        if self._batch_thread is not None:
+            self._stop_batch_for_close()
+        
         # Unload Ollama model to free up VRAM
-        try:
-            if hasattr(self, 'llm_widget'):
-                current_model = self.llm_widget.get_value()
-                debug(r"Unloading model '{current_model}' on application close", LogArea.OLLAMA)
-                
-                # Get prompt engine and unload model
-                prompt_engine = self._get_prompt_engine()
-                if prompt_engine:
-                    success = prompt_engine.unload_llm_model(current_model)
-                    if success:
-                        debug(r"Successfully unloaded model '{current_model}'", LogArea.OLLAMA)
-                    else:
-                        debug(r"Failed to unload model '{current_model}'", LogArea.OLLAMA)
-                else:
-                    info(r"DEBUG OLLAMA: No prompt engine available for model unloading", LogArea.GENERAL)
-        except Exception as e:
-            debug(r"Error during model unloading: {str(e)}", LogArea.OLLAMA)
+        self._safe(self._unload_active_model)
         
         # Kill Ollama on exit if user preference is set
-        if hasattr(self, 'kill_ollama_on_exit_action') and self.kill_ollama_on_exit_action.isChecked():
-            try:
-                self._kill_ollama()
-            except Exception as e:
-                debug(r"Error killing Ollama on exit: {str(e)}", LogArea.OLLAMA)
+        if self.kill_ollama_on_exit_action.isChecked():
+            self._safe(self._kill_ollama_and_wait)
+        
+        # Write out any pending generation cache changes
+        self._flush_generation_cache()
+        # Let queued cache/template writes land before the process exits
+        QThreadPool.globalInstance().waitForDone(5000)
         
         # Save window size to preferences
         theme_manager.set_preference("window_width", self.width())
@@ -2731,67 +3375,104 @@ class MainWindow(QMainWindow):
         
         event.accept()
     
-    def _navigate_history_back(self):
-        """Navigate to previous history entry."""
-        debug(r"User clicked BACK button", LogArea.NAVIGATION)
+    def _stop_batch_for_close(self):
+        """Cancel a running batch, dropping its unfinished results.
+        
+        Requests already sent get a short grace period; a thread still busy after that
+        is detached from the window and left to finish in the background.
+        """
+        worker, thread = self._batch_worker, self._batch_thread
+        self._batch_worker = None
+        self._batch_thread = None
+        self._batch_run = None
+        worker.cancel()
+        worker.result_ready.disconnect(self._on_batch_result)
+        worker.batch_finished.disconnect(self._on_batch_finished)
+        thread.quit()
+        if not thread.wait(_BATCH_CLOSE_WAIT_MS):
+            warning("Batch still has requests in flight; letting them finish in the background", LogArea.BATCH)
+            thread.setParent(None)
+            _detached_batch_threads.append(thread)
+    
+    def _safe(self, fn, area: LogArea = LogArea.OLLAMA):
+        """Run fn, logging instead of raising if it fails (used during shutdown)."""
+        try:
+            fn()
+        except Exception as e:
+            debug(f"{fn.__name__} failed: {str(e)}", area)
+    
+    def _unload_active_model(self):
+        """Unload the selected Ollama model to free up VRAM."""
+        current_model = self.llm_widget.get_value()
+        debug(f"Unloading model '{current_model}' on application close", LogArea.OLLAMA)
+        
+        prompt_engine = self._get_prompt_engine()
+        if not prompt_engine:
+            info(r"DEBUG OLLAMA: No prompt engine available for model unloading", LogArea.GENERAL)
+            return
+        if prompt_engine.unload_llm_model(current_model):
+            debug(f"Successfully unloaded model '{current_model}'", LogArea.OLLAMA)
+        else:
+            debug(f"Failed to unload model '{current_model}'", LogArea.OLLAMA)
+    
+    def _kill_ollama_and_wait(self):
+        """Kill Ollama and, since the window is going away, wait for the kill command."""
+        if PSUTIL_AVAILABLE:
+            self._on_ollama_kill_finished(_kill_ollama_processes(), QProcess.ExitStatus.NormalExit)
+            return
+        self._kill_ollama()
+        if self._ollama_kill_process is not None:
+            self._ollama_kill_process.waitForFinished(5000)
+    
+    def _do_nav(self, nav, *args, delayed_clear: bool = False):
+        """Run a history_manager navigation call with _intentionally_navigating set.
+        
+        Navigation controls are refreshed (still inside the guard) unless nav returns False.
+        With delayed_clear the flag is cleared after 200ms instead of immediately.
+        """
         self._intentionally_navigating = True
         try:
-            if self.history_manager.navigate_back():
+            if nav(*args) is not False:
                 self._update_history_navigation()
         finally:
-            # Clear flag immediately (no timer needed)
-            self._intentionally_navigating = False
+            if delayed_clear:
+                QTimer.singleShot(200, self._end_intentional_navigation)
+            else:
+                # Clear flag immediately (no timer needed)
+                self._intentionally_navigating = False
+    
+    def _navigate_history_back(self):
+        """Navigate to previous history entry."""
+        debug(r"User clicked BACK button", LogArea.NAVIGATION)
+        self._do_nav(self.history_manager.navigate_back)
     
     def _navigate_history_forward(self):
         """Navigate to next history entry."""
         debug(r"User clicked FORWARD button", LogArea.NAVIGATION)
-        self._intentionally_navigating = True
-        try:
-            if self.history_manager.navigate_forward():
-                self._update_history_navigation()
-        finally:
-            # Clear flag immediately (no timer needed)
-            self._intentionally_navigating = False
+        self._do_nav(self.history_manager.navigate_forward)
     
     def _delete_history_entry(self):
         """Delete current history entry."""
-        self._intentionally_navigating = True
-        try:
-            if self.history_manager.delete_current_entry():
-                self._update_history_navigation()
-        finally:
-            # Clear flag immediately (no timer needed)
-            self._intentionally_navigating = False
+        self._do_nav(self.history_manager.delete_current_entry)
     
     def _clear_history(self):
         """Clear all history entries."""
-        self._intentionally_navigating = True
-        try:
-            self.history_manager.clear_history()
-            self._update_history_navigation()
-        finally:
-            # Clear flag immediately (no timer needed)
-            self._intentionally_navigating = False
+        # clear_history returns None, so navigation is always refreshed
+        self._do_nav(self.history_manager.clear_history)
     
     def _jump_to_history_position(self, position: int):
         """Jump to specific history position."""
         debug(r"User manually entered position {position}", LogArea.NAVIGATION)
-        self._intentionally_navigating = True
-        try:
-            if self.history_manager.jump_to_position(position):
-                self._update_history_navigation()
-        finally:
-            # Clear flag after a delay to cover any delayed preview updates
-            # This prevents the bug where navigating to history state 1/1 would reset to 0/1
-            # because _restore_from_history_entry() schedules a delayed _update_preview() call
-            # that would execute after _intentionally_navigating was already cleared
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(200, lambda: setattr(self, '_intentionally_navigating', False))
+        # Clear flag after a delay to cover any delayed preview updates
+        # This prevents the bug where navigating to history state 1/1 would reset to 0/1
+        # because _restore_from_history_entry() schedules a delayed _update_preview() call
+        # that would execute after _intentionally_navigating was already cleared
+        self._do_nav(self.history_manager.jump_to_position, position, delayed_clear=True)
     
     def _should_jump_to_current_state(self) -> bool:
         """Check if we should jump back to current state (0/X) when field changes."""
         # Don't jump if we're intentionally navigating to history entries
-        if hasattr(self, '_intentionally_navigating') and self._intentionally_navigating:
+        if self._intentionally_navigating:
             if self.debug_enabled:
                 info(r"DEBUG NAV: Skipping jump to current - intentionally navigating", LogArea.GENERAL)
             return False
@@ -2805,24 +3486,14 @@ class MainWindow(QMainWindow):
         
         return should_jump
     
-    def _block_all_field_signals(self):
-        """Block signals from all field widgets to prevent cascading updates."""
-        self._blocked_widgets = []
-        for field_key, widget in self.field_widgets.items():
-            if hasattr(widget, 'blockSignals'):
-                widget.blockSignals(True)
-                self._blocked_widgets.append(widget)
+    def _block_field_signals(self) -> ExitStack:
+        """Return an ExitStack that blocks signals from all field widgets until it exits."""
+        blockers = ExitStack()
+        for widget in self._all_input_widgets:
+            blockers.enter_context(QSignalBlocker(widget))
         if self.debug_enabled:
-            debug(r"Blocked signals for {len(self._blocked_widgets)} widgets", LogArea.NAVIGATION)
-    
-    def _unblock_all_field_signals(self):
-        """Unblock signals from all field widgets."""
-        for widget in self._blocked_widgets:
-            if hasattr(widget, 'blockSignals'):
-                widget.blockSignals(False)
-        self._blocked_widgets = []
-        if self.debug_enabled:
-            info(r"DEBUG NAV: Unblocked all field widget signals", LogArea.GENERAL)
+            debug(f"Blocked signals for {len(self._all_input_widgets)} widgets", LogArea.NAVIGATION)
+        return blockers
     
     def _cache_current_state(self):
         """Cache the current field state as 0/X state."""
@@ -2866,18 +3537,11 @@ class MainWindow(QMainWindow):
             self.preview_panel.set_history_state(False, total_count)
             # Explicitly set placeholder text for 0/X state
             self.preview_panel.final_text.setPlainText("Generate a final prompt to see the LLM-refined version here...")
-        
-        # Ensure placeholder text is shown for current state (0/X)
-        if hasattr(self, 'preview_panel'):
-            current_pos, total_count = self.history_manager.get_navigation_info()
-            self.preview_panel.set_history_state(False, total_count)
-            # Explicitly set placeholder text for 0/X state
-            self.preview_panel.final_text.setPlainText("Generate a final prompt to see the LLM-refined version here...")
     
     def _jump_to_current_state(self):
         """Jump back to current state (0/X) and load the cached state."""
         # Prevent recursive calls
-        if hasattr(self, '_jumping_to_current') and self._jumping_to_current:
+        if self._jumping_to_current:
             if self.debug_enabled:
                 info(r"DEBUG NAV: Already jumping to current state, skipping", LogArea.GENERAL)
             return
@@ -2907,8 +3571,7 @@ class MainWindow(QMainWindow):
         finally:
             # Clear flag immediately (no timer needed)
             self._jumping_to_current = False
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(300, lambda: setattr(self, '_suppress_popups', False))
+            QTimer.singleShot(300, self._end_popup_suppression)
     
 
     
@@ -2918,172 +3581,173 @@ class MainWindow(QMainWindow):
         # Single final prompt text now
         preview_text = self.preview_panel.final_text.toPlainText()
         
-        debug(r"Preview text from tab {current_tab}:", LogArea.LOAD)
-        debug(r"{preview_text}", LogArea.LOAD)
+        debug(lambda: f"Preview text:\n{preview_text}", LogArea.LOAD)
         
         if not preview_text.strip():
             return
         
         # Parse the preview text and extract field values
         # The format is typically "Field: value" on separate lines
-        field_values = {}
-        lines = preview_text.strip().split('\n')
-        
-        for line in lines:
-            if ':' in line:
-                field_name, value = line.split(':', 1)
-                field_name = field_name.strip()
-                value = value.strip()
-                if value:  # Only add non-empty values
-                    field_values[field_name] = value
-                    debug(r"Parsed field '{field_name}' = '{value}'", LogArea.LOAD)
-        
-        debug(r"All parsed fields: {field_values}", LogArea.LOAD)
-        
-        # Get snippet manager for matching existing snippets
-        from ..utils.snippet_manager import snippet_manager
-        
-        # Map field names to widget names and their corresponding snippet field names
-        field_mapping = {
-            'Style': ('style', 'style'),
-            'Setting': ('setting', 'setting'), 
-            'Weather': ('weather', 'weather'),
-            'Date/Time': ('datetime', 'datetime'),
-            'Subjects': ('subjects', 'subjects'),
-            'Pose/Action': ('pose', 'subjects_pose_and_action'),  # Widget: pose, Snippet field: subjects_pose_and_action
-            'Camera': ('camera', 'camera'),
-            'Camera Framing and Action': ('framing', 'camera_framing_and_action'),  # Widget: framing, Snippet field: camera_framing_and_action
-            'Color Grading & Mood': ('grading', 'color_grading_&_mood'),  # Widget: grading, Snippet field: color_grading_&_mood
-            'Details': ('details', 'details')
-        }
+        # Only add non-empty values
+        field_values = {m.group(1): m.group(2) for m in _FIELD_RE.finditer(preview_text) if m.group(2)}
         
-        # Block signals during loading to prevent cascading updates
-        blocked_widgets = []
-        for display_name, (widget_name, snippet_field_name) in field_mapping.items():
-            if display_name in field_values and hasattr(self, f'{widget_name}_widget'):
-                widget = getattr(self, f'{widget_name}_widget')
-                if hasattr(widget, 'blockSignals'):
-                    widget.blockSignals(True)
-                    blocked_widgets.append(widget)
+        debug(lambda: f"All parsed fields: {field_values}", LogArea.LOAD)
         
         try:
-            for display_name, (widget_name, snippet_field_name) in field_mapping.items():
-                if display_name in field_values and hasattr(self, f'{widget_name}_widget'):
-                    widget = getattr(self, f'{widget_name}_widget')
-                    value = field_values[display_name]
-                    
-                    if hasattr(widget, 'set_tags'):
-                        from ..gui.tag_widgets_qt import Tag, TagType
-                        
-                        # Split comma-separated values into individual tags
-                        individual_values = [v.strip() for v in value.split(',') if v.strip()]
-                        tags = []
+            # Block signals during loading to prevent cascading updates
+            with self._block_field_signals():
+                dbg = self.debug_enabled
+                for display_name, widget_name, snippet_field_name in _FIELD_MAPPING_ITEMS:
+                    value = field_values.get(display_name)
+                    widget = self.field_widgets.get(widget_name) if value is not None else None
+                    if widget is not None:
+                        if hasattr(widget, 'set_tags'):
+                            # Split comma-separated values into individual tags (each stripped once)
+                            individual_values = [v for v in map(str.strip, value.split(',')) if v]
+                            if not individual_values:
+                                widget.set_tags([])
+                                continue
+                            tags = []
                         
-                        for individual_value in individual_values:
-                            # Try to find matching snippet using the correct snippet field name
-                            matching_result = self._find_matching_snippet(snippet_field_name, individual_value, snippet_manager)
+                            # Resolve all values against the correct snippet field name in one go
+                            matches = self._find_matching_snippets_bulk(snippet_field_name, individual_values, snippet_manager)
+                            for individual_value in individual_values:
+                                matching_result = matches[individual_value]
                             
-                            if matching_result[0] is not None:
-                                snippet_data, category_path, is_category = matching_result
-                                debug(r"MATCH FOUND for '{individual_value}': is_category={is_category}, category_path={category_path}, snippet_data={snippet_data}", LogArea.LOAD)
+                                if matching_result[0] is not None:
+                                    snippet_data, category_path, is_category = matching_result
+                                    if dbg:
+                                        debug(f"MATCH FOUND for '{individual_value}': is_category={is_category}, category_path={category_path}, snippet_data={snippet_data}", LogArea.LOAD)
                                 
-                                if is_category:
-                                    # Create category tag
-                                    if len(category_path) == 1:
-                                        tag = Tag(individual_value, TagType.CATEGORY, category_path=category_path)
-                                        debug(r"Created CATEGORY tag: {individual_value}", LogArea.LOAD)
+                                    if is_category:
+                                        # Create category tag
+                                        if len(category_path) == 1:
+                                            tag = Tag(individual_value, TagType.CATEGORY, category_path=category_path)
+                                            if dbg:
+                                                debug(f"Created CATEGORY tag: {individual_value}", LogArea.LOAD)
+                                        else:
+                                            tag = Tag(individual_value, TagType.SUBCATEGORY, category_path=category_path)
+                                            if dbg:
+                                                debug(f"Created SUBCATEGORY tag: {individual_value}", LogArea.LOAD)
                                     else:
-                                        tag = Tag(individual_value, TagType.SUBCATEGORY, category_path=category_path)
-                                        debug(r"Created SUBCATEGORY tag: {individual_value}", LogArea.LOAD)
+                                        # Create snippet tag with proper data
+                                        if isinstance(snippet_data, dict):
+                                            # Handle instruction format with content
+                                            snippet_display_name = snippet_data.get("name", individual_value)
+                                            content = snippet_data.get("content", "")
+                                            tag = Tag(snippet_display_name, TagType.SNIPPET, data=content)
+                                            if dbg:
+                                                debug(f"Created SNIPPET tag (dict): {snippet_display_name}", LogArea.LOAD)
+                                        else:
+                                            # Handle simple string snippets
+                                            tag = Tag(individual_value, TagType.SNIPPET, data=snippet_data)
+                                            if dbg:
+                                                debug(f"Created SNIPPET tag (string): {individual_value}", LogArea.LOAD)
+                                    tags.append(tag)
                                 else:
-                                    # Create snippet tag with proper data
-                                    if isinstance(snippet_data, dict):
-                                        # Handle instruction format with content
-                                        snippet_display_name = snippet_data.get("name", individual_value)
-                                        content = snippet_data.get("content", "")
-                                        tag = Tag(snippet_display_name, TagType.SNIPPET, data=content)
-                                        debug(r"Created SNIPPET tag (dict): {snippet_display_name}", LogArea.LOAD)
-                                    else:
-                                        # Handle simple string snippets
-                                        tag = Tag(individual_value, TagType.SNIPPET, data=snippet_data)
-                                        debug(r"Created SNIPPET tag (string): {individual_value}", LogArea.LOAD)
-                                tags.append(tag)
-                            else:
-                                # Create user text tag if no snippet found
-                                tag = Tag(individual_value, TagType.USER_TEXT)
-                                debug(r"NO MATCH - Created USER_TEXT tag: {individual_value}", LogArea.LOAD)
-                                tags.append(tag)
+                                    # Create user text tag if no snippet found
+                                    tag = Tag(individual_value, TagType.USER_TEXT)
+                                    if dbg:
+                                        debug(f"NO MATCH - Created USER_TEXT tag: {individual_value}", LogArea.LOAD)
+                                    tags.append(tag)
                         
-                        # Set the tags
-                        widget.set_tags(tags)
-                    else:
-                        widget.set_value(value)
-        
+                            # Set the tags
+                            widget.set_tags(tags)
+                        else:
+                            widget.set_value(value)
         finally:
-            # Unblock signals
-            for widget in blocked_widgets:
-                widget.blockSignals(False)
-            
             # Schedule preview update to reflect the loaded values (respect guards)
             self._schedule_preview_update()
     
-    def _find_matching_snippet(self, field_name: str, value: str, snippet_manager) -> tuple:
+    def _find_matching_snippet(self, field_name: str, value: str, snippet_manager, filters: Optional[List[str]] = None) -> tuple:
         """
         Find a matching snippet and return (snippet_data, category_path, is_category).
+        Only the given filters are searched (default: the selected filters).
         Returns (None, None, False) if no match found.
         """
         try:
-
-            filters = snippet_manager.get_available_filters()
-            for filter_name in filters:
-                snippets_data = snippet_manager.get_snippets_for_field(field_name, filter_name)
-                if snippets_data:
-                    # Search through categories
-                    for category_name, category_data in snippets_data.items():
-                        if isinstance(category_data, list):
-                            # Simple list of snippets
-                            for snippet in category_data:
-                                if isinstance(snippet, str):
-                                    if snippet.lower() == value.lower():
-                                        return snippet, [category_name], False
-                                elif isinstance(snippet, dict):
-                                    snippet_name = snippet.get("name", "")
-                                    if snippet_name and snippet_name.lower() == value.lower():
-                                        return snippet, [category_name], False
-                        elif isinstance(category_data, dict):
-                            # Nested category structure
-                            for subcategory_name, subcategory_items in category_data.items():
-                                if isinstance(subcategory_items, list):
-                                    # List of items in subcategory
-                                    for item in subcategory_items:
-                                        if isinstance(item, str):
-                                            if item.lower() == value.lower():
-                                                return item, [category_name, subcategory_name], False
-                                        elif isinstance(item, dict):
-                                            item_name = item.get("name", "")
-                                            if item_name and item_name.lower() == value.lower():
-                                                return item, [category_name, subcategory_name], False
-                                elif isinstance(subcategory_items, dict):
-                                    # Instruction format with content/description
-                                    for instruction_name, instruction_data in subcategory_items.items():
-                                        if isinstance(instruction_data, dict):
-                                            instruction_display = instruction_data.get("name", instruction_name)
-                                            if instruction_display and instruction_display.lower() == value.lower():
-                                                return instruction_data, [category_name, subcategory_name], False
-                    
-                    # If no exact match, check if it's a category name
-                    for category_name, category_data in snippets_data.items():
-                        if category_name.lower() == value.lower():
-                            return category_name, [category_name], True
-                        if isinstance(category_data, dict):
-                            for subcategory_name in category_data.keys():
-                                if subcategory_name.lower() == value.lower():
-                                    return subcategory_name, [category_name, subcategory_name], True
-            return None, None, False
+            return self._get_snippet_index(field_name, snippet_manager, filters).get(value.lower(), (None, None, False))
         except Exception as e:
-            error(r"finding matching snippet: {e}", LogArea.ERROR)
+            error(f"finding matching snippet: {e}", LogArea.ERROR)
             return None, None, False
     
+    def _find_matching_snippets_bulk(self, field_name: str, values: List[str], snippet_manager,
+                                     filters: Optional[List[str]] = None) -> Dict[str, tuple]:
+        """Resolve several values of one field at once; unmatched values map to (None, None, False)."""
+        try:
+            index = self._get_snippet_index(field_name, snippet_manager, filters)
+        except Exception as e:
+            error(f"finding matching snippet: {e}", LogArea.ERROR)
+            index = {}
+        no_match = (None, None, False)
+        return {value: index.get(value.lower(), no_match) for value in values}
+    
+    def _get_snippet_index(self, field_name: str, snippet_manager, filters: Optional[List[str]] = None) -> dict:
+        """Return the (lazily built) name index for a field over the given filters."""
+        # The index is only valid for the snippet collection it was built from;
+        # reload_snippets() swaps in a new collection
+        if self._snippet_index_source is not snippet_manager.all_snippets:
+            self._snippet_index_cache.clear()
+            self._snippet_index_source = snippet_manager.all_snippets
+        if filters is None:
+            filters = self._get_selected_filters()
+        key = (field_name, tuple(filters))
+        index = self._snippet_index_cache.get(key)
+        if index is None:
+            index = self._snippet_index_cache[key] = self._build_snippet_index(field_name, snippet_manager, filters)
+        return index
+    
+    def _build_snippet_index(self, field_name: str, snippet_manager, filters: List[str]) -> dict:
+        """Map lowercased snippet/category names of a field to their match tuple.
+        
+        Filters are visited in order, and within each filter item matches take
+        precedence over category names, so the first entry kept for a name is the
+        one a linear search would have returned.
+        """
+        index = {}
+        for filter_name in filters:
+            snippets_data = snippet_manager.get_snippets_for_field(field_name, filter_name)
+            if not snippets_data:
+                continue
+            # Category names are collected during the same walk and only added
+            # after this filter's items, which take precedence over them
+            category_hits = []
+            for category_name, category_data in snippets_data.items():
+                category_hits.append((category_name.lower(), (category_name, [category_name], True)))
+                if isinstance(category_data, list):
+                    # Simple list of snippets
+                    for snippet in category_data:
+                        if isinstance(snippet, str):
+                            index.setdefault(snippet.lower(), (snippet, [category_name], False))
+                        elif isinstance(snippet, dict):
+                            snippet_name = snippet.get("name", "")
+                            if snippet_name:
+                                index.setdefault(snippet_name.lower(), (snippet, [category_name], False))
+                elif isinstance(category_data, dict):
+                    # Nested category structure
+                    for subcategory_name, subcategory_items in category_data.items():
+                        category_hits.append((subcategory_name.lower(), (subcategory_name, [category_name, subcategory_name], True)))
+                        if isinstance(subcategory_items, list):
+                            # List of items in subcategory
+                            for item in subcategory_items:
+                                if isinstance(item, str):
+                                    index.setdefault(item.lower(), (item, [category_name, subcategory_name], False))
+                                elif isinstance(item, dict):
+                                    item_name = item.get("name", "")
+                                    if item_name:
+                                        index.setdefault(item_name.lower(), (item, [category_name, subcategory_name], False))
+                        elif isinstance(subcategory_items, dict):
+                            # Instruction format with content/description
+                            for instruction_name, instruction_data in subcategory_items.items():
+                                if isinstance(instruction_data, dict):
+                                    instruction_display = instruction_data.get("name", instruction_name)
+                                    if instruction_display:
+                                        index.setdefault(instruction_display.lower(), (instruction_data, [category_name, subcategory_name], False))
+            
+            for key, hit in category_hits:
+                index.setdefault(key, hit)
+        return index
+    
     def _restore_from_history_entry(self):
         """Restore fields from current history entry using PromptState."""
         entry = self.history_manager.get_current_entry()
@@ -3101,23 +3765,19 @@ class MainWindow(QMainWindow):
             
             # Force a preview update to ensure summary reflects the restored fields
             # Skip if a template is currently loading
-            QTimer.singleShot(
-                100,
-                lambda: (None if (hasattr(self, '_loading_template') and self._loading_template)
-                         else self._update_preview(preserve_tab=True, force_update=True))
-            )
+            self._restore_preview_timer.start()
             if self.debug_enabled:
                 debug(r"Scheduled delayed _update_preview call with force_update=True", LogArea.NAVIGATION)
     
     def _update_history_navigation(self):
         """Update navigation controls state."""
         # PREVENT INFINITE RECURSION: Skip if we're currently restoring state
-        if hasattr(self, '_restoring_state') and self._restoring_state:
+        if self._restoring_state:
             if self.debug_enabled:
                 debug(r"Skipping navigation update during state restoration", LogArea.NAVIGATION)
             return
         # Skip while preview is updating
-        if hasattr(self, '_updating_preview') and self._updating_preview:
+        if self._updating_preview:
             if self.debug_enabled:
                 debug(r"Skipping navigation update during preview update", LogArea.NAVIGATION)
             return
@@ -3180,13 +3840,30 @@ class MainWindow(QMainWindow):
         if self.debug_enabled:
             debug(r"Live preview disabled; awaiting Generate action for Final Prompt", LogArea.NAVIGATION)
     
-    def _save_to_history(self, final_prompt: str = "", summary_text: str = "", seed: Optional[int] = None):
-        """Save current state to history using PromptState."""
+    def _save_to_history(self, final_prompt: str = "", summary_text: str = "", seed: Optional[int] = None,
+                         base_state: Optional[PromptState] = None):
+        """Save current state to history using PromptState.
+        
+        When base_state is given (a state captured earlier, e.g. at batch start) a copy of it
+        is stored instead of the fields as they are right now.
+        """
         if self.debug_enabled:
             debug(r"DEBUG NAV: Saving to history", LogArea.NAVIGATION)
         
+        # Add to history
+        self.history_manager.add_entry(self._history_state(final_prompt, seed, base_state))
+        
+        # Update navigation controls - but skip during generation to prevent infinite loops
+        if not self._generating_prompt:
+            self._update_history_navigation()
+        elif self.debug_enabled:
+            debug(r"Skipping navigation update during generation", LogArea.BATCH)
+    
+    def _history_state(self, final_prompt: str = "", seed: Optional[int] = None,
+                       base_state: Optional[PromptState] = None) -> PromptState:
+        """Build the PromptState stored in history for a generated prompt."""
         # Capture current state as PromptState
-        prompt_state = self.capture_current_state()
+        prompt_state = replace(base_state) if base_state is not None else self.capture_current_state()
         
         # Override with provided values if specified
         if final_prompt:
@@ -3194,32 +3871,24 @@ class MainWindow(QMainWindow):
         # Summary removed
         if seed is not None:
             prompt_state.seed = seed
-        
-        # Add to history
-        self.history_manager.add_entry(prompt_state)
-        
-        # Update navigation controls - but skip during generation to prevent infinite loops
-        if not getattr(self, '_generating_prompt', False):
-            self._update_history_navigation()
-        elif self.debug_enabled:
-            debug(r"Skipping navigation update during generation", LogArea.BATCH)
+        return prompt_state
     
     def _schedule_preview_update(self):
         """Schedule a debounced preview update (Qt best practice to prevent signal cascading)."""
         # PREVENT INFINITE RECURSION: Skip if we're currently restoring state
-        if hasattr(self, '_restoring_state') and self._restoring_state:
+        if self._restoring_state:
             if self.debug_enabled:
                 debug(r"Skipping preview update during state restoration", LogArea.NAVIGATION)
             return
         
         # Additional protection: Skip if we're in the middle of template loading
-        if hasattr(self, '_loading_template') and self._loading_template:
+        if self._loading_template:
             if self.debug_enabled:
                 debug(r"Skipping preview update during template loading", LogArea.NAVIGATION)
             return
         
         # Suppression window after template load
-        if hasattr(self, '_suppress_preview_updates') and self._suppress_preview_updates:
+        if self._suppress_preview_updates:
             if self.debug_enabled:
                 debug(r"Skipping preview update during suppression window", LogArea.NAVIGATION)
             return
@@ -3236,10 +3905,10 @@ class MainWindow(QMainWindow):
             stack = ''.join(traceback.format_stack(limit=8))
             error(r"Preview scheduler call flood detected; temporarily suppressing updates\n{stack}", LogArea.NAVIGATION)
             self._suppress_preview_updates = True
-            QTimer.singleShot(500, lambda: setattr(self, '_suppress_preview_updates', False))
+            QTimer.singleShot(500, self._end_preview_suppression)
             return
 
-        if hasattr(self, '_preview_update_timer'):
+        if self._preview_update_timer is not None:
             if self.debug_enabled:
                 try:
                     sender_obj = self.sender()
@@ -3261,35 +3930,25 @@ class MainWindow(QMainWindow):
             info(r"DEBUG NAV: Capturing current state as PromptState", LogArea.GENERAL)
         
         # Collect field values and tags
-        field_values = {}
-        field_tags = {}
-        
-        for field_key, widget in self.field_widgets.items():
-            if hasattr(widget, 'get_value'):
-                field_values[field_key] = widget.get_value()
-            elif hasattr(widget, 'toPlainText'):
-                field_values[field_key] = widget.toPlainText()
-            
-            if hasattr(widget, 'get_tags'):
-                field_tags[field_key] = widget.get_tags()
+        field_values = {field_key: getter() for field_key, getter in self._field_value_getters.items()}
+        field_tags = {field_key: getter() for field_key, getter in self._field_tag_getters.items()}
+        field_tag_dicts = {field_key: getter() for field_key, getter in self._field_tag_dict_getters.items()}
         
         # Get current metadata
-        seed = self.seed_widget.get_value() if hasattr(self, 'seed_widget') else 0
+        seed = self.seed_widget.get_value()
         filters = self._get_selected_filters()
-        llm_model = self.llm_widget.get_value() if hasattr(self, 'llm_widget') else ""
+        llm_model = self.llm_widget.get_value()
         target_model = "seedream"  # Default target model
         
         # Get current generated content
-        summary_text = ""
-        final_prompt = ""
-        if hasattr(self, 'preview_panel'):
-            summary_text = ""  # Summary removed
-            final_prompt = self.preview_panel.get_final_prompt()
+        summary_text = ""  # Summary removed
+        final_prompt = self.preview_panel.get_final_prompt()
         
         # Create PromptState
         prompt_state = PromptState(
             field_values=field_values,
             field_tags=field_tags,
+            field_tag_dicts=field_tag_dicts,
             seed=seed,
             filters=filters,
             llm_model=llm_model,
@@ -3319,45 +3978,44 @@ class MainWindow(QMainWindow):
         self.setUpdatesEnabled(False)
         
         # Block ALL field widget signals during restoration
-        self._block_all_field_signals()
+        field_blockers = self._block_field_signals()
         
         try:
             # Restore field values and tags
-            for field_key, widget in self.field_widgets.items():
-                if field_key in prompt_state.field_values:
-                    value = prompt_state.field_values[field_key]
-                    if hasattr(widget, 'set_value'):
-                        widget.set_value(value)
-                    elif hasattr(widget, 'setPlainText'):
-                        widget.setPlainText(value)
-                
-                if field_key in prompt_state.field_tags:
-                    tags = prompt_state.field_tags[field_key]
-                    if hasattr(widget, 'set_tags'):
-                        widget.set_tags(tags)
+            field_values = prompt_state.field_values
+            field_tags = prompt_state.field_tags
+            tag_setters = self._field_tag_setters
+            tag_getters = self._field_tag_getters
+            for field_key, set_value in self._field_value_setters.items():
+                # Saved tags fully determine a tag field, so the plain-text
+                # set_value (which rebuilds user-text tags one by one) is skipped
+                set_tags = tag_setters.get(field_key) if field_key in field_tags else None
+                if set_tags is not None:
+                    tags = field_tags[field_key]
+                    if tags or tag_getters[field_key]():
+                        set_tags(tags)
+                elif field_key in field_values:
+                    set_value(field_values[field_key])
             
             # Restore metadata
-            if hasattr(self, 'seed_widget'):
-                self.seed_widget.set_value(prompt_state.seed)
+            self.seed_widget.set_value(prompt_state.seed)
             
             # Restore filters
             self._set_selected_filters(prompt_state.filters)
             
             # Restore LLM model
-            if hasattr(self, 'llm_widget'):
-                self.llm_widget.set_value(prompt_state.llm_model)
+            self.llm_widget.set_value(prompt_state.llm_model)
             
             # Restore generated content only if requested
-            if restore_final_prompt and hasattr(self, 'preview_panel'):
-                if prompt_state.final_prompt:
-                    self.preview_panel.set_final_prompt(prompt_state.final_prompt)
+            if restore_final_prompt and prompt_state.final_prompt:
+                self.preview_panel.set_final_prompt(prompt_state.final_prompt)
             
             if self.debug_enabled:
                 debug(r"Restored PromptState with {len(prompt_state.field_values)} fields", LogArea.NAVIGATION)
                 
         finally:
             # Unblock signals
-            self._unblock_all_field_signals()
+            field_blockers.close()
             
             # Clear flag immediately (no timer needed)
             self._restoring_state = False
@@ -3369,64 +4027,24 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
-    def _get_ollama_process_info(self):
-        """Get detailed information about Ollama processes for debugging."""
+    def _get_ollama_process_info(self, check_running: bool = False):
+        """Log detailed information about Ollama processes for debugging.
+        
+        The process listing (tasklist/wmic) runs on the thread pool. With check_running,
+        the probe also reports whether Ollama is running to _on_ollama_probe_finished.
+        """
         info("=== Ollama Process Information ===", LogArea.OLLAMA)
         
         # Check our tracked process
-        if self._ollama_process:
-            info(f"Tracked process PID: {self._ollama_process.pid}", LogArea.OLLAMA)
-            info(f"Tracked process returncode: {self._ollama_process.returncode}", LogArea.OLLAMA)
-            info(f"Tracked process still running: {self._ollama_process.returncode is None}", LogArea.OLLAMA)
+        if self._ollama_spawned:
+            info("Ollama was started by this application", LogArea.OLLAMA)
         else:
             info("No tracked Ollama process", LogArea.OLLAMA)
         
-        # Check all ollama.exe processes
-        try:
-            result = subprocess.run(
-                'tasklist //FI "IMAGENAME eq ollama.exe" //FO CSV',
-                capture_output=True, text=True, shell=True
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 1:  # Skip header
-                    info(f"Found {len(lines)-1} ollama.exe processes:", LogArea.OLLAMA)
-                    for line in lines[1:]:  # Skip header
-                        if line.strip():
-                            info(f"  {line.strip()}", LogArea.OLLAMA)
-                else:
-                    info("No ollama.exe processes found via tasklist", LogArea.OLLAMA)
-            else:
-                info(f"tasklist failed: {result.stderr}", LogArea.OLLAMA)
-        except Exception as e:
-            info(f"Error checking tasklist: {e}", LogArea.OLLAMA)
-        
-        # Check parent-child relationships using wmic
-        try:
-            result = subprocess.run(
-                'wmic process where name="ollama.exe" get ProcessId,ParentProcessId,CommandLine /format:csv',
-                capture_output=True, text=True, shell=True
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 1:  # Skip header
-                    info("Ollama process hierarchy:", LogArea.OLLAMA)
-                    for line in lines[1:]:  # Skip header
-                        if line.strip() and 'ollama.exe' in line:
-                            parts = line.split(',')
-                            if len(parts) >= 3:
-                                pid = parts[1].strip()
-                                parent_pid = parts[2].strip()
-                                cmdline = parts[3].strip() if len(parts) > 3 else "N/A"
-                                info(f"  PID: {pid}, Parent: {parent_pid}, Cmd: {cmdline}", LogArea.OLLAMA)
-                else:
-                    info("No ollama.exe processes found via wmic", LogArea.OLLAMA)
-            else:
-                info(f"wmic failed: {result.stderr}", LogArea.OLLAMA)
-        except Exception as e:
-            info(f"Error checking wmic: {e}", LogArea.OLLAMA)
-        
-        info("=== End Ollama Process Information ===", LogArea.OLLAMA)
+        task = _OllamaProbeTask(check_running=check_running)
+        if check_running:
+            task.signals.running_checked.connect(self._on_ollama_probe_finished)
+        QThreadPool.globalInstance().start(task)
 
     def _realize_summary(self):
         """Handle realize button click - update summary with realized values using current seed."""
@@ -3435,49 +4053,30 @@ class MainWindow(QMainWindow):
             current_seed = self._get_current_seed()
             
             # Create PromptData object with current seed (realized values)
-            prompt_data = PromptData(
-                style=self.style_widget.get_randomized_value(current_seed) if hasattr(self, 'style_widget') else "",
-                setting=self.setting_widget.get_randomized_value(current_seed) if hasattr(self, 'setting_widget') else "",
-                weather=self.weather_widget.get_randomized_value(current_seed) if hasattr(self, 'weather_widget') else "",
-                date_time=self.datetime_widget.get_randomized_value(current_seed) if hasattr(self, 'datetime_widget') else "",
-                subjects=self.subjects_widget.get_randomized_value(current_seed) if hasattr(self, 'subjects_widget') else "",
-                pose_action=self.pose_widget.get_randomized_value(current_seed) if hasattr(self, 'pose_widget') else "",
-                camera=self.camera_widget.get_randomized_value(current_seed) if hasattr(self, 'camera_widget') else "",
-                framing_action=self.framing_widget.get_randomized_value(current_seed) if hasattr(self, 'framing_widget') else "",
-                grading=self.grading_widget.get_randomized_value(current_seed) if hasattr(self, 'grading_widget') else "",
-                details=self.details_widget.get_randomized_value(current_seed) if hasattr(self, 'details_widget') else "",
-                llm_instructions=""
-            )
+            prompt_data = PromptData(**self._randomized_field_values(current_seed), llm_instructions="")
             
             # Generate the raw prompt preview using the realized values
             raw_preview = self._get_prompt_engine().get_prompt_preview(prompt_data)
             
             # Update the summary text
             self.preview_panel.set_summary_text(raw_preview)
+            # The summary no longer shows the raw preview, so the next update must redraw it
+            self._last_preview_key = None
             
             debug(f"PROMPT: Previewed summary with seed {current_seed}", LogArea.PROMPT)
             
         except Exception as e:
             error(f"Failed to preview summary: {e}", LogArea.GENERAL)
-            QMessageBox.warning(self, "Error", f"Failed to preview summary: {str(e)}")
+            self._maybe_show_message(QMessageBox.warning, "Error", f"Failed to preview summary: {str(e)}")
     
     def _get_current_prompt_data(self):
         """Get current prompt data from all fields without randomization."""
-        return PromptData(
-            style=self.style_widget.get_value() if hasattr(self, 'style_widget') else "",
-            setting=self.setting_widget.get_value() if hasattr(self, 'setting_widget') else "",
-            weather=self.weather_widget.get_value() if hasattr(self, 'weather_widget') else "",
-            date_time=self.datetime_widget.get_value() if hasattr(self, 'datetime_widget') else "",
-            subjects=self.subjects_widget.get_value() if hasattr(self, 'subjects_widget') else "",
-            pose_action=self.pose_widget.get_value() if hasattr(self, 'pose_widget') else "",
-            camera=self.camera_widget.get_value() if hasattr(self, 'camera_widget') else "",
-            framing_action=self.framing_widget.get_value() if hasattr(self, 'framing_widget') else "",
-            grading=self.grading_widget.get_value() if hasattr(self, 'grading_widget') else "",
-            details=self.details_widget.get_value() if hasattr(self, 'details_widget') else "",
-            llm_instructions=""
-        )
+        if not self._widgets_ready:
+            return PromptData()
+        return PromptData(**{key: widget.get_value() for key, _, widget in self._prompt_field_widgets},
+                          llm_instructions="")
     
     def _get_current_seed(self):
         """Get the current seed value."""
-        return self.seed_widget.get_value() if hasattr(self, 'seed_widget') else 0
+        return self.seed_widget.get_value() if self._widgets_ready else 0
 
@@ -232,24 +232,37 @@ class PreviewPanel(QWidget):
     
     def set_summary_text(self, text: str):
         """Set the summary text in the Prompt Summary tab."""
-        self.summary_text.setPlainText(text)
-        if text.strip():
-            self.summary_state = PreviewState.PREVIEW
-        else:
-            self.summary_state = PreviewState.PLACEHOLDER
-        self._apply_styling()
+        self._set_text_if_changed(self.summary_text, text)
+        self._set_summary_state(PreviewState.PREVIEW if text.strip() else PreviewState.PLACEHOLDER)
     
     def set_final_prompt(self, text: str):
         """Set the final prompt text in the Final Prompt tab."""
-        self.final_text.setPlainText(text)
+        self._set_text_if_changed(self.final_text, text)
         # Check if this is an error message
         if text.strip().startswith("[ERROR:"):
-            self.final_state = PreviewState.ERROR
+            self._set_final_state(PreviewState.ERROR)
         elif text.strip():
-            self.final_state = PreviewState.FINAL
+            self._set_final_state(PreviewState.FINAL)
         else:
-            self.final_state = PreviewState.PLACEHOLDER
-        self._apply_styling()
+            self._set_final_state(PreviewState.PLACEHOLDER)
+    
+    @staticmethod
+    def _set_text_if_changed(text_edit: QTextEdit, text: str):
+        """Replace the document only when the text differs (setPlainText resets layout and scroll)."""
+        if text_edit.toPlainText() != text:
+            text_edit.setPlainText(text)
+    
+    def _set_summary_state(self, state: PreviewState):
+        """Update the summary state, restyling only when it changes."""
+        if state != self.summary_state:
+            self.summary_state = state
+            self._apply_styling()
+    
+    def _set_final_state(self, state: PreviewState):
+        """Update the final prompt state, restyling only when it changes."""
+        if state != self.final_state:
+            self.final_state = state
+            self._apply_styling()
     
     def update_preview(self, text: str):
         """Update the preview text (legacy method - now updates summary)."""
@@ -258,11 +271,10 @@ class PreviewPanel(QWidget):
     def set_history_state(self, is_history: bool, total_count: int):
         """Set the history state for the preview panel."""
         if is_history:
-            self.final_state = PreviewState.HISTORY
+            self._set_final_state(PreviewState.HISTORY)
         else:
             # For current state (0/X), always use PLACEHOLDER state
-            self.final_state = PreviewState.PLACEHOLDER
-        self._apply_styling()
+            self._set_final_state(PreviewState.PLACEHOLDER)
     
     def update_navigation_controls(self, current_pos: int, total_count: int, can_go_back: bool, can_go_forward: bool):
         """Update navigation controls state."""
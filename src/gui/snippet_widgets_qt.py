@@ -519,7 +519,7 @@ class LLMSelectionWidget(QWidget):
         from PySide6.QtCore import QTimer
         from ..utils.logger import info, debug, LogArea
         
-        connection_start = time.time()
+        connection_start = time.perf_counter()
         
         # Show loading state immediately
         self.llm_combo.hide()
@@ -562,7 +562,7 @@ class LLMSelectionWidget(QWidget):
         thread = threading.Thread(target=check_ollama_async, daemon=True)
         thread.start()
         
-        connection_time = time.time() - connection_start
+        connection_time = time.perf_counter() - connection_start
         info(f"STARTUP: Ollama connection check initiated in {connection_time:.3f}s (async)", LogArea.GENERAL)
     
     def _update_ui_with_models(self, available_models):
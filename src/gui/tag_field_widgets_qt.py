@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, QSize
 from PySide6.QtGui import QFont, QColor, QIcon
 from pathlib import Path
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Dict, Any
 
 # Try to import qtawesome, fallback to text if not available
 try:
@@ -31,8 +31,9 @@ class TagFieldWidget(QWidget):
     # Signal emitted when field value changes
     value_changed = Signal()
     
-    def __init__(self, label: str, placeholder: str = "", change_callback: Optional[Callable] = None):
-        super().__init__()
+    def __init__(self, label: str, placeholder: str = "", change_callback: Optional[Callable] = None,
+                 parent: Optional[QWidget] = None):
+        super().__init__(parent)
         
         self.label_text = label
         self.placeholder = placeholder
@@ -73,6 +74,7 @@ class TagFieldWidget(QWidget):
         
         # Create snippet button with icon only
         self.snippet_button = QPushButton()
+        self.snippet_button.setProperty("themedButton", True)  # Picks up the main window button style
         if FONTAWESOME_AVAILABLE:
             self.snippet_button.setIcon(qta.icon('fa5s.list', color='white'))
         self.snippet_button.setFixedSize(35, 35)  # Same size as other action buttons
@@ -275,6 +277,10 @@ class TagFieldWidget(QWidget):
         """Get all current tags."""
         return self.tag_input.get_tags()
     
+    def get_tag_dicts(self) -> List[Dict[str, Any]]:
+        """Get all current tags in serialized form (cached by the tag input)."""
+        return self.tag_input.get_tag_dicts()
+    
     def set_tags(self, tags: List[Tag]):
         """Set tags (for template loading)."""
         self.tag_input.set_tags(tags)
@@ -360,8 +366,9 @@ class TagTextFieldWidget(TagFieldWidget):
 class TagTextAreaWidget(TagFieldWidget):
     """Multi-line tag field widget (replaces TextAreaWidget)."""
     
-    def __init__(self, label: str, placeholder: str = "", change_callback: Optional[Callable] = None):
-        super().__init__(label, placeholder, change_callback)
+    def __init__(self, label: str, placeholder: str = "", change_callback: Optional[Callable] = None,
+                 parent: Optional[QWidget] = None):
+        super().__init__(label, placeholder, change_callback, parent)
         
         # After parent initialization, set minimum height for text area appearance
         if hasattr(self, 'tag_input'):
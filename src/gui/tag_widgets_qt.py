@@ -24,6 +24,10 @@ class TagType(Enum):
     MISSING = "missing"          # Red - missing category/subcategory
 
 
+# TagType by serialized value, for bulk tag loading
+_TAG_TYPES_BY_VALUE = {tag_type.value: tag_type for tag_type in TagType}
+
+
 class Tag:
     """Data model for a tag."""
     
@@ -86,12 +90,10 @@ class Tag:
                     main_window = widget
                     break
             
-            # Get currently selected filters
+            # Get currently selected filters (cached on the main window)
             selected_filters = []
-            if main_window and hasattr(main_window, 'filter_actions'):
-                for filter_name, action in main_window.filter_actions.items():
-                    if action.isChecked():
-                        selected_filters.append(filter_name)
+            if main_window and hasattr(main_window, '_get_selected_filters'):
+                selected_filters = main_window._get_selected_filters()
             
             # If no filters are selected, ALL tags should be missing (red)
             if not selected_filters:
@@ -146,10 +148,10 @@ class Tag:
                                 print(f"DEBUG TAG: Subcategory '{self.text}' is VALID in filter '{filter_name}'")
                             return False
                         # Also check with case-insensitive matching
-                        for category_name in snippet_manager.get_snippets_for_field(field_name, [filter_name]) or {}:
+                        field_snippets = snippet_manager.get_snippets_for_field(field_name, [filter_name]) or {}
+                        for category_name, category_data in field_snippets.items():
                             if category_name.lower() == self.category_path[0].lower():
                                 # Check if subcategory exists in this category
-                                category_data = snippet_manager.get_snippets_for_field(field_name, [filter_name]).get(category_name, {})
                                 if isinstance(category_data, dict):
                                     for subcategory_name in category_data.keys():
                                         if subcategory_name.lower() == self.category_path[1].lower():
@@ -246,6 +248,29 @@ class Tag:
             from ..utils.logger import error, LogArea
             error(f"Failed to create Tag from dict {data}: {str(e)}", LogArea.ERROR)
             raise
+    
+    @classmethod
+    def from_dicts(cls, data_list: List[Dict]) -> List['Tag']:
+        """Create tags from a list of dictionaries, skipping (and logging) invalid entries."""
+        tags = []
+        append = tags.append
+        tag_types = _TAG_TYPES_BY_VALUE
+        for data in data_list:
+            try:
+                append(cls(
+                    text=data["text"],
+                    tag_type=tag_types[data["type"]],
+                    category_path=data.get("category_path", []),
+                    data=data.get("data"),
+                    is_missing=data.get("is_missing", False)
+                ))
+            except Exception:
+                # Take the validating path so the failure is reported properly
+                try:
+                    append(cls.from_dict(data))
+                except Exception:
+                    continue
+        return tags
 
 
 class TagWidget(QWidget):
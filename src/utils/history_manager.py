@@ -31,6 +31,25 @@ class HistoryManager:
         # Reset current index to current state (not in history)
         self.current_index = -1
     
+    def save_batch(self, prompt_states: List[PromptState]) -> None:
+        """Add several entries at once, trimming and resetting navigation only once.
+        
+        Entries are added in list order, so the last one ends up as the most recent.
+        """
+        if not prompt_states:
+            return
+        
+        # Copy to avoid reference issues, newest first
+        new_entries = [state.copy() for state in reversed(prompt_states)]
+        self.entries[:0] = new_entries
+        
+        # Limit to max entries
+        if len(self.entries) > self.max_entries:
+            self.entries = self.entries[:self.max_entries]
+        
+        # Reset current index to current state (not in history)
+        self.current_index = -1
+    
     def add_entry_from_components(self, field_values: Dict[str, Any], field_tags: Dict[str, List[Any]], 
                                   seed: int, filters: List[str], llm_model: str, target_model: str, 
                                   final_prompt: str = "", summary_text: str = "") -> None:
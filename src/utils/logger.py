@@ -6,7 +6,7 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Union
 from enum import Enum
 from ..utils.theme_manager import theme_manager
 
@@ -170,22 +170,33 @@ def get_logger() -> Optional[FlipFlopLogger]:
 
 
 # Global helper functions for easy logging
-def debug(message: str, area: LogArea = LogArea.GENERAL):
-    """Log a debug message."""
-    if flipflop_logger:
-        flipflop_logger.log_debug(f"[{area.value}] {message}")
+def _format(message: Union[str, Callable[[], str]], area: LogArea) -> str:
+    """Build the final log line, evaluating a lazy message callable."""
+    if callable(message):
+        message = message()
+    return f"[{area.value}] {message}"
+
+
+def debug(message: Union[str, Callable[[], str]], area: LogArea = LogArea.GENERAL):
+    """Log a debug message.
 
+    ``message`` may be a zero-argument callable; it is only invoked when debug
+    logging is enabled, so expensive messages cost nothing otherwise.
+    """
+    if flipflop_logger and flipflop_logger.debug_enabled:
+        flipflop_logger.log_debug(_format(message, area))
 
-def info(message: str, area: LogArea = LogArea.GENERAL):
+
+def info(message: Union[str, Callable[[], str]], area: LogArea = LogArea.GENERAL):
     """Log an info message."""
-    if flipflop_logger:
-        flipflop_logger.log_info(f"[{area.value}] {message}")
+    if flipflop_logger and flipflop_logger.debug_enabled:
+        flipflop_logger.log_info(_format(message, area))
 
 
-def warning(message: str, area: LogArea = LogArea.GENERAL):
+def warning(message: Union[str, Callable[[], str]], area: LogArea = LogArea.GENERAL):
     """Log a warning message."""
-    if flipflop_logger:
-        flipflop_logger.log_warning(f"[{area.value}] {message}")
+    if flipflop_logger and flipflop_logger.debug_enabled:
+        flipflop_logger.log_warning(_format(message, area))
 
 
 def error(message: str, area: LogArea = LogArea.ERROR):
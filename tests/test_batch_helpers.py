@@ -0,0 +1,78 @@
+"""
+Unit tests for the batch generation helpers.
+"""
+
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.gui.main_window_qt import _batch_seeds, _batch_worker_limit, _DEFAULT_BATCH_WORKERS
+
+
+class TestBatchSeeds(unittest.TestCase):
+    """Test cases for _batch_seeds."""
+    
+    def test_fixed(self):
+        """Test that fixed mode repeats the base seed."""
+        self.assertEqual(_batch_seeds("fixed", 42, 3), [42, 42, 42])
+    
+    def test_increment(self):
+        """Test that increment mode counts up from the base seed."""
+        self.assertEqual(_batch_seeds("increment", 42, 3), [42, 43, 44])
+    
+    def test_unknown_mode_increments(self):
+        """Test that an unknown mode behaves like increment."""
+        self.assertEqual(_batch_seeds("bogus", 7, 2), [7, 8])
+    
+    def test_decrement_clamps_to_zero(self):
+        """Test that decrement mode counts down and never goes below 0."""
+        self.assertEqual(_batch_seeds("decrement", 2, 4), [2, 1, 0, 0])
+    
+    def test_randomize_is_reproducible(self):
+        """Test that randomize mode gives in-range seeds that depend only on the base seed."""
+        seeds = _batch_seeds("randomize", 42, 5)
+        
+        self.assertEqual(len(seeds), 5)
+        self.assertTrue(all(0 <= seed <= 999999 for seed in seeds))
+        self.assertEqual(seeds, _batch_seeds("randomize", 42, 5))
+        self.assertEqual(seeds[:3], _batch_seeds("randomize", 42, 3))
+    
+    def test_empty_batch(self):
+        """Test that a batch size of 0 gives no seeds."""
+        self.assertEqual(_batch_seeds("randomize", 42, 0), [])
+
+
+class TestBatchWorkerLimit(unittest.TestCase):
+    """Test cases for _batch_worker_limit."""
+    
+    def _limit(self, value=None):
+        environ = {} if value is None else {"OLLAMA_NUM_PARALLEL": value}
+        with patch.dict(os.environ, environ, clear=True):
+            return _batch_worker_limit()
+    
+    def test_default_when_unset(self):
+        """Test that the default is used when OLLAMA_NUM_PARALLEL is not set."""
+        self.assertEqual(_DEFAULT_BATCH_WORKERS, 3)
+        self.assertEqual(self._limit(), 3)
+    
+    def test_reads_environment(self):
+        """Test that a positive OLLAMA_NUM_PARALLEL sets the limit."""
+        self.assertEqual(self._limit("8"), 8)
+    
+    def test_non_positive_falls_back(self):
+        """Test that 0 or a negative value falls back to the default."""
+        self.assertEqual(self._limit("0"), 3)
+        self.assertEqual(self._limit("-2"), 3)
+    
+    def test_invalid_falls_back(self):
+        """Test that a non-integer value falls back to the default."""
+        self.assertEqual(self._limit("four"), 3)
+        self.assertEqual(self._limit(""), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
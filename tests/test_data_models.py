@@ -0,0 +1,71 @@
+"""
+Unit tests for the data models.
+"""
+
+import unittest
+
+# Add src to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.core.data_models import PromptState
+from src.gui.tag_widgets_qt import Tag, TagType
+
+
+class TestPromptStateTags(unittest.TestCase):
+    """Test cases for PromptState tag serialization."""
+    
+    def setUp(self):
+        self.tags = [
+            Tag("a cat", TagType.USER_TEXT),
+            Tag("Animals", TagType.CATEGORY, ["Animals"]),
+        ]
+    
+    def test_round_trip_with_field_tag_dicts(self):
+        """Test that pre-serialized tags survive a to_dict/from_dict round trip."""
+        state = PromptState(
+            field_values={"subjects": "a cat, Animals"},
+            field_tags={"subjects": self.tags},
+            field_tag_dicts={"subjects": [tag.to_dict() for tag in self.tags]},
+        )
+        
+        restored = PromptState.from_dict(state.to_dict())
+        
+        self.assertEqual(restored.field_values, state.field_values)
+        self.assertEqual(restored.get_field_tags("subjects"), self.tags)
+        self.assertEqual(restored.field_tag_dicts, {})
+    
+    def test_set_field_tags_replaces_cached_dicts(self):
+        """Test that set_field_tags drops the stale pre-serialized tags for that field."""
+        state = PromptState(
+            field_tags={"subjects": self.tags},
+            field_tag_dicts={"subjects": [tag.to_dict() for tag in self.tags]},
+        )
+        new_tags = [Tag("a dog", TagType.USER_TEXT)]
+        
+        state.set_field_tags("subjects", new_tags)
+        
+        self.assertNotIn("subjects", state.field_tag_dicts)
+        self.assertEqual(state.to_dict()["field_tags"]["subjects"], [new_tags[0].to_dict()])
+
+    def test_deserialize_tags_fast_path_matches_from_dict(self):
+        """Test that a field of serialized tags deserializes like per-item Tag.from_dict."""
+        tag_dicts = [tag.to_dict() for tag in self.tags]
+        
+        field_tags = PromptState._deserialize_tags({"subjects": tag_dicts})
+        
+        self.assertEqual(field_tags["subjects"], [Tag.from_dict(tag_data) for tag_data in tag_dicts])
+    
+    def test_deserialize_tags_falls_back_for_mixed_entries(self):
+        """Test that an entry without 'type' takes the per-item path and is kept as-is."""
+        legacy = {"text": "legacy", "tag_type": "user_text"}
+        tag_dicts = [self.tags[0].to_dict(), legacy, self.tags[1].to_dict()]
+        
+        field_tags = PromptState._deserialize_tags({"subjects": tag_dicts})
+        
+        self.assertEqual(field_tags["subjects"], [self.tags[0], legacy, self.tags[1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for the history manager.
+"""
+
+import unittest
+
+# Add src to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.core.data_models import PromptState
+from src.utils.history_manager import HistoryManager
+
+
+class TestSaveBatch(unittest.TestCase):
+    """Test cases for HistoryManager.save_batch."""
+    
+    def _states(self, *prompts):
+        return [PromptState(final_prompt=prompt) for prompt in prompts]
+    
+    def _prompts(self, manager):
+        return [entry.final_prompt for entry in manager.entries]
+    
+    def test_last_state_becomes_newest(self):
+        """Test that the batch matches adding each state in turn."""
+        manager = HistoryManager()
+        manager.add_entry(PromptState(final_prompt="old"))
+        
+        manager.save_batch(self._states("a", "b", "c"))
+        
+        self.assertEqual(self._prompts(manager), ["c", "b", "a", "old"])
+    
+    def test_entries_are_copies(self):
+        """Test that stored entries are copies of the given states."""
+        manager = HistoryManager()
+        states = self._states("a")
+        
+        manager.save_batch(states)
+        states[0].final_prompt = "changed"
+        
+        self.assertEqual(self._prompts(manager), ["a"])
+    
+    def test_trims_to_max_entries(self):
+        """Test that the oldest entries are dropped beyond max_entries."""
+        manager = HistoryManager(max_entries=3)
+        manager.add_entry(PromptState(final_prompt="old"))
+        
+        manager.save_batch(self._states("a", "b", "c", "d"))
+        
+        self.assertEqual(self._prompts(manager), ["d", "c", "b"])
+    
+    def test_resets_current_index(self):
+        """Test that navigation returns to the current state after a batch."""
+        manager = HistoryManager()
+        manager.save_batch(self._states("a", "b"))
+        manager.current_index = 1
+        
+        manager.save_batch(self._states("c"))
+        
+        self.assertEqual(manager.current_index, -1)
+    
+    def test_empty_batch_is_a_no_op(self):
+        """Test that an empty batch leaves history and navigation untouched."""
+        manager = HistoryManager()
+        manager.save_batch(self._states("a"))
+        manager.current_index = 0
+        
+        manager.save_batch([])
+        
+        self.assertEqual(self._prompts(manager), ["a"])
+        self.assertEqual(manager.current_index, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Unit tests for the background JSON writer.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PySide6.QtCore import QThreadPool
+
+from src.gui.main_window_qt import _JsonSaveTask
+
+
+class TestJsonSaveDiscard(unittest.TestCase):
+    """Test cases for _JsonSaveTask.discard."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "generation_times.json")
+        with open(self.path, 'wb') as f:
+            f.write(b'{"old": 1}')
+    
+    def tearDown(self):
+        QThreadPool.globalInstance().waitForDone()
+        self.temp_dir.cleanup()
+    
+    def test_queued_save_does_not_restore_discarded_file(self):
+        """Test that a save queued before a clear is dropped once the pool runs it."""
+        task = _JsonSaveTask(self.path, b'{"old": 2}')
+        
+        _JsonSaveTask.discard(self.path)
+        QThreadPool.globalInstance().start(task)
+        QThreadPool.globalInstance().waitForDone()
+        
+        self.assertFalse(os.path.exists(self.path))
+    
+    def test_save_waiting_on_writer_does_not_restore_discarded_file(self):
+        """Test a save already on the pool and blocked behind another write when the clear happens."""
+        _JsonSaveTask._write_mutex.lock()
+        try:
+            QThreadPool.globalInstance().start(_JsonSaveTask(self.path, b'{"old": 2}'))
+            clear = threading.Thread(target=_JsonSaveTask.discard, args=(self.path,))
+            clear.start()
+        finally:
+            _JsonSaveTask._write_mutex.unlock()
+        clear.join()
+        QThreadPool.globalInstance().waitForDone()
+        
+        self.assertFalse(os.path.exists(self.path))
+    
+    def test_save_after_discard_is_written(self):
+        """Test that saves submitted after a clear still reach the disk."""
+        _JsonSaveTask.discard(self.path)
+        QThreadPool.globalInstance().start(_JsonSaveTask(self.path, b'{"new": 1}'))
+        QThreadPool.globalInstance().waitForDone()
+        
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b'{"new": 1}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Unit tests for the logging helpers.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+# Add src to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils import logger
+from src.utils.logger import FlipFlopLogger, LogArea
+
+
+class TestLazyMessages(unittest.TestCase):
+    """Test cases for callable messages passed to debug/info/warning."""
+    
+    def _logger(self, debug_enabled):
+        # Built disabled so no log file is created, then switched over with a mock backend
+        flipflop_logger = FlipFlopLogger(False)
+        flipflop_logger.debug_enabled = debug_enabled
+        flipflop_logger.logger = Mock()
+        return flipflop_logger
+    
+    def test_callable_not_invoked_when_disabled(self):
+        """Test that a lazy message is never built when debug logging is off."""
+        flipflop_logger = self._logger(False)
+        for log in (logger.debug, logger.info, logger.warning):
+            message = Mock(return_value="expensive")
+            with patch.object(logger, 'flipflop_logger', flipflop_logger):
+                log(message, LogArea.GENERAL)
+            message.assert_not_called()
+    
+    def test_callable_not_invoked_without_logger(self):
+        """Test that a lazy message is never built before the logger is initialized."""
+        message = Mock(return_value="expensive")
+        with patch.object(logger, 'flipflop_logger', None):
+            logger.debug(message)
+        message.assert_not_called()
+    
+    def test_callable_invoked_once_when_enabled(self):
+        """Test that a lazy message is built exactly once and logged like a string."""
+        flipflop_logger = self._logger(True)
+        backends = (flipflop_logger.logger.debug, flipflop_logger.logger.info, flipflop_logger.logger.warning)
+        for log, backend in zip((logger.debug, logger.info, logger.warning), backends):
+            message = Mock(return_value="built")
+            with patch.object(logger, 'flipflop_logger', flipflop_logger):
+                log(message, LogArea.BATCH)
+            message.assert_called_once_with()
+            backend.assert_called_once_with(f"[{LogArea.BATCH.value}] built")
+    
+    def test_string_message_unchanged(self):
+        """Test that plain string messages are still logged as before."""
+        flipflop_logger = self._logger(True)
+        with patch.object(logger, 'flipflop_logger', flipflop_logger):
+            logger.debug("plain", LogArea.GENERAL)
+        flipflop_logger.logger.debug.assert_called_once_with(f"[{LogArea.GENERAL.value}] plain")
+
+
+if __name__ == '__main__':
+    unittest.main()
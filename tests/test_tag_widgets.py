@@ -0,0 +1,56 @@
+"""
+Unit tests for the tag model.
+"""
+
+import unittest
+
+# Add src to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.gui.tag_widgets_qt import Tag, TagType
+
+
+class TestTagFromDicts(unittest.TestCase):
+    """Test cases for Tag.from_dicts."""
+    
+    def setUp(self):
+        self.tag_dicts = [
+            {"text": "a cat", "type": "user_text", "category_path": []},
+            {"text": "oil painting", "type": "snippet", "category_path": ["Art", "Painting"]},
+            {"text": "Animals", "type": "category", "category_path": ["Animals"]},
+            {"text": "Pets", "type": "subcategory", "category_path": ["Animals", "Pets"], "is_missing": True},
+            {"text": "Brief", "type": "custom", "category_path": [], "data": "Be brief."},
+        ]
+    
+    def test_matches_from_dict(self):
+        """Test that bulk loading builds the same tags as per-item from_dict."""
+        bulk = Tag.from_dicts(self.tag_dicts)
+        single = [Tag.from_dict(tag_data) for tag_data in self.tag_dicts]
+        
+        self.assertEqual([tag.to_dict() for tag in bulk], [tag.to_dict() for tag in single])
+        self.assertEqual([tag.tag_type for tag in bulk],
+                         [TagType.USER_TEXT, TagType.SNIPPET, TagType.CATEGORY,
+                          TagType.SUBCATEGORY, TagType.CUSTOM])
+    
+    def test_defaults_match_from_dict(self):
+        """Test that optional keys default the same way as from_dict."""
+        tag_data = {"text": "a dog", "type": "user_text"}
+        
+        self.assertEqual(Tag.from_dicts([tag_data])[0].to_dict(), Tag.from_dict(tag_data).to_dict())
+    
+    def test_invalid_entries_are_skipped(self):
+        """Test that entries from_dict rejects are dropped and the rest still load."""
+        tag_data_list = [
+            {"text": "a cat", "type": "user_text"},
+            {"text": "bad", "type": "no_such_type"},
+            {"type": "user_text"},
+            {"text": "a dog", "type": "user_text"},
+        ]
+        
+        self.assertEqual([tag.text for tag in Tag.from_dicts(tag_data_list)], ["a cat", "a dog"])
+
+
+if __name__ == '__main__':
+    unittest.main()